@@ -0,0 +1,172 @@
+"""
+Benchmark du nettoyage : chargement complet vs nettoyage en flux, et
+nettoyage par partitions selon le nombre de processus.
+
+Le fichier brut est répliqué (noms de pays suffixés pour que les copies ne
+soient pas des doublons), puis chaque mode est lancé dans un processus neuf
+dont le pic de mémoire résidente (ru_maxrss) est relevé. Les deux fichiers
+produits sont comparés octet par octet.
+
+Le fichier répliqué est ensuite découpé en partitions (comme des fichiers
+par région), nettoyées avec 1, 2, 4... processus.
+
+Un petit fichier de cas limites (NAME et ANTIGEN blancs, années
+fractionnaires) est d'abord nettoyé dans les deux modes, en petits blocs,
+et les résultats comparés octet par octet.
+
+Usage:
+    python -m benchmarks.bench_clean
+    python -m benchmarks.bench_clean --scales 1 100 1000 --chunk-size 50000
+    python -m benchmarks.bench_clean --scales 500 --partitions 8 --workers 1 2 4 8
+"""
+
+import argparse
+import contextlib
+import filecmp
+import io
+import multiprocessing
+import resource
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+
+from config import RAW_DATA_DIR
+from src.utils.clean_data import clean_vaccination_data, clean_vaccination_data_streaming
+
+
+def write_scaled_raw(source: Path, target: Path, factor: int) -> int:
+    """
+    Écrit `factor` copies du fichier brut, chaque copie avec ses propres pays.
+
+    Returns:
+        Nombre de lignes écrites
+    """
+    raw = pd.read_csv(source)
+    with open(target, 'w', newline='', encoding='utf-8') as handle:
+        for copy in range(factor):
+            replica = raw.copy()
+            if copy:
+                replica['NAME'] = replica['NAME'] + f' #{copy}'
+            replica.to_csv(handle, index=False, header=copy == 0)
+    return len(raw) * factor
+
+
+def write_partitions(source: Path, directory: Path, partitions: int) -> List[Path]:
+    """Découpe un fichier brut en partitions contiguës de tailles égales."""
+    raw = pd.read_csv(source)
+    directory.mkdir()
+    size = -(-len(raw) // partitions)
+    paths = []
+    for index in range(partitions):
+        path = directory / f'partition-{index:03d}.csv'
+        raw.iloc[index * size:(index + 1) * size].to_csv(path, index=False)
+        paths.append(path)
+    return paths
+
+
+def write_edge_case_raw(source: Path, target: Path, rows: int = 400) -> None:
+    """
+    Écrit un extrait du fichier brut avec des cas limites du nettoyage.
+
+    NAME et ANTIGEN blancs (manquants après nettoyage, triés en dernier) et
+    années fractionnaires (tronquées avant le filtre des années).
+    """
+    raw = pd.read_csv(source, dtype=str).iloc[:rows].copy()
+    raw.loc[raw.index[[50, 250, 300]], 'NAME'] = '   '
+    raw.loc[raw.index[[120, 300]], 'ANTIGEN'] = ' '
+    raw.loc[raw.index[[10, 11, 12]], 'YEAR'] = ['2025.5', '1979.9', '2024.99']
+    raw.to_csv(target, index=False)
+
+
+def check_edge_cases(directory: Path, chunk_sizes: List[int]) -> bool:
+    """Nettoie le fichier de cas limites en mémoire et en flux, puis compare les fichiers."""
+    source = directory / 'raw-edge.csv'
+    write_edge_case_raw(RAW_DATA_DIR / 'rawdata.csv', source)
+    reference = directory / 'clean-edge.csv'
+    identical = True
+    with contextlib.redirect_stdout(io.StringIO()):
+        clean_vaccination_data(source, reference)
+        for chunk_size in chunk_sizes:
+            target = directory / f'clean-edge-{chunk_size}.csv'
+            clean_vaccination_data_streaming(source, target, chunk_size=chunk_size)
+            identical &= filecmp.cmp(reference, target, shallow=False)
+    return identical
+
+
+def _run(mode: str, source: Path, target: Path, chunk_size: int, results) -> None:
+    """Nettoie dans un processus neuf et renvoie durée et pic mémoire."""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if mode == 'stream':
+            clean_vaccination_data_streaming(source, target, chunk_size=chunk_size)
+        elif mode.startswith('workers='):
+            clean_vaccination_data(source, target, workers=int(mode.split('=')[1]))
+        else:
+            clean_vaccination_data(source, target)
+    results.put({
+        'seconds': time.perf_counter() - start,
+        'peak_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    })
+
+
+def measure(mode: str, source: Path, target: Path, chunk_size: int) -> Dict[str, float]:
+    """Lance un nettoyage dans un processus 'spawn' (pic mémoire non hérité)."""
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    process = context.Process(target=_run, args=(mode, source, target, chunk_size, results))
+    process.start()
+    result = results.get()
+    process.join()
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark du nettoyage : en mémoire vs en flux')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 100, 500])
+    parser.add_argument('--chunk-size', type=int, default=50_000)
+    parser.add_argument('--partitions', type=int, default=8)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        edge_identical = check_edge_cases(Path(directory), [37, 100])
+        print(f"\nCas limites (textes blancs, années fractionnaires), en flux : {'identique' if edge_identical else 'DIFFÉRENT'}")
+        print(f"\n{'Lignes':>10} | {'Mode':>8} | {'Durée (s)':>9} | {'Pic RSS (Mo)':>12} | {'Identique':>9}")
+        print("-" * 60)
+        for factor in args.scales:
+            source = Path(directory) / f'raw-x{factor}.csv'
+            rows = write_scaled_raw(RAW_DATA_DIR / 'rawdata.csv', source, factor)
+            outputs = {mode: Path(directory) / f'clean-{mode}-x{factor}.csv' for mode in ('mémoire', 'stream')}
+            usages = {mode: measure(mode, source, target, args.chunk_size) for mode, target in outputs.items()}
+            identical = filecmp.cmp(outputs['mémoire'], outputs['stream'], shallow=False)
+            for mode, usage in usages.items():
+                print(
+                    f"{rows:>10} | {mode:>8} | {usage['seconds']:>9.2f} | "
+                    f"{usage['peak_mb']:>12.0f} | {'oui' if identical else 'NON':>9}"
+                )
+
+        print(f"\n{'Lignes':>10} | {'Partitions':>10} | {'Processus':>9} | {'Durée (s)':>9} | {'Accélération':>12} | {'Identique':>9}")
+        print("-" * 75)
+        factor = args.scales[-1]
+        source = Path(directory) / f'raw-x{factor}.csv'
+        reference = Path(directory) / f'clean-mémoire-x{factor}.csv'
+        partitions = Path(directory) / 'partitions'
+        rows = len(pd.read_csv(source, usecols=['YEAR']))
+        write_partitions(source, partitions, args.partitions)
+        baseline = None
+        for workers in args.workers:
+            target = Path(directory) / f'clean-workers-{workers}.csv'
+            usage = measure(f'workers={workers}', partitions, target, args.chunk_size)
+            baseline = baseline or usage['seconds']
+            identical = filecmp.cmp(reference, target, shallow=False)
+            print(
+                f"{rows:>10} | {args.partitions:>10} | {workers:>9} | {usage['seconds']:>9.2f} | "
+                f"{baseline / usage['seconds']:>11.1f}x | {'oui' if identical else 'NON':>9}"
+            )
+
+
+if __name__ == '__main__':
+    main()
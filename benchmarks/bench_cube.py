@@ -0,0 +1,64 @@
+"""
+Benchmark des graphiques agrégés : lignes brutes vs cube pré-agrégé.
+
+Chronomètre les agrégats de create_country_details (moyenne par pays) et de
+create_timed_count (moyenne par année) tels qu'appelés par les callbacks de
+la page d'accueil : d'abord filtrage + groupby sur les lignes brutes, puis
+lecture dans le cube. Le temps de construction des figures Plotly, identique
+dans les deux cas, n'est pas inclus.
+
+Usage:
+    python -m benchmarks.bench_cube
+    python -m benchmarks.bench_cube --scales 1 10 100 --repeat 5
+"""
+
+import argparse
+import time
+
+from benchmarks.bench_filters import build_queries, scale_data
+from src.utils.cube import build_coverage_cube
+from src.utils.data_index import build_data_index
+from src.utils.get_data import get_filtered_data, get_vaccination_data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark du cube d\'agrégats')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--compact', action='store_true')
+    args = parser.parse_args()
+
+    base = get_vaccination_data(use_cleaned=True, compact=args.compact)
+    queries = [{}] + build_queries(base)
+
+    print(f"\n{'Lignes':>10} | {'Brut (ms)':>10} | {'Cube (ms)':>10} | {'Build (ms)':>10} | {'Cellules':>8}")
+    print("-" * 60)
+    for factor in args.scales:
+        data = scale_data(base, factor)
+        index = build_data_index(data)
+
+        start = time.perf_counter()
+        cube = build_coverage_cube(data)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for query in queries:
+                filtered = get_filtered_data(data, index=index, **query)
+                filtered.groupby('NAME', observed=True)['COVERAGE'].mean()
+                filtered.groupby('YEAR', observed=True)['COVERAGE'].mean()
+        raw_ms = (time.perf_counter() - start) * 1000 / (args.repeat * len(queries))
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for query in queries:
+                view = cube.where(**query)
+                view.rollup(['NAME'])['mean']
+                view.rollup(['YEAR'])['mean']
+        cube_ms = (time.perf_counter() - start) * 1000 / (args.repeat * len(queries))
+
+        print(f"{len(data):>10} | {raw_ms:>10.2f} | {cube_ms:>10.2f} | {build_ms:>10.1f} | {cube.n_cells:>8}")
+
+
+if __name__ == '__main__':
+    main()
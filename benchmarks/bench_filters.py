@@ -0,0 +1,87 @@
+"""
+Benchmark de get_filtered_data : parcours des colonnes vs index inversé.
+
+Le jeu de données nettoyé est répliqué pour simuler des volumes croissants,
+puis les deux chemins de filtrage sont chronométrés sur les mêmes requêtes.
+
+Usage:
+    python -m benchmarks.bench_filters
+    python -m benchmarks.bench_filters --scales 1 10 100 --repeat 20
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+from src.utils.data_index import build_data_index
+from src.utils.get_data import get_filtered_data, get_vaccination_data
+
+
+def scale_data(data: pd.DataFrame, factor: int) -> pd.DataFrame:
+    """
+    Réplique le jeu de données `factor` fois.
+
+    Args:
+        data: DataFrame de référence
+        factor: Facteur de réplication
+
+    Returns:
+        DataFrame de len(data) * factor lignes
+    """
+    return pd.concat([data] * factor, ignore_index=True)
+
+
+def build_queries(data: pd.DataFrame) -> List[Dict[str, Optional[object]]]:
+    """Construit un échantillon de filtres représentatifs du dashboard."""
+    year = int(data['YEAR'].max())
+    country = str(data['NAME'].iloc[0])
+    antigen = str(data['ANTIGEN'].iloc[0])
+    category = str(data['COVERAGE_CATEGORY'].iloc[0])
+    return [
+        {'year': year},
+        {'country': country},
+        {'antigen': antigen},
+        {'year': year, 'antigen': antigen},
+        {'country': country, 'antigen': antigen, 'coverage_category': category},
+        {'year': year, 'country': country, 'antigen': antigen, 'coverage_category': category},
+    ]
+
+
+def time_queries(run: Callable[..., pd.DataFrame], queries: List[Dict], repeat: int) -> float:
+    """Retourne le temps moyen (ms) d'une requête."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in queries:
+            run(**query)
+    return (time.perf_counter() - start) * 1000 / (repeat * len(queries))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark de get_filtered_data')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--compact', action='store_true')
+    args = parser.parse_args()
+
+    base = get_vaccination_data(use_cleaned=True, compact=args.compact)
+    queries = build_queries(base)
+
+    print(f"\n{'Lignes':>10} | {'Scan (ms)':>10} | {'Index (ms)':>10} | {'Build (ms)':>10} | {'Gain':>6}")
+    print("-" * 58)
+    for factor in args.scales:
+        data = scale_data(base, factor)
+
+        start = time.perf_counter()
+        index = build_data_index(data)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        scan_ms = time_queries(lambda **q: get_filtered_data(data, **q), queries, args.repeat)
+        index_ms = time_queries(lambda **q: get_filtered_data(data, index=index, **q), queries, args.repeat)
+
+        print(f"{len(data):>10} | {scan_ms:>10.3f} | {index_ms:>10.3f} | {build_ms:>10.1f} | {scan_ms / index_ms:>5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark du noyau d'agrégation bincount face à pandas groupby.
+
+Mesure les agrégats de create_country_details (moyenne par pays) et de
+create_timed_count (moyenne par année et antigène) sur des sous-ensembles
+filtrés de tailles croissantes, là où le coût fixe de groupby domine.
+
+Usage:
+    python -m benchmarks.bench_groupby
+    python -m benchmarks.bench_groupby --sizes 100 1000 10000 --repeat 200
+"""
+
+import argparse
+import time
+from typing import Callable
+
+from benchmarks.bench_filters import scale_data
+from src.utils.get_data import get_vaccination_data
+from src.utils.groupby_kernel import group_aggregate
+
+
+def time_call(run: Callable[[], object], repeat: int) -> float:
+    """Retourne le temps moyen (ms) d'un appel."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        run()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark du noyau groupby')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=100)
+    parser.add_argument('--compact', action='store_true')
+    args = parser.parse_args()
+
+    base = get_vaccination_data(use_cleaned=True, compact=args.compact)
+    pool = scale_data(base, max(1, -(-max(args.sizes) // len(base))))
+
+    print(f"\n{'Lignes':>8} | {'Agrégat':>14} | {'pandas (ms)':>11} | {'bincount (ms)':>13} | {'Gain':>6}")
+    print("-" * 66)
+    for size in args.sizes:
+        data = pool.sample(n=size, random_state=0) if size < len(pool) else pool
+        cases = {
+            'NAME': lambda: data.groupby('NAME', observed=True)['COVERAGE'].mean(),
+            'YEAR×ANTIGEN': lambda: data.groupby(['YEAR', 'ANTIGEN'], observed=True)['COVERAGE'].mean(),
+        }
+        kernels = {
+            'NAME': lambda: group_aggregate(data, ['NAME'], 'COVERAGE', ['mean']),
+            'YEAR×ANTIGEN': lambda: group_aggregate(data, ['YEAR', 'ANTIGEN'], 'COVERAGE', ['mean']),
+        }
+        for name in cases:
+            pandas_ms = time_call(cases[name], args.repeat)
+            kernel_ms = time_call(kernels[name], args.repeat)
+            print(f"{len(data):>8} | {name:>14} | {pandas_ms:>11.3f} | {kernel_ms:>13.3f} | {pandas_ms / kernel_ms:>5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
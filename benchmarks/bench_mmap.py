@@ -0,0 +1,108 @@
+"""
+Benchmark de la mémoire des workers : DataFrame en mémoire vs colonnes mmap.
+
+Le jeu de données répliqué est soit chargé dans le processus parent puis
+hérité par fork (préchargement), soit chargé par chaque worker. Les workers
+parcourent ensuite toutes les colonnes ; leur mémoire privée (pages copiées
+ou allouées en propre) et partagée est lue dans /proc/<pid>/smaps_rollup
+(Linux uniquement).
+
+Usage:
+    python -m benchmarks.bench_mmap
+    python -m benchmarks.bench_mmap --scales 1 10 100 --workers 4
+"""
+
+import argparse
+import multiprocessing
+import tempfile
+from pathlib import Path
+from typing import Dict
+
+import pandas as pd
+
+from benchmarks.bench_filters import scale_data
+from src.app.serve import read_memory_usage
+from src.utils.compact import compact_vaccination_data
+from src.utils.get_data import get_vaccination_data
+from src.utils.mmap_data import open_column_file, write_column_file
+
+
+def _scan(data: pd.DataFrame) -> None:
+    """Parcourt toutes les colonnes, comme les agrégats du dashboard."""
+    for column in data.columns:
+        if pd.api.types.is_numeric_dtype(data[column]):
+            data[column].sum()
+        else:
+            data[column].value_counts()
+
+
+def _worker(source, results) -> None:
+    """Charge (ou hérite) les données, les parcourt, puis renvoie la mémoire du worker."""
+    data = source() if callable(source) else source
+    _scan(data)
+    results.put(read_memory_usage())
+
+
+def measure_workers(source, workers: int) -> Dict[str, float]:
+    """
+    Lance des workers par fork et mesure leur mémoire après un parcours des données.
+
+    Args:
+        source: DataFrame chargé dans le parent (hérité par fork), ou fonction
+            de chargement appelée dans chaque worker
+        workers: Nombre de workers
+
+    Returns:
+        Moyennes par worker {private_mb, shared_mb}
+    """
+    context = multiprocessing.get_context('fork')
+    results = context.Queue()
+    processes = [context.Process(target=_worker, args=(source, results)) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    usages = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return {
+        'private_mb': sum(usage['private'] for usage in usages) / len(usages) / 1024 ** 2,
+        'shared_mb': sum(usage['shared'] for usage in usages) / len(usages) / 1024 ** 2,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark mémoire : DataFrame en mémoire vs mmap')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--workers', type=int, default=4)
+    args = parser.parse_args()
+
+    if not read_memory_usage():
+        raise SystemExit("/proc/self/smaps_rollup indisponible : benchmark réservé à Linux")
+
+    base = get_vaccination_data(use_cleaned=True, compact=False, mmap=False)
+
+    print(f"\n{'Lignes':>10} | {'Mode':>8} | {'Chargement':>10} | {'Privée/worker (Mo)':>18} | {'Partagée/worker (Mo)':>20}")
+    print("-" * 79)
+    with tempfile.TemporaryDirectory() as directory:
+        for factor in args.scales:
+            data = scale_data(base, factor)
+            compact, _ = compact_vaccination_data(data)
+            pickle_path = Path(directory) / f'x{factor}.pkl'
+            data.to_pickle(pickle_path)
+            mmap_path = write_column_file(Path(directory) / f'x{factor}.columns.mmap', compact, {})
+
+            cases = (
+                ('mémoire', 'parent', data),
+                ('mémoire', 'worker', lambda: pd.read_pickle(pickle_path)),
+                ('mmap', 'parent', open_column_file(mmap_path)),
+                ('mmap', 'worker', lambda: open_column_file(mmap_path)),
+            )
+            for mode, loading, source in cases:
+                usage = measure_workers(source, args.workers)
+                print(
+                    f"{len(data):>10} | {mode:>8} | {loading:>10} | "
+                    f"{usage['private_mb']:>18.1f} | {usage['shared_mb']:>20.1f}"
+                )
+
+
+if __name__ == '__main__':
+    main()
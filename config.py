@@ -21,6 +21,115 @@ ASSETS_DIR: Path = BASE_DIR / "assets"
 IMAGES_DIR: Path = BASE_DIR / "images"
 
 
+# ========================================
+# NETTOYAGE DES DONNÉES
+# ========================================
+
+# Nettoyage en flux (clean_data.py --stream) : lignes lues par bloc, ce qui
+# borne la mémoire, et nombre de séquences triées fusionnées à la fois
+CLEAN_CHUNK_SIZE: int = 100_000
+CLEAN_MERGE_FAN_IN: int = 64
+
+# Nettoyage incrémental (clean_data.py --incremental) : empreintes des
+# enregistrements bruts du dernier passage, à côté du fichier nettoyé
+CLEAN_MANIFEST_SUFFIX: str = ".manifest.npz"
+
+# Nettoyage d'un dossier (ou motif glob) de fichiers bruts : processus
+# nettoyant les partitions en parallèle
+CLEAN_WORKERS: int = int(os.environ.get("CLEAN_WORKERS", os.cpu_count() or 1))
+
+# Rapport par étape du nettoyage : pic de mémoire mesuré avec tracemalloc
+CLEAN_TRACE_MEMORY: bool = os.environ.get("CLEAN_TRACE_MEMORY", "1") == "1"
+
+# Validation des données nettoyées : rapport mis en cache à côté du fichier
+# (ex: cleaneddata.csv.validation.json) et positions de lignes en défaut
+# gardées au plus par vérification
+VALIDATION_REPORT_SUFFIX: str = ".validation.json"
+VALIDATION_MAX_ROW_IDS: int = 1000
+
+
+# ========================================
+# CACHE DES DONNÉES
+# ========================================
+
+# Snapshot binaire écrit à côté du CSV (ex: cleaneddata.csv.snapshot.npz)
+SNAPSHOT_ENABLED: bool = True
+SNAPSHOT_SUFFIX: str = ".snapshot.npz"
+
+# Vérifie l'empreinte SHA-256 du CSV avant de réutiliser un snapshot
+SNAPSHOT_VERIFY_HASH: bool = True
+
+# Mode compact (Categorical + types numériques réduits), désactivé par défaut
+COMPACT_DATA: bool = False
+
+# Colonnes projetées en mémoire (mmap) : implique le mode compact, les pages
+# du fichier (ex: cleaneddata.csv.columns.mmap) sont partagées par tous les workers
+MMAP_DATA: bool = os.environ.get("MMAP_DATA", "0") == "1"
+MMAP_SUFFIX: str = ".columns.mmap"
+
+# Rechargement à chaud : le CSV nettoyé est surveillé et une nouvelle version
+# est chargée puis substituée sans redémarrer le serveur
+HOT_RELOAD_ENABLED: bool = os.environ.get("HOT_RELOAD_ENABLED", "1") == "1"
+HOT_RELOAD_INTERVAL: float = float(os.environ.get("HOT_RELOAD_INTERVAL", 5.0))  # secondes
+# Pause du chargement en tâche de fond entre deux étapes (structure dérivée,
+# figure préchauffée) : laisse le GIL aux requêtes servies pendant ce temps
+HOT_RELOAD_YIELD: float = float(os.environ.get("HOT_RELOAD_YIELD", 0.005))  # secondes
+# Priorité (nice, Linux) du thread de chargement en tâche de fond : le
+# système ordonnance d'abord les threads qui servent les requêtes
+HOT_RELOAD_NICE: int = int(os.environ.get("HOT_RELOAD_NICE", 19))
+
+# Démarrage rapide : le serveur écoute tout de suite et sert un layout
+# d'attente pendant que les données sont chargées en tâche de fond
+FAST_START: bool = os.environ.get("FAST_START", "0") == "1"
+STARTUP_POLL_INTERVAL: int = 500  # millisecondes
+
+# Nombre maximal de jeux de filtres gardés en cache (données filtrées)
+FILTER_CACHE_MAX_SIZE: int = 64
+
+# Cache de figures sur disque (SQLite) partagé par tous les workers
+FIGURE_CACHE_ENABLED: bool = os.environ.get("FIGURE_CACHE_ENABLED", "1") == "1"
+FIGURE_CACHE_PATH: Path = Path(os.environ.get("FIGURE_CACHE_PATH", DATA_DIR / "cache" / "figures.sqlite"))
+FIGURE_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+FIGURE_CACHE_MAX_AGE: int = 7 * 24 * 3600  # secondes
+
+# Nombre de figures gardées en mémoire devant le cache disque
+FIGURE_CACHE_MEMORY_SIZE: int = 128
+
+# Compteurs des combinaisons de filtres demandées (préchauffage adaptatif)
+QUERY_STATS_ENABLED: bool = os.environ.get("QUERY_STATS_ENABLED", "1") == "1"
+QUERY_STATS_PATH: Path = Path(os.environ.get("QUERY_STATS_PATH", DATA_DIR / "cache" / "query_stats.json"))
+
+# Nombre de combinaisons les plus demandées préchauffées après un chargement
+PREWARM_TOP_K: int = 50
+
+
+# ========================================
+# CALLBACKS DE LA PAGE D'ACCUEIL
+# ========================================
+
+# 'split' : un callback par graphique (4 requêtes HTTP par changement de filtre)
+# 'consolidated' : un seul callback à 4 sorties, un seul filtrage
+HOME_CALLBACK_MODE: str = os.environ.get("HOME_CALLBACK_MODE", "split")
+
+# Threads construisant les figures en parallèle en mode 'consolidated'.
+# 1 = construction séquentielle : la construction des figures Plotly est
+# surtout du Python pur (GIL), le parallélisme n'y apporte rien en CPython
+HOME_CALLBACK_WORKERS: int = int(os.environ.get("HOME_CALLBACK_WORKERS", "1"))
+
+# Graphiques d'exploration : toutes les variantes (histogram/boxplot,
+# pie/treemap) sont calculées par jeu de filtres et stockées côté client ;
+# changer de type de graphique ne fait plus d'aller-retour serveur
+CLIENTSIDE_GRAPH_SWITCH: bool = os.environ.get("CLIENTSIDE_GRAPH_SWITCH", "1") == "1"
+
+# Sérialisation des figures : 'default' (encodage Plotly standard) ou 'compact'
+# (template réduit aux types de traces présents, listes numériques en
+# tableaux typés base64) ; le rendu est identique
+FIGURE_SERIALIZER: str = os.environ.get("FIGURE_SERIALIZER", "default")
+
+# Affiche la durée de construction de chaque figure (comparaison des modes)
+LOG_CALLBACK_TIMINGS: bool = os.environ.get("LOG_CALLBACK_TIMINGS", "0") == "1"
+
+
 # ========================================
 # CONFIGURATION SERVEUR
 # ========================================
@@ -30,6 +139,28 @@ DEFAULT_HOST: str = "127.0.0.1"
 DEFAULT_PORT: int = 8050
 DEFAULT_DEBUG: bool = False
 
+# Serveur de production (python main.py serve) : workers forkés après préchargement
+SERVE_WORKERS: int = int(os.environ.get("SERVE_WORKERS", os.cpu_count() or 1))
+SERVE_THREADS: int = int(os.environ.get("SERVE_THREADS", 4))
+
+# Compression des réponses (gzip, et brotli si le module est installé)
+COMPRESSION_ENABLED: bool = os.environ.get("COMPRESSION_ENABLED", "1") == "1"
+COMPRESSION_MIN_SIZE: int = 1024  # octets, en dessous la réponse est envoyée telle quelle
+COMPRESSION_LEVEL: int = 6  # gzip, de 1 (rapide) à 9 (compact)
+BROTLI_QUALITY: int = 5  # brotli, de 0 (rapide) à 11 (compact)
+COMPRESSIBLE_MIMETYPES: List[str] = [
+    'application/json',
+    'application/javascript',
+    'text/javascript',
+    'text/html',
+    'text/css',
+    'text/plain',
+    'image/svg+xml',
+]
+
+# Durée de cache navigateur des fichiers statiques empreintés (1 an)
+STATIC_CACHE_MAX_AGE: int = 365 * 24 * 3600
+
 
 # ========================================
 # CONFIGURATION DASH
@@ -76,6 +207,15 @@ COLOR_PALETTE: List[str] = [
 # Template des graphiques
 PLOTLY_TEMPLATE: str = "plotly_white"
 
+# Nombre de lignes par page du tableau de données
+TABLE_PAGE_SIZE: int = 10
+
+# Histogrammes regroupés côté serveur (seuls les effectifs par classe sont envoyés)
+HISTOGRAM_SERVER_BINNING: bool = True
+
+# Boxplots calculés côté serveur (quartiles, moustaches et points aberrants)
+BOXPLOT_PRECOMPUTED_STATS: bool = True
+
 # ========================================
 # MESSAGES
 # ========================================
@@ -1,11 +1,22 @@
+import time
+
+# Instant du lancement, avant les imports lourds (Dash, pandas) : référence
+# des délais de démarrage (premier octet servi, données prêtes)
+STARTED_AT: float = time.perf_counter()
+
 import argparse
-from typing import Dict, Any
+import os
+from typing import Any, Callable, Dict, Optional
 
 import dash
 
-from src.app.layout import create_main_layout
+from config import FAST_START, SERVE_WORKERS, SERVE_THREADS
+from src.app.app_factory import create_data_registry, create_layout_provider
+from src.app.http import configure_http
+from src.app.serve import preload_application, read_memory_usage, run_production_server
 from src.callbacks.callbacks import register_all_callbacks
 from src.utils.get_data import get_vaccination_data
+from src.utils.warmup import run_warmup
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -41,12 +52,78 @@ def parse_arguments() -> argparse.Namespace:
         action='store_false',
         help='Désactive le rechargement automatique'
     )
+    parser.add_argument(
+        '--compact',
+        action='store_true',
+        help='Charge les données en représentation compacte (Categorical, types réduits)'
+    )
+    parser.add_argument(
+        '--fast-start',
+        action='store_true',
+        default=FAST_START,
+        help='Écoute immédiatement et charge les données en tâche de fond (layout d\'attente)'
+    )
     parser.set_defaults(use_reloader=True)
     
+    # Sous-commandes (sans sous-commande : lancement du serveur)
+    subparsers = parser.add_subparsers(dest='command')
+    warmup_parser = subparsers.add_parser(
+        'warmup',
+        help='Précalcule les figures de la page d\'accueil dans le cache de figures'
+    )
+    warmup_parser.add_argument(
+        '--workers',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Nombre de processus (défaut: nombre de CPU)'
+    )
+    warmup_parser.add_argument(
+        '--budget',
+        type=int,
+        default=500,
+        help='Nombre maximal de combinaisons de filtres, les plus courantes d\'abord (défaut: 500)'
+    )
+    warmup_parser.add_argument(
+        '--all',
+        dest='budget',
+        action='store_const',
+        const=None,
+        help='Précalcule toutes les combinaisons de filtres non vides'
+    )
+    warmup_parser.add_argument(
+        '--compact',
+        action='store_true',
+        default=argparse.SUPPRESS,
+        help='Même option que pour le serveur : doit correspondre au mode de chargement servi'
+    )
+    
+    serve_parser = subparsers.add_parser(
+        'serve',
+        help='Serveur de production : données préchargées une fois puis partagées par des workers forkés'
+    )
+    serve_parser.add_argument(
+        '--workers',
+        type=int,
+        default=SERVE_WORKERS,
+        help=f'Nombre de processus (défaut: {SERVE_WORKERS})'
+    )
+    serve_parser.add_argument(
+        '--threads',
+        type=int,
+        default=SERVE_THREADS,
+        help=f'Nombre de threads par processus (défaut: {SERVE_THREADS})'
+    )
+    for name, kwargs in (
+        ('--port', {'type': int, 'help': 'Port du serveur'}),
+        ('--host', {'type': str, 'help': 'Hôte du serveur'}),
+        ('--compact', {'action': 'store_true', 'help': 'Charge les données en représentation compacte'}),
+    ):
+        serve_parser.add_argument(name, default=argparse.SUPPRESS, **kwargs)
+    
     return parser.parse_args()
 
 
-def print_startup_info(host: str, port: int, debug: bool, use_reloader: bool, n_records: int) -> None:
+def print_startup_info(host: str, port: int, debug: bool, use_reloader: bool, n_records: Optional[int]) -> None:
     """
     Affiche les informations de démarrage.
     
@@ -55,12 +132,15 @@ def print_startup_info(host: str, port: int, debug: bool, use_reloader: bool, n_
         port: Port du serveur
         debug: Mode debug activé ou non
         use_reloader: Rechargement automatique activé ou non
-        n_records: Nombre d'enregistrements chargés
+        n_records: Nombre d'enregistrements chargés (None : chargement en tâche de fond)
     """
     print("\n" + "=" * 60)
     print("🏥 Vaccination Coverage Dashboard")
     print("=" * 60)
-    print(f"📊 {n_records} enregistrements chargés")
+    if n_records is None:
+        print("📊 Données en cours de chargement (démarrage rapide)")
+    else:
+        print(f"📊 {n_records} enregistrements chargés")
     print(f"🌐 Serveur: http://{host}:{port}")
     print(f"🐛 Mode debug: {'activé' if debug else 'désactivé'}")
     print(f"🔄 Rechargement auto: {'activé' if use_reloader else 'désactivé'}")
@@ -68,12 +148,36 @@ def print_startup_info(host: str, port: int, debug: bool, use_reloader: bool, n_
     print("\nAppuyez sur CTRL+C pour arrêter le serveur\n")
 
 
-def initialize_app(data) -> dash.Dash:
+def report_startup_timings(app: dash.Dash, started_at: float) -> None:
+    """
+    Affiche séparément le délai avant le premier octet servi et avant que les données soient prêtes.
+    
+    Args:
+        app: Application Dash
+        started_at: Instant du lancement (time.perf_counter)
+    """
+    first_response: list = []
+    
+    @app.server.after_request
+    def report_first_byte(response):
+        if not first_response:
+            first_response.append(time.perf_counter() - started_at)
+            print(f"⚡ Premier octet servi {first_response[0]:.2f} s après le lancement")
+        return response
+    
+    app.server.extensions['data_registry'].when_ready(
+        lambda version: print(f"📊 Données prêtes {time.perf_counter() - started_at:.2f} s après le lancement")
+    )
+
+
+def initialize_app(data, loader: Optional[Callable[[], Any]] = None) -> dash.Dash:
     """
     Initialize and configure the Dash application.
     
     Args:
-        data: DataFrame contenant les données de vaccination
+        data: DataFrame contenant les données de vaccination (None : démarrage
+            rapide, chargées ensuite en tâche de fond)
+        loader: Fonction de rechargement des données (rechargement à chaud)
         
     Returns:
         A configured Dash application instance
@@ -91,15 +195,63 @@ def initialize_app(data) -> dash.Dash:
         ]
     )
     
-    # Set up layout
-    app.layout = create_main_layout(data)
+    # Set up layout (celui de la version servie)
+    registry = create_data_registry(data, loader)
+    app.server.extensions['data_registry'] = registry
+    app.layout = create_layout_provider(registry)
     
     # Initialize callbacks
-    register_all_callbacks(app, data)
+    register_all_callbacks(app, registry)
+    
+    # Compression et cache HTTP
+    configure_http(app)
     
     return app
 
 
+def run_warmup_command(data, args: argparse.Namespace) -> None:
+    """
+    Préchauffe le cache de figures et affiche le rapport.
+    
+    Args:
+        data: DataFrame contenant les données de vaccination
+        args: Arguments de la sous-commande warmup
+    """
+    report = run_warmup(data, workers=args.workers, budget=args.budget, compact=args.compact)
+    cache = report['cache']
+    print("\n" + "=" * 60)
+    print("🔥 Préchauffage terminé")
+    print("=" * 60)
+    print(f"🧮 Combinaisons de filtres: {report['states']}")
+    print(f"📊 Figures prêtes: {report['figures']} en {report['seconds']:.1f} s ({report['figures_per_second']:.1f} figures/s)")
+    print(f"💾 Cache: {cache['entries']} entrées, {cache['bytes'] / 1024 ** 2:.1f} Mo ({report['cache_path']})")
+    print("=" * 60)
+
+
+def run_serve_command(args: argparse.Namespace) -> None:
+    """
+    Précharge les données puis lance le serveur de production multi-workers.
+    
+    Args:
+        args: Arguments de la sous-commande serve
+    """
+    print("Préchargement des données et de l'application...")
+    app, preload_seconds = preload_application(compact=args.compact)
+    memory = read_memory_usage()
+    
+    print("\n" + "=" * 60)
+    print("🏥 Vaccination Coverage Dashboard (production)")
+    print("=" * 60)
+    print(f"⏱️  Préchargement: {preload_seconds:.2f} s")
+    if memory:
+        print(f"💾 Processus maître: {memory['rss'] / 1024 ** 2:.0f} Mo résidents, partagés avec les workers jusqu'à modification")
+    print(f"🌐 Serveur: http://{args.host}:{args.port}")
+    print(f"👷 Workers: {args.workers} × {args.threads} threads")
+    print("=" * 60 + "\n")
+    
+    run_production_server(app, args.host, args.port, args.workers, args.threads)
+
+
 def main() -> None:
     """
     Fonction principale pour lancer le dashboard.
@@ -107,18 +259,31 @@ def main() -> None:
     # On parse les arguments de la ligne de commande
     args = parse_arguments()
     
-    # Chargement des données
-    print("Chargement des données depuis le fichier CSV...")
-    data = get_vaccination_data(use_cleaned=True)
-    print(f"✓ {len(data)} enregistrements chargés")
+    if args.command == 'serve':
+        run_serve_command(args)
+        return
+    
+    # Chargement des données (en tâche de fond en démarrage rapide)
+    data = None
+    if not args.fast_start or args.command == 'warmup':
+        print("Chargement des données depuis le fichier CSV...")
+        data = get_vaccination_data(use_cleaned=True, compact=args.compact)
+        print(f"✓ {len(data)} enregistrements chargés")
+    
+    if args.command == 'warmup':
+        run_warmup_command(data, args)
+        return
     
     # Initialisation de l'application
     print("Création de l'application...")
-    app = initialize_app(data)
+    app = initialize_app(data, loader=lambda: get_vaccination_data(use_cleaned=True, compact=args.compact))
     print("✓ Application créée et configurée")
+    report_startup_timings(app, STARTED_AT)
+    if data is None:
+        app.server.extensions['data_registry'].load_in_background()
     
     # Affichage des infos de démarrage
-    print_startup_info(args.host, args.port, args.debug, args.use_reloader, len(data))
+    print_startup_info(args.host, args.port, args.debug, args.use_reloader, len(data) if data is not None else None)
 
     # Démarrage du serveur
     app.run(
@@ -1,24 +1,77 @@
-from typing import Dict, Any
-from dash import Dash
+from typing import Any, Callable, Dict, Optional
+from dash import Dash, html
 import dash_bootstrap_components as dbc
 import pandas as pd
 
-from src.app.layout import create_main_layout
+from config import ASSETS_DIR, HOT_RELOAD_ENABLED, HOT_RELOAD_INTERVAL, HOT_RELOAD_YIELD, HOT_RELOAD_NICE
+from src.app.http import configure_http
+from src.app.layout import create_loading_layout, create_main_layout
 from src.callbacks import register_all_callbacks
+from src.utils.data_registry import DataRegistry
+from src.utils.get_data import get_data_path, get_vaccination_data
+
+
+def create_data_registry(
+    data: Optional[pd.DataFrame],
+    loader: Optional[Callable[[], pd.DataFrame]] = None
+) -> DataRegistry:
+    """
+    Crée le registre du jeu de données servi, avec le layout comme structure dérivée.
+    
+    Args:
+        data: DataFrame chargé au démarrage (None : démarrage rapide, chargé
+            ensuite par registry.load_in_background)
+        loader: Fonction de (re)chargement (défaut: get_vaccination_data)
+        
+    Returns:
+        Registre surveillant le CSV nettoyé si HOT_RELOAD_ENABLED
+    """
+    registry = DataRegistry(
+        data,
+        source_path=get_data_path(use_cleaned=True) if HOT_RELOAD_ENABLED else None,
+        loader=loader or (lambda: get_vaccination_data(use_cleaned=True)),
+        poll_interval=HOT_RELOAD_INTERVAL,
+        yield_interval=HOT_RELOAD_YIELD,
+        background_nice=HOT_RELOAD_NICE
+    )
+    # Layout (statistiques, options des filtres) recalculé à chaque version
+    registry.derive('layout', lambda version: create_main_layout(version.data))
+    return registry
+
+
+def create_layout_provider(registry: DataRegistry) -> Callable[[], html.Div]:
+    """
+    Retourne la fonction de layout de l'application.
+    
+    Args:
+        registry: Registre du jeu de données servi
+        
+    Returns:
+        Fonction servant le layout de la version courante, ou le layout
+        d'attente tant que les données ne sont pas chargées
+    """
+    def serve_layout() -> html.Div:
+        version = registry.current()
+        return version.get('layout') if version is not None else create_loading_layout()
+    
+    return serve_layout
 
 
 def create_dash_app(
-    data: pd.DataFrame,
+    data: Optional[pd.DataFrame],
     title: str = "Vaccination Coverage Dashboard",
-    external_stylesheets: list | None = None
+    external_stylesheets: list | None = None,
+    loader: Optional[Callable[[], pd.DataFrame]] = None
 ) -> Dash:
     """
     Crée et configure une instance de l'application Dash.
     
     Args:
-        data: DataFrame contenant les données à afficher
+        data: DataFrame contenant les données à afficher (None : démarrage
+            rapide, à charger avec app.server.extensions['data_registry'])
         title: Titre de l'application
         external_stylesheets: Liste des feuilles de style externes
+        loader: Fonction de rechargement des données (rechargement à chaud)
         
     Returns:
         Instance configurée de l'application Dash
@@ -30,6 +83,7 @@ def create_dash_app(
     app = Dash(
         __name__,
         external_stylesheets=external_stylesheets,
+        assets_folder=str(ASSETS_DIR),
         title=title,
         suppress_callback_exceptions=True,
         meta_tags=[
@@ -40,11 +94,16 @@ def create_dash_app(
         ]
     )
     
-    # Configuration du layout
-    app.layout = create_main_layout(data)
+    # Configuration du layout (celui de la version servie)
+    registry = create_data_registry(data, loader)
+    app.server.extensions['data_registry'] = registry
+    app.layout = create_layout_provider(registry)
     
     # Enregistrement des callbacks
-    register_all_callbacks(app, data)
+    register_all_callbacks(app, registry)
+    
+    # Compression et cache HTTP
+    configure_http(app)
     
     return app
 
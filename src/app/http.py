@@ -0,0 +1,148 @@
+"""
+Compression et cache HTTP du serveur Flask sous-jacent à Dash.
+
+- Compression gzip (brotli si le module est installé) des réponses textuelles
+  au-delà d'une taille minimale, selon l'en-tête Accept-Encoding du client.
+- Fichiers statiques empreintés (assets servis avec `?m=<mtime>`, bundles
+  Dash versionnés) marqués immuables pour un an : une nouvelle version change
+  l'URL, le navigateur ne revalide jamais l'ancienne.
+- ETag sur le layout initial (/_dash-layout), qui ne dépend que de la version
+  du jeu de données : une requête conditionnelle reçoit un 304 sans que le
+  layout soit resérialisé.
+"""
+
+import gzip
+import hashlib
+from typing import Dict
+
+from dash import Dash
+from dash.fingerprint import check_fingerprint
+from flask import Response, current_app, request
+
+from config import (
+    COMPRESSION_ENABLED,
+    COMPRESSION_MIN_SIZE,
+    COMPRESSION_LEVEL,
+    BROTLI_QUALITY,
+    COMPRESSIBLE_MIMETYPES,
+    STATIC_CACHE_MAX_AGE,
+)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def get_dataset_version() -> str:
+    """Version du jeu de données servi (enregistrée par les callbacks)."""
+    return current_app.config.get('DATASET_VERSION', '')
+
+
+def _is_fingerprinted(path: str, prefix: str) -> bool:
+    """Indique si l'URL demandée contient une empreinte de version."""
+    if path.startswith(prefix + 'assets/'):
+        return 'm' in request.args
+    if path.startswith(prefix + '_dash-component-suites/'):
+        return check_fingerprint(path)[1]
+    if path.startswith(prefix + '_favicon.ico'):
+        return 'v' in request.args
+    return False
+
+
+def _select_encoding() -> str:
+    """Choisit l'encodage accepté par le client ('br', 'gzip' ou '')."""
+    accepted = request.accept_encodings
+    if brotli is not None and accepted['br']:
+        return 'br'
+    if accepted['gzip']:
+        return 'gzip'
+    return ''
+
+
+def compress_response(response: Response) -> Response:
+    """
+    Compresse le corps d'une réponse si le client l'accepte et si elle est assez grande.
+
+    Args:
+        response: Réponse Flask
+
+    Returns:
+        Réponse (compressée ou inchangée)
+    """
+    response.vary.add('Accept-Encoding')
+    if (
+        response.status_code != 200
+        or (response.is_streamed and not response.direct_passthrough)
+        or 'Content-Encoding' in response.headers
+        or response.mimetype not in COMPRESSIBLE_MIMETYPES
+    ):
+        return response
+
+    encoding = _select_encoding()
+    if not encoding:
+        return response
+
+    # Les fichiers statiques sont servis en passthrough : lecture du corps
+    response.direct_passthrough = False
+    body = response.get_data()
+    if len(body) < COMPRESSION_MIN_SIZE:
+        return response
+
+    if encoding == 'br':
+        compressed = brotli.compress(body, quality=BROTLI_QUALITY)
+    else:
+        compressed = gzip.compress(body, compresslevel=COMPRESSION_LEVEL, mtime=0)
+    response.set_data(compressed)
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+
+def configure_http(app: Dash) -> None:
+    """
+    Installe compression et en-têtes de cache sur le serveur Flask de l'application.
+
+    Args:
+        app: Application Dash
+    """
+    server = app.server
+    prefix = app.config.requests_pathname_prefix
+    layout_path = prefix + '_dash-layout'
+
+    # ETag du layout par version du jeu de données (calculé à la première réponse)
+    layout_etags: Dict[str, str] = {}
+
+    @server.before_request
+    def layout_not_modified():
+        """Répond 304 au layout si le client en a déjà la version courante."""
+        if request.path != layout_path:
+            return None
+        etag = layout_etags.get(get_dataset_version())
+        if etag is not None and etag in request.if_none_match:
+            response = Response(status=304)
+            response.set_etag(etag)
+            response.cache_control.no_cache = True
+            return response
+        return None
+
+    @server.after_request
+    def add_http_headers(response: Response) -> Response:
+        """Ajoute en-têtes de cache et compression."""
+        path = request.path
+        if path == layout_path and response.status_code == 200:
+            version = get_dataset_version()
+            if version not in layout_etags:
+                digest = hashlib.sha256(response.get_data()).hexdigest()[:16]
+                layout_etags[version] = f'{version}-{digest}'
+            response.set_etag(layout_etags[version])
+            # Toujours revalider : le layout change avec les données
+            response.cache_control.no_cache = True
+        elif response.status_code == 200 and _is_fingerprinted(path, prefix):
+            response.cache_control.no_cache = None
+            response.cache_control.public = True
+            response.cache_control.max_age = STATIC_CACHE_MAX_AGE
+            response.cache_control.immutable = True
+
+        if COMPRESSION_ENABLED:
+            response = compress_response(response)
+        return response
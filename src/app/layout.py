@@ -1,6 +1,8 @@
-from dash import html
+from dash import dcc, html
 import pandas as pd
 
+from config import STARTUP_POLL_INTERVAL
+
 from src.components.header import create_sidebar
 from src.components.footer import create_footer
 from src.pages.home import create_home_layout
@@ -29,3 +31,27 @@ def create_main_layout(data: pd.DataFrame) -> html.Div:
             create_footer()
         ], className='main-content')
     ], className='app-container')
+
+
+def create_loading_layout() -> html.Div:
+    """
+    Crée le layout d'attente servi pendant le chargement des données (démarrage rapide).
+    
+    Il ne dépend d'aucune donnée : l'intervalle interroge le serveur jusqu'à
+    ce que le layout principal soit prêt, puis est remplacé par celui-ci.
+    
+    Returns:
+        Layout d'attente
+    """
+    return html.Div([
+        html.Div([
+            html.Div([
+                html.Div([
+                    html.H1("Dashboard - Vaccination Coverage", className='page-title'),
+                    html.P("Chargement des données en cours..."),
+                    dcc.Loading(html.Div(id='startup-status'), type='circle'),
+                ], className='container'),
+            ], className='main-content'),
+        ], className='app-container'),
+        dcc.Interval(id='startup-interval', interval=STARTUP_POLL_INTERVAL)
+    ], id='startup-root')
@@ -0,0 +1,250 @@
+"""
+Serveur de production multi-workers.
+
+Les données sont chargées et indexées une seule fois dans le processus
+maître, l'application Dash (cube, index, caches) y est construite, puis les
+workers sont créés par fork : les pages mémoire du DataFrame et des index
+restent partagées en copie sur écriture tant qu'elles ne sont pas modifiées.
+
+Gunicorn est utilisé s'il est installé (`preload_app`, workers `gthread`).
+Sinon, un pré-fork minimal sur le serveur WSGI de Werkzeug partage un même
+socket d'écoute entre les workers (POSIX uniquement) ; chaque worker traite
+ses requêtes avec un pool borné de `threads` threads, comme `gthread`.
+"""
+
+import gc
+import os
+import signal
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+from dash import Dash
+from werkzeug.serving import BaseWSGIServer
+
+try:
+    import gunicorn.app.base as gunicorn_base
+except ImportError:
+    gunicorn_base = None
+
+
+def read_memory_usage(pid: str = 'self') -> Dict[str, int]:
+    """
+    Lit la mémoire partagée et privée d'un processus (Linux).
+
+    Args:
+        pid: Identifiant du processus ('self' pour le processus courant)
+
+    Returns:
+        Dictionnaire {rss, pss, shared, private} en octets (vide si
+        /proc/<pid>/smaps_rollup n'est pas disponible)
+    """
+    fields: Dict[str, int] = {}
+    try:
+        with open(f'/proc/{pid}/smaps_rollup', 'r') as file:
+            for line in file:
+                name, _, value = line.partition(':')
+                parts = value.split()
+                if len(parts) == 2 and parts[1] == 'kB':
+                    fields[name] = int(parts[0]) * 1024
+    except OSError:
+        return {}
+    return {
+        'rss': fields.get('Rss', 0),
+        'pss': fields.get('Pss', 0),
+        'shared': fields.get('Shared_Clean', 0) + fields.get('Shared_Dirty', 0),
+        'private': fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0),
+    }
+
+
+def report_worker_memory(pid: int) -> None:
+    """Affiche la mémoire partagée et privée d'un worker."""
+    usage = read_memory_usage()
+    if not usage:
+        print(f"👷 Worker {pid} démarré")
+        return
+    print(
+        f"👷 Worker {pid} : {usage['shared'] / 1024 ** 2:.0f} Mo partagés, "
+        f"{usage['private'] / 1024 ** 2:.0f} Mo privés (PSS {usage['pss'] / 1024 ** 2:.0f} Mo)",
+        flush=True
+    )
+
+
+class PooledWSGIServer(BaseWSGIServer):
+    """
+    Serveur WSGI de Werkzeug traitant les requêtes avec un pool de threads borné.
+
+    Le serveur threadé de Werkzeug démarre un thread par connexion, sans
+    limite : au-delà de `threads` requêtes simultanées, les connexions
+    acceptées attendent ici dans la file du pool.
+    """
+
+    multithread = True
+
+    def __init__(self, host: str, port: int, wsgi_app, threads: int) -> None:
+        super().__init__(host, port, wsgi_app)
+        self.executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='wsgi')
+
+    def process_request(self, request, client_address) -> None:
+        self.executor.submit(self._process_request_thread, request, client_address)
+
+    def _process_request_thread(self, request, client_address) -> None:
+        """Traite une connexion dans un thread du pool (comme socketserver.ThreadingMixIn)."""
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def make_pooled_server(host: str, port: int, wsgi_app, threads: int) -> BaseWSGIServer:
+    """
+    Crée le serveur WSGI de Werkzeug d'un worker.
+
+    Args:
+        host: Adresse d'écoute
+        port: Port d'écoute
+        wsgi_app: Application WSGI
+        threads: Nombre maximal de requêtes traitées simultanément
+
+    Returns:
+        Serveur à pool de threads, ou mono-thread si threads vaut 1
+    """
+    if threads > 1:
+        return PooledWSGIServer(host, port, wsgi_app, threads)
+    return BaseWSGIServer(host, port, wsgi_app)
+
+
+def prepare_for_fork(app: Dash) -> None:
+    """
+    Termine le travail de fond du maître et fige ses objets avant le fork.
+
+    Le préchauffage en cours est attendu (un thread ne survit pas au fork et
+    pourrait y laisser un verrou pris), puis les objets existants sont sortis
+    du suivi du ramasse-miettes : ses passages dans les workers n'écrivent
+    plus dans leurs en-têtes, ce qui préserve le partage des pages.
+
+    Args:
+        app: Application Dash construite dans le processus maître
+    """
+    prewarm = app.server.extensions.get('figure_prewarm')
+    if prewarm is not None:
+        prewarm.join()
+    gc.collect()
+    gc.freeze()
+
+
+def preload_application(compact: bool) -> Tuple[Dash, float]:
+    """
+    Charge les données, construit l'application et la prépare au fork.
+
+    Args:
+        compact: Chargement en représentation compacte
+
+    Returns:
+        Tuple (application Dash, durée du préchargement en secondes)
+    """
+    from src.app.app_factory import create_dash_app
+    from src.utils.get_data import get_vaccination_data
+
+    start = time.perf_counter()
+    data = get_vaccination_data(use_cleaned=True, compact=compact)
+    app = create_dash_app(data, loader=lambda: get_vaccination_data(use_cleaned=True, compact=compact))
+    prepare_for_fork(app)
+    return app, time.perf_counter() - start
+
+
+def _run_gunicorn(app: Dash, host: str, port: int, workers: int, threads: int) -> None:
+    """Sert l'application préchargée avec Gunicorn."""
+    options = {
+        'bind': f'{host}:{port}',
+        'workers': workers,
+        'threads': threads,
+        'worker_class': 'gthread' if threads > 1 else 'sync',
+        'preload_app': True,
+        'post_worker_init': lambda worker: report_worker_memory(worker.pid),
+    }
+
+    class PreloadedApplication(gunicorn_base.BaseApplication):
+        """Application Gunicorn servant un serveur WSGI déjà construit."""
+
+        def load_config(self) -> None:
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return app.server
+
+    PreloadedApplication().run()
+
+
+def _run_prefork(app: Dash, host: str, port: int, workers: int, threads: int) -> None:
+    """Sert l'application préchargée avec des workers Werkzeug forkés."""
+    # Socket d'écoute ouvert par le maître et hérité par les workers
+    listener = make_pooled_server(host, port, app.server, threads)
+    # Non bloquant : un worker réveillé pour une connexion déjà acceptée par un autre ne reste pas bloqué
+    listener.socket.setblocking(False)
+
+    children: List[int] = []
+    for _ in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+            report_worker_memory(os.getpid())
+            try:
+                listener.serve_forever()
+            except KeyboardInterrupt:
+                pass
+            sys.exit(0)
+        children.append(pid)
+
+    def stop(*_) -> None:
+        for child in children:
+            try:
+                os.kill(child, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    try:
+        for child in children:
+            os.waitpid(child, 0)
+    except KeyboardInterrupt:
+        stop()
+        for child in children:
+            os.waitpid(child, 0)
+    finally:
+        listener.server_close()
+
+
+def run_production_server(app: Dash, host: str, port: int, workers: int, threads: int) -> None:
+    """
+    Sert l'application préchargée sur plusieurs workers.
+
+    Args:
+        app: Application Dash construite et préparée (preload_application)
+        host: Adresse d'écoute
+        port: Port d'écoute
+        workers: Nombre de processus
+        threads: Nombre de threads par processus
+    """
+    if gunicorn_base is not None:
+        _run_gunicorn(app, host, port, workers, threads)
+    elif hasattr(os, 'fork'):
+        print("⚠️  Gunicorn non installé : workers Werkzeug forkés")
+        _run_prefork(app, host, port, workers, threads)
+    else:
+        print("⚠️  Gunicorn non installé et fork indisponible : un seul processus")
+        server = make_pooled_server(host, port, app.server, threads)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
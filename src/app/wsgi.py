@@ -0,0 +1,13 @@
+"""
+Point d'entrée WSGI pour un serveur externe.
+
+Les données sont chargées et l'application construite à l'import : avec
+`gunicorn --preload src.app.wsgi:server`, cela se fait une seule fois dans
+le processus maître, avant le fork des workers.
+"""
+
+from config import COMPACT_DATA
+from src.app.serve import preload_application
+
+app, preload_seconds = preload_application(compact=COMPACT_DATA)
+server = app.server
@@ -1,17 +1,39 @@
-import pandas as pd
+from dash import Input, Output, no_update
 
+from src.utils.data_registry import DataRegistry
 from src.pages.home import register_callbacks as register_home_callbacks
 
 
-def register_all_callbacks(app, data: pd.DataFrame) -> None:
+def register_startup_callback(app, registry: DataRegistry) -> None:
+    """
+    Remplace le layout d'attente par le layout principal dès que les données sont prêtes.
+    
+    Args:
+        app: Instance de l'application Dash
+        registry: Registre du jeu de données servi
+    """
+    @app.callback(
+        Output('startup-root', 'children'),
+        Input('startup-interval', 'n_intervals')
+    )
+    def show_main_layout(n_intervals: int):
+        """Insère le layout principal (sans l'intervalle) une fois les données chargées."""
+        version = registry.current()
+        if version is None:
+            return no_update
+        return version.get('layout')
+
+
+def register_all_callbacks(app, registry: DataRegistry) -> None:
     """
     Enregistre tous les callbacks de l'application.
     
     Args:
         app: Instance de l'application Dash
-        data: DataFrame contenant les données
+        registry: Registre du jeu de données servi
     """
     
-    register_home_callbacks(app, data)
+    register_startup_callback(app, registry)
+    register_home_callbacks(app, registry)
     
     # TODO: Ajouter d'autres callbacks ici si nécessaire
@@ -8,12 +8,15 @@ import plotly.express as px
 import plotly.graph_objects as go
 
 from config import PLOTLY_TEMPLATE, COLOR_PALETTE
+from src.utils.cube import CubeView
+from src.utils.groupby_kernel import group_aggregate
 
 
 def create_country_details(
     data: pd.DataFrame,
     top_n: int = 10,
-    title: Optional[str] = None
+    title: Optional[str] = None,
+    cube: Optional[CubeView] = None
 ) -> go.Figure:
     """
     Crée un graphique en barres horizontales des pays avec la meilleure couverture moyenne.
@@ -22,6 +25,8 @@ def create_country_details(
         data: DataFrame contenant les données de vaccination
         top_n: Nombre de pays à afficher
         title: Titre personnalisé (optionnel)
+        cube: Vue filtrée du cube d'agrégats (optionnel). Si fournie, les
+            moyennes sont lues dans le cube au lieu d'être recalculées sur `data`
         
     Returns:
         Figure Plotly avec le graphique en barres
@@ -34,8 +39,18 @@ def create_country_details(
         )
     
     # Calcul de la couverture moyenne par pays
-    country_data = data.groupby('NAME')['COVERAGE'].mean().sort_values(ascending=False).head(top_n)
+    if cube is not None and cube.supports(['NAME'], 'COVERAGE'):
+        country_data = cube.rollup(['NAME'])['mean']
+    else:
+        country_data = group_aggregate(data, ['NAME'], 'COVERAGE', ['mean'])['mean']
+    country_data = country_data.sort_values(ascending=False).head(top_n)
     
+    if country_data.empty:
+        return go.Figure().add_annotation(
+            text="Aucune donnée disponible",
+            xref="paper", yref="paper",
+            x=0.5, y=0.5, showarrow=False
+        )
 
     if len(country_data) == top_n:
         default_title = f'Top {top_n} pays - Couverture moyenne'
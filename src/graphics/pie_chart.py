@@ -36,7 +36,9 @@ def create_pie_chart(
         )
     
     # Comptage des valeurs (top N si trop de catégories)
+    # Les catégories absentes (colonne Categorical) sont ignorées
     value_counts = data[column].value_counts()
+    value_counts = value_counts[value_counts > 0]
     if len(value_counts) > max_categories:
         value_counts = value_counts.head(max_categories)
     
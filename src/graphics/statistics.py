@@ -2,7 +2,8 @@
 Statistiques et indicateurs clés de vaccination.
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 
@@ -49,7 +50,8 @@ def create_statistics_histogram(
     data: pd.DataFrame,
     column: str = 'COVERAGE',
     nbins: int = 30,
-    title: Optional[str] = None
+    title: Optional[str] = None,
+    server_binning: bool = False
 ) -> go.Figure:
     """
     Crée un histogramme pour visualiser la distribution statistique.
@@ -59,6 +61,10 @@ def create_statistics_histogram(
         column: Colonne à visualiser
         nbins: Nombre de bins pour l'histogramme
         title: Titre personnalisé (optionnel)
+        server_binning: Si True, les effectifs sont calculés côté serveur et
+            envoyés sous forme de barres (taille proportionnelle à nbins et non
+            au nombre de lignes) ; sinon toutes les valeurs sont envoyées au
+            navigateur qui les regroupe
         
     Returns:
         Figure Plotly avec l'histogramme
@@ -70,11 +76,37 @@ def create_statistics_histogram(
             x=0.5, y=0.5, showarrow=False
         )
     
-    fig = go.Figure(data=[go.Histogram(
-        x=data[column],
-        nbinsx=nbins,
-        marker_color=COLOR_PALETTE[0]
-    )])
+    if server_binning:
+        values = pd.to_numeric(data[column], errors='coerce').to_numpy(dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return go.Figure().add_annotation(
+                text="Aucune donnée disponible",
+                xref="paper", yref="paper",
+                x=0.5, y=0.5, showarrow=False
+            )
+        
+        # Bornes arrondies à l'entier pour des classes lisibles (ex: 0-100 en pas de 5)
+        low, high = np.floor(values.min()), np.ceil(values.max())
+        if high <= low:
+            high = low + 1
+        counts, edges = np.histogram(values, bins=nbins, range=(low, high))
+        
+        fig = go.Figure(data=[go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
+            customdata=np.column_stack([edges[:-1], edges[1:]]),
+            hovertemplate='[%{customdata[0]:.4g} ; %{customdata[1]:.4g}[<br>Fréquence: %{y}<extra></extra>',
+            marker_color=COLOR_PALETTE[0]
+        )])
+        fig.update_layout(bargap=0)
+    else:
+        fig = go.Figure(data=[go.Histogram(
+            x=data[column],
+            nbinsx=nbins,
+            marker_color=COLOR_PALETTE[0]
+        )])
     
     default_title = f'Distribution statistique - {column}'
     fig.update_layout(
@@ -88,11 +120,61 @@ def create_statistics_histogram(
     return fig
 
 
+def _box_statistics(
+    data: pd.DataFrame,
+    column: str,
+    group_by: Optional[str] = None
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Calcule en une passe groupée les statistiques des boîtes à moustaches.
+    
+    Mêmes conventions que Plotly : quartiles par interpolation linéaire,
+    moustaches sur les valeurs extrêmes situées à moins de 1.5 × IQR des
+    quartiles, points au-delà considérés comme aberrants.
+    
+    Args:
+        data: DataFrame contenant les données
+        column: Colonne numérique à analyser
+        group_by: Colonne de regroupement (optionnel, un seul groupe sinon)
+        
+    Returns:
+        Tuple (statistiques indexées par groupe dans l'ordre d'apparition avec
+        les colonnes q1, median, q3, lowerfence, upperfence ; points aberrants
+        distincts avec les colonnes group et value)
+    """
+    frame = pd.DataFrame({
+        'group': data[group_by] if group_by else column,
+        'value': pd.to_numeric(data[column], errors='coerce'),
+    }).dropna()
+    grouped = frame.groupby('group', observed=True, sort=False)['value']
+    
+    stats = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+    stats.columns = ['q1', 'median', 'q3']
+    iqr = stats['q3'] - stats['q1']
+    
+    # Bornes de chaque ligne via le numéro de son groupe (même ordre que stats)
+    group_ids = grouped.ngroup().to_numpy()
+    values = frame['value'].to_numpy()
+    low = (stats['q1'] - 1.5 * iqr).to_numpy()[group_ids]
+    high = (stats['q3'] + 1.5 * iqr).to_numpy()[group_ids]
+    inside = (values >= low) & (values <= high)
+    
+    fences = frame[inside].groupby('group', observed=True, sort=False)['value'].agg(['min', 'max'])
+    fences = fences.reindex(stats.index)
+    stats['lowerfence'] = fences['min'].fillna(stats['q1'])
+    stats['upperfence'] = fences['max'].fillna(stats['q3'])
+    
+    # Les doublons se superposent à l'affichage : une seule occurrence suffit
+    outliers = frame[~inside].drop_duplicates()
+    return stats, outliers
+
+
 def create_statistics_boxplot(
     data: pd.DataFrame,
     column: str = 'COVERAGE',
     group_by: Optional[str] = None,
-    title: Optional[str] = None
+    title: Optional[str] = None,
+    precomputed_stats: bool = False
 ) -> go.Figure:
     """
     Crée un boxplot pour les statistiques descriptives.
@@ -102,6 +184,9 @@ def create_statistics_boxplot(
         column: Colonne numérique à analyser
         group_by: Colonne pour grouper les données (optionnel)
         title: Titre personnalisé (optionnel)
+        precomputed_stats: Si True, quartiles et moustaches sont calculés côté
+            serveur et seuls ces résumés (et les points aberrants) sont envoyés
+            au navigateur ; sinon toutes les valeurs brutes sont envoyées
         
     Returns:
         Figure Plotly avec le boxplot
@@ -113,7 +198,43 @@ def create_statistics_boxplot(
             x=0.5, y=0.5, showarrow=False
         )
     
-    if group_by and group_by in data.columns:
+    grouped = bool(group_by and group_by in data.columns)
+    
+    if precomputed_stats:
+        stats, outliers = _box_statistics(data, column, group_by if grouped else None)
+        outliers_by_group = dict(list(outliers.groupby('group', observed=True, sort=False)['value']))
+        fig = go.Figure()
+        for i, (category, row) in enumerate(stats.iterrows()):
+            name = str(category)
+            color = COLOR_PALETTE[i % len(COLOR_PALETTE)]
+            fig.add_trace(go.Box(
+                x=[name],
+                q1=[row['q1']],
+                median=[row['median']],
+                q3=[row['q3']],
+                lowerfence=[row['lowerfence']],
+                upperfence=[row['upperfence']],
+                name=name,
+                legendgroup=name,
+                showlegend=grouped,
+                marker_color=color
+            ))
+            category_outliers = outliers_by_group.get(category)
+            if category_outliers is not None:
+                fig.add_trace(go.Scatter(
+                    x=np.full(len(category_outliers), name, dtype=object),
+                    y=category_outliers.to_numpy(),
+                    mode='markers',
+                    name=name,
+                    legendgroup=name,
+                    showlegend=False,
+                    marker_color=color
+                ))
+        default_title = (
+            f'Statistiques de {column} par {group_by}' if grouped
+            else f'Statistiques descriptives - {column}'
+        )
+    elif grouped:
         # Boxplot groupé
         fig = go.Figure()
         for i, category in enumerate(data[group_by].unique()):
@@ -8,6 +8,12 @@ import plotly.express as px
 import plotly.graph_objects as go
 
 from config import PLOTLY_TEMPLATE, COLOR_PALETTE
+from src.utils.cube import CubeView
+from src.utils.groupby_kernel import group_aggregate
+
+
+# Mesure du cube correspondant à chaque type d'agrégation ('count' = taille des groupes)
+_CUBE_MEASURES = {'mean': 'mean', 'sum': 'sum', 'count': 'size'}
 
 
 def create_timed_count(
@@ -16,7 +22,8 @@ def create_timed_count(
     value_column: str = 'COVERAGE',
     aggregation: str = 'mean',
     title: Optional[str] = None,
-    group_by: Optional[str] = None
+    group_by: Optional[str] = None,
+    cube: Optional[CubeView] = None
 ) -> go.Figure:
     """
     Crée un graphique en ligne montrant l'évolution temporelle.
@@ -28,6 +35,8 @@ def create_timed_count(
         aggregation: Type d'agrégation ('mean', 'sum', 'count')
         title: Titre personnalisé (optionnel)
         group_by: Colonne pour créer plusieurs séries (optionnel)
+        cube: Vue filtrée du cube d'agrégats (optionnel). Si fournie, les
+            agrégats sont lus dans le cube au lieu d'être recalculés sur `data`
         
     Returns:
         Figure Plotly avec le graphique en ligne
@@ -39,16 +48,15 @@ def create_timed_count(
             x=0.5, y=0.5, showarrow=False
         )
     
-    # Agrégation des données
+    # Agrégation des données (cube pré-agrégé si disponible, sinon noyau NumPy)
+    keys = [time_column, group_by] if group_by and group_by in data.columns else [time_column]
+    if cube is not None and cube.supports(keys, value_column):
+        time_data = _cube_aggregate(cube, keys, value_column, aggregation)
+    else:
+        time_data = _kernel_aggregate(data, keys, value_column, aggregation)
+    
     if group_by and group_by in data.columns:
         # Évolution par groupe
-        if aggregation == 'mean':
-            time_data = data.groupby([time_column, group_by])[value_column].mean().reset_index()
-        elif aggregation == 'sum':
-            time_data = data.groupby([time_column, group_by])[value_column].sum().reset_index()
-        else:  # count
-            time_data = data.groupby([time_column, group_by]).size().reset_index(name=value_column)
-        
         fig = px.line(
             time_data,
             x=time_column,
@@ -61,13 +69,6 @@ def create_timed_count(
         )
     else:
         # Évolution globale
-        if aggregation == 'mean':
-            time_data = data.groupby(time_column)[value_column].mean().reset_index()
-        elif aggregation == 'sum':
-            time_data = data.groupby(time_column)[value_column].sum().reset_index()
-        else:  # count
-            time_data = data.groupby(time_column).size().reset_index(name=value_column)
-        
         default_title = f'Évolution de {value_column} dans le temps'
         fig = px.line(
             time_data,
@@ -88,11 +89,25 @@ def create_timed_count(
     return fig
 
 
+def _kernel_aggregate(data: pd.DataFrame, keys: List[str], value_column: str, aggregation: str) -> pd.DataFrame:
+    """Équivalent de groupby(keys)[value_column].<aggregation>() via le noyau bincount ('count' = taille des groupes)."""
+    if aggregation in ('mean', 'sum'):
+        return group_aggregate(data, keys, value_column, [aggregation])[aggregation].reset_index(name=value_column)
+    return group_aggregate(data, keys, aggregations=['size'])['size'].reset_index(name=value_column)
+
+
+def _cube_aggregate(cube: CubeView, keys: List[str], value_column: str, aggregation: str) -> pd.DataFrame:
+    """Lit dans le cube l'agrégat équivalent à groupby(keys)[value_column].<aggregation>()."""
+    measure = _CUBE_MEASURES.get(aggregation, 'size')
+    return cube.rollup(keys)[measure].reset_index(name=value_column)
+
+
 def create_yearly_comparison(
     data: pd.DataFrame,
     years: Optional[List[int]] = None,
     metric: str = 'COVERAGE',
-    title: Optional[str] = None
+    title: Optional[str] = None,
+    cube: Optional[CubeView] = None
 ) -> go.Figure:
     """
     Crée un graphique de comparaison entre différentes années.
@@ -102,6 +117,8 @@ def create_yearly_comparison(
         years: Liste d'années à comparer (None = toutes)
         metric: Métrique à comparer
         title: Titre personnalisé (optionnel)
+        cube: Vue filtrée du cube d'agrégats (optionnel). Si fournie, les
+            moyennes annuelles sont lues dans le cube
         
     Returns:
         Figure Plotly avec le graphique de comparaison
@@ -113,12 +130,18 @@ def create_yearly_comparison(
             x=0.5, y=0.5, showarrow=False
         )
     
-    # Filtrer par années si spécifié
-    if years:
-        data = data[data['YEAR'].isin(years)]
-    
-    # Calculer les moyennes par année
-    yearly_data = data.groupby('YEAR')[metric].mean().reset_index()
+    if cube is not None and cube.supports(['YEAR'], metric):
+        # Moyennes par année lues dans le cube, puis filtre sur les années
+        yearly_data = cube.rollup(['YEAR'])['mean'].reset_index(name=metric)
+        if years:
+            yearly_data = yearly_data[yearly_data['YEAR'].isin(years)]
+    else:
+        # Filtrer par années si spécifié
+        if years:
+            data = data[data['YEAR'].isin(years)]
+        
+        # Calculer les moyennes par année
+        yearly_data = data.groupby('YEAR', observed=True)[metric].mean().reset_index()
     
     fig = go.Figure(data=[go.Bar(
         x=yearly_data['YEAR'],
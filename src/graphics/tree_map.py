@@ -8,6 +8,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 
 from config import PLOTLY_TEMPLATE, COLOR_PALETTE
+from src.utils.cube import CubeView
 
 
 def create_tree_map(
@@ -111,7 +112,8 @@ def create_hierarchical_bar(
     subcategory_column: str,
     value_column: str = 'COVERAGE',
     top_n: int = 10,
-    title: Optional[str] = None
+    title: Optional[str] = None,
+    cube: Optional[CubeView] = None
 ) -> go.Figure:
     """
     Crée un graphique en barres groupées pour montrer une hiérarchie.
@@ -123,6 +125,8 @@ def create_hierarchical_bar(
         value_column: Colonne des valeurs
         top_n: Nombre de catégories principales à afficher
         title: Titre personnalisé (optionnel)
+        cube: Vue filtrée du cube d'agrégats (optionnel). Si fournie, les
+            moyennes par (catégorie, sous-catégorie) sont lues dans le cube
         
     Returns:
         Figure Plotly avec le graphique en barres groupées
@@ -138,10 +142,14 @@ def create_hierarchical_bar(
         )
     
     # Agréger les données
-    grouped_data = data.groupby([category_column, subcategory_column])[value_column].mean().reset_index()
+    keys = [category_column, subcategory_column]
+    if cube is not None and cube.supports(keys, value_column):
+        grouped_data = cube.rollup(keys)['mean'].reset_index(name=value_column)
+    else:
+        grouped_data = data.groupby(keys, observed=True)[value_column].mean().reset_index()
     
     # Filtrer les top N catégories
-    top_categories = grouped_data.groupby(category_column)[value_column].mean().nlargest(top_n).index
+    top_categories = grouped_data.groupby(category_column, observed=True)[value_column].mean().nlargest(top_n).index
     grouped_data = grouped_data[grouped_data[category_column].isin(top_categories)]
     
     default_title = f'{category_column} par {subcategory_column} (Top {top_n})'
@@ -1,10 +1,34 @@
-from dash import html, dcc, Input, Output
+import atexit
+import json
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from dash import html, dcc, Input, Output, ctx, no_update
+from dash.exceptions import PreventUpdate
+from flask import jsonify
 from dash.dash_table import DataTable
 import pandas as pd
 import plotly.graph_objects as go
 
-from config import PLOTLY_CONFIG
+from config import (
+    PLOTLY_TEMPLATE, COLOR_PALETTE, PLOTLY_CONFIG, FILTER_CACHE_MAX_SIZE, HISTOGRAM_SERVER_BINNING, BOXPLOT_PRECOMPUTED_STATS,
+    HOME_CALLBACK_MODE, HOME_CALLBACK_WORKERS, LOG_CALLBACK_TIMINGS, CLIENTSIDE_GRAPH_SWITCH,
+    FIGURE_CACHE_ENABLED, FIGURE_CACHE_PATH, FIGURE_CACHE_MAX_BYTES, FIGURE_CACHE_MAX_AGE,
+    FIGURE_CACHE_MEMORY_SIZE, QUERY_STATS_ENABLED, QUERY_STATS_PATH, PREWARM_TOP_K, TABLE_PAGE_SIZE,
+    FIGURE_SERIALIZER
+)
 from src.utils.get_data import get_filtered_data
+from src.utils.data_index import build_data_index
+from src.utils.cache import LRUCache, make_filter_key
+from src.utils.cube import CubeView, build_coverage_cube
+from src.utils.data_registry import DataRegistry, DatasetVersion
+from src.utils.figure_cache import FigureCache, compute_dataset_version, compute_render_version, make_figure_key
+from src.utils.query_stats import QueryCounter
+from src.utils.serialization import SerializationStats, compact_figure
+from src.utils.table_query import get_table_page, select_table_rows
+from src.utils.warmup import prewarm_in_background, warm_figures
 from src.graphics import (
     create_country_details,
     create_pie_chart,
@@ -119,7 +143,9 @@ def create_home_layout(data: pd.DataFrame) -> html.Div:
                     dcc.Graph(
                         id='exploration-graph-1',
                         config=PLOTLY_CONFIG  # type: ignore
-                    )
+                    ),
+                    # Variantes pré-calculées du graphique (bascule côté client)
+                    dcc.Store(id='exploration-store-1')
                 ], className='card graph-container')
             ], className='col'),
             
@@ -150,7 +176,9 @@ def create_home_layout(data: pd.DataFrame) -> html.Div:
                     dcc.Graph(
                         id='exploration-graph-2',
                         config=PLOTLY_CONFIG  # type: ignore
-                    )
+                    ),
+                    # Variantes pré-calculées du graphique (bascule côté client)
+                    dcc.Store(id='exploration-store-2')
                 ], className='card graph-container')
             ], className='col'),
         ], className='row'),
@@ -159,11 +187,27 @@ def create_home_layout(data: pd.DataFrame) -> html.Div:
         html.Div([
             html.Div([
                 html.H3("Aperçu des données", className='card-title'),
-                html.P(f"Affichage des {min(10, len(data))} premières lignes"),
+                html.P(id='data-table-info'),
                 html.Div([
+                    # Pagination, tri et filtre calculés côté serveur (une page par réponse)
                     DataTable(
-                        data=data.head(10).to_dict('records'),  # type: ignore
-                        columns=[{"name": col, "id": col} for col in data.columns],
+                        id='data-table',
+                        data=[],  # type: ignore
+                        columns=[
+                            {
+                                "name": col,
+                                "id": col,
+                                "type": 'numeric' if pd.api.types.is_numeric_dtype(data[col]) else 'text'
+                            } for col in data.columns
+                        ],
+                        page_current=0,
+                        page_size=TABLE_PAGE_SIZE,
+                        page_action='custom',
+                        sort_action='custom',
+                        sort_mode='multi',
+                        sort_by=[],
+                        filter_action='custom',
+                        filter_query='',
                         style_table={
                             'overflowX': 'auto',
                             'maxWidth': '100%',
@@ -208,12 +252,6 @@ def create_home_layout(data: pd.DataFrame) -> html.Div:
                                 'backgroundColor': '#ecf0f1',
                             }
                         ],
-                        tooltip_data=[  # type: ignore
-                            {
-                                column: {'value': str(value), 'type': 'markdown'}
-                                for column, value in row.items()
-                            } for row in data.head(10).to_dict('records')
-                        ],
                         tooltip_duration=None,
                     )
                 ], className='table-container')
@@ -223,143 +261,562 @@ def create_home_layout(data: pd.DataFrame) -> html.Div:
     ], className='home-page')
 
 
-def register_callbacks(app, data: pd.DataFrame) -> None:
-    """Enregistre tous les callbacks pour les graphiques hybrides (fixes + dynamiques)."""
+def parse_global_filters(year_filter: str, country_filter: str, antigen_filter: str, category_filter: str) -> tuple:
+    """
+    Convertit les valeurs des filtres globaux de la sidebar en clé normalisée.
     
-    # callback - Pays par Couverture
+    Args:
+        year_filter: Valeur du filtre année ('all' ou année)
+        country_filter: Valeur du filtre pays ('all' ou nom)
+        antigen_filter: Valeur du filtre antigène ('all' ou code)
+        category_filter: Valeur du filtre catégorie ('all' ou code)
+        
+    Returns:
+        Tuple (year, country, antigen, coverage_category), None pour 'all'
+    """
+    return make_filter_key(
+        year=int(year_filter) if year_filter != 'all' else None,
+        country=country_filter if country_filter != 'all' else None,
+        antigen=antigen_filter if antigen_filter != 'all' else None,
+        coverage_category=category_filter if category_filter != 'all' else None
+    )
+
+
+# Types proposés par les menus déroulants des graphiques d'exploration
+EXPLORATION_1_TYPES = ('histogram', 'boxplot')
+EXPLORATION_2_TYPES = ('pie', 'treemap')
+
+# Sélection côté navigateur de la variante stockée correspondant au type choisi
+SELECT_GRAPH_VARIANT_JS = """
+function(graphType, variants) {
+    if (!variants || !(graphType in variants)) {
+        return window.dash_clientside.no_update;
+    }
+    return variants[graphType];
+}
+"""
+
+
+def _message_figure(text: str) -> go.Figure:
+    """Figure vide portant un message centré (aucune donnée, type inconnu...)."""
+    return go.Figure().add_annotation(
+        text=text,
+        xref="paper", yref="paper",
+        x=0.5, y=0.5, showarrow=False
+    )
+
+
+def build_country_details_figure(data: pd.DataFrame, cube_view: CubeView) -> go.Figure:
+    """
+    Construit le graphique des pays par couverture (fixe).
+    
+    Args:
+        data: DataFrame complet (non filtré)
+        cube_view: Vue du cube restreinte aux filtres globaux
+        
+    Returns:
+        Figure Plotly
+    """
+    if cube_view.is_empty:
+        return _message_figure("Aucune donnée disponible")
+    
+    # Agrégats lus dans le cube : pas de filtrage des lignes brutes
+    return create_country_details(data, top_n=10, cube=cube_view)
+
+
+def build_timed_count_figure(data: pd.DataFrame, cube_view: CubeView) -> go.Figure:
+    """
+    Construit le graphique d'évolution temporelle (fixe).
+    
+    Args:
+        data: DataFrame complet (non filtré)
+        cube_view: Vue du cube restreinte aux filtres globaux
+        
+    Returns:
+        Figure Plotly
+    """
+    if cube_view.is_empty:
+        return _message_figure("Aucune donnée disponible")
+    
+    # Agrégats lus dans le cube : pas de filtrage des lignes brutes
+    return create_timed_count(data, time_column='YEAR', value_column='COVERAGE', cube=cube_view)
+
+
+def build_exploration_1_figure(filtered_data: pd.DataFrame, graph_type: str) -> go.Figure:
+    """
+    Construit le graphique d'exploration 1 (Distribution : Histogram ou Boxplot).
+    
+    Args:
+        filtered_data: Données filtrées par les filtres globaux
+        graph_type: Type de graphique sélectionné
+        
+    Returns:
+        Figure Plotly
+    """
+    if filtered_data.empty:
+        return _message_figure("Aucune donnée disponible")
+    
+    if graph_type == 'histogram':
+        return create_statistics_histogram(filtered_data, column='COVERAGE', nbins=20, server_binning=HISTOGRAM_SERVER_BINNING)
+    elif graph_type == 'boxplot':
+        return create_statistics_boxplot(
+            filtered_data, column='COVERAGE', group_by='COVERAGE_CATEGORY',
+            precomputed_stats=BOXPLOT_PRECOMPUTED_STATS
+        )
+    else:
+        return _message_figure("Type de graphique non reconnu")
+
+
+def build_exploration_2_figure(filtered_data: pd.DataFrame, graph_type: str) -> go.Figure:
+    """
+    Construit le graphique d'exploration 2 (Composition : Pie Chart ou TreeMap).
+    
+    Args:
+        filtered_data: Données filtrées par les filtres globaux
+        graph_type: Type de graphique sélectionné
+        
+    Returns:
+        Figure Plotly
+    """
+    if filtered_data.empty:
+        return _message_figure("Aucune donnée disponible")
+    
+    if graph_type == 'pie':
+        return create_pie_chart(filtered_data, column='COVERAGE_CATEGORY')
+    elif graph_type == 'treemap':
+        return create_tree_map(filtered_data, path=['GROUP', 'ANTIGEN'], values='COVERAGE')
+    else:
+        return _message_figure("Type de graphique non reconnu")
+
+
+def build_exploration_1_variants(filtered_data: pd.DataFrame) -> Dict[str, go.Figure]:
+    """Construit le graphique d'exploration 1 pour chaque type sélectionnable."""
+    return {graph_type: build_exploration_1_figure(filtered_data, graph_type) for graph_type in EXPLORATION_1_TYPES}
+
+
+def build_exploration_2_variants(filtered_data: pd.DataFrame) -> Dict[str, go.Figure]:
+    """Construit le graphique d'exploration 2 pour chaque type sélectionnable."""
+    return {graph_type: build_exploration_2_figure(filtered_data, graph_type) for graph_type in EXPLORATION_2_TYPES}
+
+
+def _timed(build: Callable[..., Any], *args: Any) -> Tuple[Any, float]:
+    """Exécute `build(*args)` et retourne (résultat, durée en ms)."""
+    start = time.perf_counter()
+    result = build(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def _log_timings(mode: str, timings: Dict[str, float]) -> None:
+    """Affiche les durées de construction des figures d'un callback."""
+    if LOG_CALLBACK_TIMINGS:
+        details = " | ".join(f"{name}: {ms:.1f} ms" for name, ms in timings.items())
+        print(f"⏱️  home[{mode}] {details}")
+
+
+def _log_payloads(mode: str, serialization_stats: SerializationStats, outputs: Dict[str, Any]) -> None:
+    """Mesure et affiche la taille et le temps d'encodage JSON des figures renvoyées."""
+    if LOG_CALLBACK_TIMINGS:
+        measures = {name: serialization_stats.measure(name, output) for name, output in outputs.items()}
+        details = " | ".join(
+            f"{name}: {measure['bytes'] / 1024:.1f} Ko en {measure['encode_ms']:.1f} ms"
+            for name, measure in measures.items()
+        )
+        print(f"📦 home[{mode}] {details}")
+
+
+GLOBAL_FILTER_INPUTS = [
+    Input('global-year-filter', 'value'),
+    Input('global-country-filter', 'value'),
+    Input('global-antigen-filter', 'value'),
+    Input('global-category-filter', 'value')
+]
+
+# Réglages qui changent le contenu d'une figure sans changer les données :
+# inclus dans la clé du cache disque, qui survit aux redémarrages
+RENDER_VERSION = compute_render_version({
+    'serializer': FIGURE_SERIALIZER,
+    'template': PLOTLY_TEMPLATE,
+    'palette': COLOR_PALETTE,
+    'histogram_server_binning': HISTOGRAM_SERVER_BINNING,
+    'boxplot_precomputed_stats': BOXPLOT_PRECOMPUTED_STATS,
+})
+
+
+class HomeFigures:
+    """
+    Construction et mise en cache des figures de la page d'accueil.
+    
+    Regroupe les structures construites une seule fois au chargement (index
+    inversé, cube d'agrégats, caches) et expose une seule porte d'entrée par
+    figure, utilisée par les callbacks comme par le préchauffage du cache.
+    
+    Attributes:
+        data: DataFrame complet
+        index: Index inversé des filtres
+        cube: Cube d'agrégats de couverture
+        filter_cache: Cache LRU des données filtrées
+        table_cache: Cache LRU des positions ordonnées du tableau
+        dataset_version: Empreinte du jeu de données (clé des figures)
+        figure_cache: Cache de figures partagé (None si désactivé)
+    """
+    
+    FIGURES = ('country_details', 'timed_count', 'exploration_1', 'exploration_2')
+    
+    def __init__(
+        self,
+        data: pd.DataFrame,
+        figure_cache: Optional[FigureCache] = None,
+        dataset_version: Optional[str] = None
+    ) -> None:
+        self.data = data
+        # Index inversé des filtres, construit une seule fois au chargement
+        self.index = build_data_index(data)
+        # Cube d'agrégats de couverture, construit une seule fois au chargement
+        self.cube = build_coverage_cube(data)
+        # Cache des données filtrées, partagé par les callbacks
+        self.filter_cache = LRUCache(maxsize=FILTER_CACHE_MAX_SIZE)
+        # Positions ordonnées des lignes du tableau, par (filtres globaux, filtre, tri)
+        self.table_cache = LRUCache(maxsize=FILTER_CACHE_MAX_SIZE)
+        self.dataset_version = dataset_version or compute_dataset_version(data)
+        self.figure_cache = figure_cache
+    
+    def filtered_data(self, filters: tuple) -> pd.DataFrame:
+        """Filtre les données une seule fois par combinaison de filtres globaux."""
+        return self.filter_cache.get_or_compute(
+            filters,
+            lambda: get_filtered_data(self.data, *filters, index=self.index)
+        )
+    
+    def build(self, name: str, filters: tuple, graph_type: Optional[str] = None) -> Any:
+        """
+        Construit une figure sans passer par le cache de figures.
+        
+        Args:
+            name: Figure parmi HomeFigures.FIGURES
+            filters: Clé normalisée des filtres globaux (parse_global_filters)
+            graph_type: Type des graphiques d'exploration ; None construit
+                toutes les variantes (bascule côté client)
+                
+        Returns:
+            Figure Plotly, ou dictionnaire type → figure pour les variantes
+        """
+        if name == 'country_details':
+            return build_country_details_figure(self.data, self.cube.where(*filters))
+        if name == 'timed_count':
+            return build_timed_count_figure(self.data, self.cube.where(*filters))
+        if name == 'exploration_1':
+            filtered_data = self.filtered_data(filters)
+            if graph_type is None:
+                return build_exploration_1_variants(filtered_data)
+            return build_exploration_1_figure(filtered_data, graph_type)
+        if name == 'exploration_2':
+            filtered_data = self.filtered_data(filters)
+            if graph_type is None:
+                return build_exploration_2_variants(filtered_data)
+            return build_exploration_2_figure(filtered_data, graph_type)
+        raise ValueError(f"Figure inconnue: {name}")
+    
+    def get(self, name: str, filters: tuple, graph_type: Optional[str] = None) -> Any:
+        """Retourne la figure depuis le cache de figures, ou la construit (mêmes arguments que build)."""
+        def build() -> Any:
+            figure = self.build(name, filters, graph_type)
+            return compact_figure(figure) if FIGURE_SERIALIZER == 'compact' else figure
+        
+        if self.figure_cache is None:
+            return build()
+        callback_id = name if graph_type is None else f'{name}:{graph_type}'
+        return self.figure_cache.get_or_compute(
+            make_figure_key(callback_id, filters, self.dataset_version, RENDER_VERSION),
+            build
+        )
+    
+    def stats(self) -> Dict[str, Any]:
+        """Statistiques des caches (données filtrées et figures)."""
+        return {
+            'dataset_version': self.dataset_version,
+            'render_version': RENDER_VERSION,
+            'filtered_data': self.filter_cache.stats(),
+            'figures': self.figure_cache.stats() if self.figure_cache is not None else None,
+        }
+
+
+def create_figure_cache() -> Optional[FigureCache]:
+    """Crée le cache de figures configuré dans config.py (None si désactivé)."""
+    if not FIGURE_CACHE_ENABLED:
+        return None
+    return FigureCache(
+        FIGURE_CACHE_PATH,
+        max_bytes=FIGURE_CACHE_MAX_BYTES,
+        max_age=FIGURE_CACHE_MAX_AGE,
+        memory_size=FIGURE_CACHE_MEMORY_SIZE
+    )
+
+
+def register_callbacks(app, registry: DataRegistry) -> None:
+    """
+    Enregistre tous les callbacks pour les graphiques hybrides (fixes + dynamiques).
+    
+    Selon HOME_CALLBACK_MODE : 'split' enregistre un callback par graphique,
+    'consolidated' un seul callback à quatre sorties qui filtre une fois et
+    construit les quatre figures, en parallèle seulement si
+    HOME_CALLBACK_WORKERS > 1 (par défaut, l'une après l'autre).
+    
+    Avec CLIENTSIDE_GRAPH_SWITCH, les graphiques d'exploration ne dépendent
+    plus que des filtres : toutes leurs variantes sont calculées côté serveur
+    dans un dcc.Store, et le changement de type est résolu dans le navigateur.
+    
+    Les figures sont construites par version du jeu de données (structure
+    'home_figures' du registre) : chaque callback lit la version courante une
+    seule fois, et un rechargement à chaud ne l'interrompt pas.
+    
+    Les statistiques des caches sont exposées en JSON sur /_cache/stats.
+    Chaque combinaison de filtres reçue est comptée (QUERY_STATS_ENABLED) et
+    les PREWARM_TOP_K plus fréquentes sont préchauffées au chargement, puis
+    sur chaque nouvelle version avant qu'elle ne soit servie.
+    
+    Args:
+        app: Instance de l'application Dash
+        registry: Registre du jeu de données servi
+    """
+    if HOME_CALLBACK_MODE not in ('split', 'consolidated'):
+        raise ValueError(f"HOME_CALLBACK_MODE inconnu: {HOME_CALLBACK_MODE}")
+    
+    figure_cache = create_figure_cache()
+    registry.derive(
+        'home_figures',
+        lambda version: HomeFigures(version.data, figure_cache=figure_cache, dataset_version=version.version)
+    )
+    
+    def current_figures() -> HomeFigures:
+        """Figures de la version servie (à lire une seule fois par callback)."""
+        version = registry.current()
+        if version is None:
+            # Démarrage rapide : données pas encore chargées
+            raise PreventUpdate
+        return version.get('home_figures')
+    
+    # Taille et temps d'encodage des réponses (mesurés si LOG_CALLBACK_TIMINGS)
+    serialization_stats = SerializationStats()
+    
+    def cache_stats():
+        """Statistiques du jeu de données servi et des caches, en JSON."""
+        version = registry.current()
+        figures_stats = version.get('home_figures').stats() if version is not None else {}
+        return jsonify({'dataset': registry.stats(), **figures_stats, 'serialization': serialization_stats.stats()})
+    
+    app.server.add_url_rule('/_cache/stats', 'home_cache_stats', cache_stats)
+    
+    query_counter = QueryCounter(QUERY_STATS_PATH) if QUERY_STATS_ENABLED else None
+    if query_counter is not None:
+        atexit.register(query_counter.flush)
+        if figure_cache is not None:
+            # Nouvelle version : combinaisons chaudes construites avant d'être servie
+            registry.before_swap(
+                lambda version: warm_figures(
+                    version.get('home_figures'),
+                    [state for state, _ in query_counter.top(PREWARM_TOP_K)],
+                    pause=registry.pause
+                )
+            )
+    
+    def on_ready(version: DatasetVersion) -> None:
+        """Publie la première version et préchauffe ses combinaisons chaudes."""
+        # Version servie, utilisée pour l'ETag du layout (src/app/http.py)
+        app.server.config['DATASET_VERSION'] = version.version
+        if query_counter is not None and figure_cache is not None:
+            # Conservé pour être attendu avant un fork (src/app/serve.py)
+            app.server.extensions['figure_prewarm'] = prewarm_in_background(
+                version.get('home_figures'), query_counter, PREWARM_TOP_K
+            )
+    
+    registry.when_ready(on_ready)
+    
+    def on_swap(version: DatasetVersion, previous: DatasetVersion) -> None:
+        """Publie la nouvelle version et oublie les figures de l'ancienne."""
+        app.server.config['DATASET_VERSION'] = version.version
+        if figure_cache is not None:
+            figure_cache.forget_version(previous.version)
+    
+    registry.after_swap(on_swap)
+    
+    def record_query(filters: tuple) -> None:
+        """Compte une combinaison de filtres reçue (une fois par changement de filtre)."""
+        if query_counter is not None:
+            query_counter.record(filters)
+    
+    # callback - Tableau de données (pagination, tri et filtre côté serveur)
     @app.callback(
-        Output('country-details-graph', 'figure'),
         [
-            Input('global-year-filter', 'value'),
-            Input('global-country-filter', 'value'),
-            Input('global-antigen-filter', 'value'),
-            Input('global-category-filter', 'value')
-        ]
+            Output('data-table', 'data'),
+            Output('data-table', 'tooltip_data'),
+            Output('data-table', 'page_count'),
+            Output('data-table', 'page_current'),
+            Output('data-table-info', 'children')
+        ],
+        [
+            Input('data-table', 'page_current'),
+            Input('data-table', 'page_size'),
+            Input('data-table', 'sort_by'),
+            Input('data-table', 'filter_query')
+        ] + GLOBAL_FILTER_INPUTS
     )
-    def update_country_details(year_filter: str, country_filter: str, antigen_filter: str, category_filter: str) -> go.Figure:
-        """Met à jour le graphique des pays par couverture (fixe)."""
-        filtered_data = get_filtered_data(
-            data=data,
-            year=int(year_filter) if year_filter != 'all' else None,
-            country=country_filter if country_filter != 'all' else None,
-            antigen=antigen_filter if antigen_filter != 'all' else None,
-            coverage_category=category_filter if category_filter != 'all' else None
+    def update_data_table(page_current: int, page_size: int, sort_by: list, filter_query: str, year_filter: str, country_filter: str, antigen_filter: str, category_filter: str) -> tuple:
+        """Retourne la page demandée du tableau, ses infobulles et le nombre de pages."""
+        figures = current_figures()
+        filters = parse_global_filters(year_filter, country_filter, antigen_filter, category_filter)
+        filtered_data = figures.filtered_data(filters)
+        key = (filters, filter_query or '', json.dumps(sort_by or [], sort_keys=True))
+        positions = figures.table_cache.get_or_compute(
+            key,
+            lambda: select_table_rows(filtered_data, filter_query, sort_by)
         )
         
-        if filtered_data.empty:
-            return go.Figure().add_annotation(
-                text="Aucune donnée disponible",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
+        page_size = page_size or TABLE_PAGE_SIZE
+        page_count = max(1, math.ceil(len(positions) / page_size))
+        # Un changement de filtre peut rendre la page courante hors limites
+        page_current = min(page_current or 0, page_count - 1)
+        records, tooltips = get_table_page(filtered_data, positions, page_current, page_size)
+        info = f"{len(positions)} lignes sur {len(figures.data)} — page {page_current + 1}/{page_count}"
+        return records, tooltips, page_count, page_current, info
+    
+    if CLIENTSIDE_GRAPH_SWITCH:
+        for number in (1, 2):
+            app.clientside_callback(
+                SELECT_GRAPH_VARIANT_JS,
+                Output(f'exploration-graph-{number}', 'figure'),
+                Input(f'graph-type-{number}', 'value'),
+                Input(f'exploration-store-{number}', 'data')
             )
+    
+    if HOME_CALLBACK_MODE == 'consolidated':
+        executor = ThreadPoolExecutor(
+            max_workers=HOME_CALLBACK_WORKERS,
+            thread_name_prefix='home-figures'
+        ) if HOME_CALLBACK_WORKERS > 1 else None
+        
+        if CLIENTSIDE_GRAPH_SWITCH:
+            exploration_outputs = [Output('exploration-store-1', 'data'), Output('exploration-store-2', 'data')]
+            graph_type_inputs = []
+        else:
+            exploration_outputs = [Output('exploration-graph-1', 'figure'), Output('exploration-graph-2', 'figure')]
+            graph_type_inputs = [Input('graph-type-1', 'value'), Input('graph-type-2', 'value')]
+        
+        @app.callback(
+            [
+                Output('country-details-graph', 'figure'),
+                Output('timed-count-graph', 'figure')
+            ] + exploration_outputs,
+            graph_type_inputs + GLOBAL_FILTER_INPUTS
+        )
+        def update_home_figures(*values: str) -> tuple:
+            """Met à jour les quatre graphiques en un seul aller-retour."""
+            start = time.perf_counter()
+            figures = current_figures()
+            if CLIENTSIDE_GRAPH_SWITCH:
+                graph_types = {}
+                filters = parse_global_filters(*values)
+            else:
+                graph_types = {'exploration_1': values[0], 'exploration_2': values[1]}
+                filters = parse_global_filters(*values[2:])
+            
+            # Un changement de type de graphique ne concerne qu'une seule sortie
+            targets = {
+                'graph-type-1': ['exploration_1'],
+                'graph-type-2': ['exploration_2'],
+            }.get(ctx.triggered_id, list(HomeFigures.FIGURES))
+            
+            if 'country_details' in targets:
+                record_query(filters)
+            
+            timings: Dict[str, float] = {}
+            if 'exploration_1' in targets or 'exploration_2' in targets:
+                _, timings['filtre'] = _timed(figures.filtered_data, filters)
+            
+            if executor is not None and len(targets) > 1:
+                futures = {
+                    name: executor.submit(_timed, figures.get, name, filters, graph_types.get(name))
+                    for name in targets
+                }
+                results = {name: future.result() for name, future in futures.items()}
+            else:
+                results = {name: _timed(figures.get, name, filters, graph_types.get(name)) for name in targets}
+            
+            outputs = []
+            for name in HomeFigures.FIGURES:
+                if name in results:
+                    figure, timings[name] = results[name]
+                    outputs.append(figure)
+                else:
+                    outputs.append(no_update)
+            
+            timings['total'] = (time.perf_counter() - start) * 1000
+            _log_timings('consolidated', timings)
+            _log_payloads('consolidated', serialization_stats, {name: figure for name, (figure, _) in results.items()})
+            return tuple(outputs)
         
-        return create_country_details(filtered_data, top_n=10)
+        return
+    
+    def update_figure(name: str, filter_values: tuple, graph_type: Optional[str] = None) -> Any:
+        """Construit une figure du mode 'split' et journalise sa durée."""
+        figure, elapsed = _timed(current_figures().get, name, parse_global_filters(*filter_values), graph_type)
+        _log_timings('split', {name: elapsed})
+        _log_payloads('split', serialization_stats, {name: figure})
+        return figure
+    
+    # callback - Pays par Couverture
+    @app.callback(
+        Output('country-details-graph', 'figure'),
+        GLOBAL_FILTER_INPUTS
+    )
+    def update_country_details(year_filter: str, country_filter: str, antigen_filter: str, category_filter: str) -> go.Figure:
+        """Met à jour le graphique des pays par couverture (fixe)."""
+        # Ce callback est déclenché par tout changement de filtre, et seulement par eux
+        record_query(parse_global_filters(year_filter, country_filter, antigen_filter, category_filter))
+        return update_figure('country_details', (year_filter, country_filter, antigen_filter, category_filter))
     
     # Évolution Temporelle
     @app.callback(
         Output('timed-count-graph', 'figure'),
-        [
-            Input('global-year-filter', 'value'),
-            Input('global-country-filter', 'value'),
-            Input('global-antigen-filter', 'value'),
-            Input('global-category-filter', 'value')
-        ]
+        GLOBAL_FILTER_INPUTS
     )
     def update_timed_count(year_filter: str, country_filter: str, antigen_filter: str, category_filter: str) -> go.Figure:
         """Met à jour le graphique d'évolution temporelle (fixe)."""
-        filtered_data = get_filtered_data(
-            data=data,
-            year=int(year_filter) if year_filter != 'all' else None,
-            country=country_filter if country_filter != 'all' else None,
-            antigen=antigen_filter if antigen_filter != 'all' else None,
-            coverage_category=category_filter if category_filter != 'all' else None
+        return update_figure('timed_count', (year_filter, country_filter, antigen_filter, category_filter))
+    
+    if CLIENTSIDE_GRAPH_SWITCH:
+        # Variantes des graphiques d'exploration : recalculées sur changement de filtre uniquement
+        @app.callback(
+            Output('exploration-store-1', 'data'),
+            GLOBAL_FILTER_INPUTS
         )
+        def update_exploration_store_1(year_filter: str, country_filter: str, antigen_filter: str, category_filter: str) -> Dict[str, go.Figure]:
+            """Calcule toutes les variantes du graphique d'exploration 1 (Distribution)."""
+            return update_figure('exploration_1', (year_filter, country_filter, antigen_filter, category_filter))
         
-        if filtered_data.empty:
-            return go.Figure().add_annotation(
-                text="Aucune donnée disponible",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
+        @app.callback(
+            Output('exploration-store-2', 'data'),
+            GLOBAL_FILTER_INPUTS
+        )
+        def update_exploration_store_2(year_filter: str, country_filter: str, antigen_filter: str, category_filter: str) -> Dict[str, go.Figure]:
+            """Calcule toutes les variantes du graphique d'exploration 2 (Composition)."""
+            return update_figure('exploration_2', (year_filter, country_filter, antigen_filter, category_filter))
         
-        return create_timed_count(filtered_data, time_column='YEAR', value_column='COVERAGE')
+        return
     
     # callback - Graphique d'Exploration 1
     @app.callback(
         Output('exploration-graph-1', 'figure'),
-        [
-            Input('graph-type-1', 'value'),
-            Input('global-year-filter', 'value'),
-            Input('global-country-filter', 'value'),
-            Input('global-antigen-filter', 'value'),
-            Input('global-category-filter', 'value')
-        ]
+        [Input('graph-type-1', 'value')] + GLOBAL_FILTER_INPUTS
     )
     def update_exploration_1(graph_type: str, year_filter: str, country_filter: str, antigen_filter: str, category_filter: str) -> go.Figure:
         """Met à jour le graphique d'exploration 1 (Distribution) selon le type sélectionné."""
-        filtered_data = get_filtered_data(
-            data=data,
-            year=int(year_filter) if year_filter != 'all' else None,
-            country=country_filter if country_filter != 'all' else None,
-            antigen=antigen_filter if antigen_filter != 'all' else None,
-            coverage_category=category_filter if category_filter != 'all' else None
-        )
-        
-        if filtered_data.empty:
-            return go.Figure().add_annotation(
-                text="Aucune donnée disponible",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-        
-        # callback - Graphique 1 : Distribution uniquement (Histogram ou Boxplot)
-        if graph_type == 'histogram':
-            return create_statistics_histogram(filtered_data, column='COVERAGE', nbins=20)
-        elif graph_type == 'boxplot':
-            return create_statistics_boxplot(filtered_data, column='COVERAGE', group_by='COVERAGE_CATEGORY')
-        else:
-            return go.Figure().add_annotation(
-                text="Type de graphique non reconnu",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
+        return update_figure('exploration_1', (year_filter, country_filter, antigen_filter, category_filter), graph_type)
     
     # callback - Graphique d'Exploration 2
     @app.callback(
         Output('exploration-graph-2', 'figure'),
-        [
-            Input('graph-type-2', 'value'),
-            Input('global-year-filter', 'value'),
-            Input('global-country-filter', 'value'),
-            Input('global-antigen-filter', 'value'),
-            Input('global-category-filter', 'value')
-        ]
+        [Input('graph-type-2', 'value')] + GLOBAL_FILTER_INPUTS
     )
     def update_exploration_2(graph_type: str, year_filter: str, country_filter: str, antigen_filter: str, category_filter: str) -> go.Figure:
         """Met à jour le graphique d'exploration 2 (Composition) selon le type sélectionné."""
-        filtered_data = get_filtered_data(
-            data=data,
-            year=int(year_filter) if year_filter != 'all' else None,
-            country=country_filter if country_filter != 'all' else None,
-            antigen=antigen_filter if antigen_filter != 'all' else None,
-            coverage_category=category_filter if category_filter != 'all' else None
-        )
-        
-        if filtered_data.empty:
-            return go.Figure().add_annotation(
-                text="Aucune donnée disponible",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
-        
-        # Graphique 2 : Composition uniquement (Pie Chart ou TreeMap)
-        if graph_type == 'pie':
-            return create_pie_chart(filtered_data, column='COVERAGE_CATEGORY')
-        elif graph_type == 'treemap':
-            return create_tree_map(filtered_data, path=['GROUP', 'ANTIGEN'], values='COVERAGE')
-        else:
-            return go.Figure().add_annotation(
-                text="Type de graphique non reconnu",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5, showarrow=False
-            )
+        return update_figure('exploration_2', (year_filter, country_filter, antigen_filter, category_filter), graph_type)
@@ -0,0 +1,197 @@
+"""
+Cache LRU borné et thread-safe.
+
+Utilisé pour partager entre callbacks des résultats coûteux (DataFrames
+filtrés, figures...) indexés par une clé normalisée.
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Cache LRU borné, sûr sous un serveur Flask multi-threadé.
+
+    Les calculs concurrents d'une même clé absente sont fusionnés : le
+    premier thread calcule la valeur, les suivants attendent son résultat au
+    lieu de refaire le calcul (cas typique : plusieurs callbacks déclenchés
+    par le même changement de filtre).
+
+    Attributes:
+        maxsize: Nombre maximal d'entrées conservées
+        hits: Nombre de lectures servies depuis le cache
+        misses: Nombre de lectures ayant nécessité un calcul
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize doit être >= 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._pending: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Lit une entrée sans la calculer.
+
+        Args:
+            key: Clé recherchée
+            default: Valeur retournée si la clé est absente
+
+        Returns:
+            Valeur en cache ou `default`
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Insère ou remplace une entrée, en évinçant la moins récemment utilisée.
+
+        Args:
+            key: Clé de l'entrée
+            value: Valeur à stocker
+        """
+        with self._lock:
+            self._store(key, value)
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Retourne la valeur en cache, ou la calcule une seule fois si absente.
+
+        Args:
+            key: Clé normalisée
+            compute: Fonction sans argument produisant la valeur
+
+        Returns:
+            Valeur associée à la clé
+
+        Raises:
+            Exception: Toute exception levée par `compute` (rien n'est mis en cache)
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            pending = self._pending.get(key)
+            if pending is None:
+                self.misses += 1
+                pending = Future()
+                self._pending[key] = pending
+                owner = True
+            else:
+                self.hits += 1
+                owner = False
+
+        if not owner:
+            return pending.result()
+
+        try:
+            value = compute()
+        except BaseException as error:
+            with self._lock:
+                del self._pending[key]
+            pending.set_exception(error)
+            raise
+
+        with self._lock:
+            self._store(key, value)
+            del self._pending[key]
+        pending.set_result(value)
+        return value
+
+    def discard(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        Retire les entrées dont la clé vérifie un prédicat.
+
+        Args:
+            predicate: Fonction clé → bool
+
+        Returns:
+            Nombre d'entrées retirées
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Vide le cache (les compteurs sont conservés)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retourne les statistiques d'utilisation du cache.
+
+        Returns:
+            Dictionnaire {hits, misses, hit_rate, size, maxsize}
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        """Insère une entrée (verrou déjà acquis)."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+def make_filter_key(
+    year: Optional[int],
+    country: Optional[str],
+    antigen: Optional[str],
+    coverage_category: Optional[str]
+) -> tuple:
+    """
+    Construit la clé normalisée d'un jeu de filtres.
+
+    "Toutes" pour la catégorie est équivalent à l'absence de filtre, comme
+    dans get_filtered_data.
+
+    Args:
+        year: Année filtrée (ou None)
+        country: Pays filtré (ou None)
+        antigen: Antigène filtré (ou None)
+        coverage_category: Catégorie filtrée (ou None)
+
+    Returns:
+        Tuple (year, country, antigen, coverage_category)
+    """
+    if coverage_category == "Toutes":
+        coverage_category = None
+    return (
+        int(year) if year is not None else None,
+        country,
+        antigen,
+        coverage_category,
+    )
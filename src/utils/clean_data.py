@@ -3,37 +3,286 @@ Module de nettoyage des données de vaccination.
 
 Ce module transforme les données brutes (rawdata.csv) en données nettoyées (cleaneddata.csv)
 en appliquant plusieurs étapes de nettoyage et de validation.
+
+Trois modes produisent le même fichier :
+- en mémoire (clean_vaccination_data) : fichier brut chargé en entier ;
+- en flux (--stream) : par blocs, en mémoire bornée ;
+- incrémental (--incremental) : seuls les enregistrements nouveaux ou
+  modifiés depuis le dernier passage sont nettoyés (manifeste d'empreintes).
+
+En mémoire, l'entrée peut aussi être un dossier ou un motif glob de
+fichiers bruts (un par région ou par année) : les partitions sont nettoyées
+en parallèle puis fusionnées, dédoublonnées et triées ensemble.
+
+Le fichier produit est ensuite validé en une passe (src/utils/validation.py),
+par blocs en mode --stream ; le rapport est gardé à côté du fichier.
 """
 
-from typing import Optional
+import argparse
+import csv
+import glob
+import heapq
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 from pathlib import Path
 import pandas as pd
 import numpy as np
 
-from config import RAW_DATA_DIR, CLEANED_DATA_DIR
+from config import (
+    RAW_DATA_DIR,
+    CLEANED_DATA_DIR,
+    CLEAN_CHUNK_SIZE,
+    CLEAN_MERGE_FAN_IN,
+    CLEAN_MANIFEST_SUFFIX,
+    CLEAN_WORKERS,
+    CLEAN_TRACE_MEMORY,
+)
+from src.utils.pipeline import ColumnTransform, FrameStage, Pipeline, PipelineReport, RowFilter
+from src.utils.snapshot import compute_file_fingerprint
+from src.utils.validation import format_issues, validate_file, validate_frame
+
+
+# Colonnes et bornes des étapes de nettoyage
+CRITICAL_COLUMNS: List[str] = ['GROUP', 'CODE', 'NAME', 'YEAR', 'ANTIGEN', 'COVERAGE']
+TEXT_COLUMNS: List[str] = ['GROUP', 'CODE', 'NAME', 'ANTIGEN', 'COVERAGE_CATEGORY']
+DUPLICATE_COLUMNS: List[str] = ['CODE', 'NAME', 'YEAR', 'ANTIGEN', 'COVERAGE_CATEGORY']
+SORT_COLUMNS: List[str] = ['NAME', 'YEAR', 'ANTIGEN']
+MIN_YEAR: int = 1980
+MAX_YEAR: int = 2025
+
+
+def strip_text_values(series: pd.Series) -> pd.Series:
+    """
+    Supprime les espaces autour des textes d'une colonne (texte vide → valeur manquante).
+
+    Le nettoyage porte sur les valeurs distinctes, puis est reporté sur les
+    lignes par leurs codes : une seule passe sur la colonne.
+
+    Args:
+        series: Colonne texte
+
+    Returns:
+        Colonne nettoyée, de même index
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    stripped = pd.Series(uniques).astype(str).str.strip().replace('', np.nan)
+    return pd.Series(stripped.array.take(codes, allow_fill=True), index=series.index, name=series.name)
+
+
+def strip_text(data: pd.DataFrame) -> pd.DataFrame:
+    """Supprime les espaces autour des textes (texte vide → valeur manquante)."""
+    for col in TEXT_COLUMNS:
+        if col in data.columns:
+            data[col] = strip_text_values(data[col])
+    return data
+
+
+# Étapes ligne à ligne (1 à 5) : applicables bloc par bloc ou par partition
+ROW_PIPELINE = Pipeline([
+    RowFilter('valeurs_critiques', CRITICAL_COLUMNS, lambda data: data[CRITICAL_COLUMNS].notna().all(axis=1)),
+    ColumnTransform(
+        'types_numeriques', ['YEAR', 'COVERAGE'], ['YEAR', 'COVERAGE'],
+        lambda data: {column: pd.to_numeric(data[column], errors='coerce') for column in ('YEAR', 'COVERAGE')}
+    ),
+    RowFilter('types_valides', ['YEAR', 'COVERAGE'], lambda data: data['YEAR'].notna() & data['COVERAGE'].notna()),
+    # Année tronquée comme par la conversion entière qui suit (2025.5 → 2025, gardée)
+    RowFilter('annees', ['YEAR'], lambda data: np.trunc(data['YEAR']).between(MIN_YEAR, MAX_YEAR)),
+    ColumnTransform('annee_entiere', ['YEAR'], ['YEAR'], lambda data: {'YEAR': data['YEAR'].astype(int)}),
+    ColumnTransform('couverture_bornee', ['COVERAGE'], ['COVERAGE'], lambda data: {'COVERAGE': data['COVERAGE'].clip(0, 100)}),
+    ColumnTransform(
+        'textes', TEXT_COLUMNS, TEXT_COLUMNS,
+        lambda data: {column: strip_text_values(data[column]) for column in TEXT_COLUMNS if column in data.columns}
+    ),
+])
+
+# Étapes sur l'ensemble des lignes (6 et 7)
+MERGE_PIPELINE = Pipeline([
+    FrameStage('doublons', DUPLICATE_COLUMNS, lambda data: data.drop_duplicates(subset=DUPLICATE_COLUMNS, keep='first')),
+    FrameStage('tri', SORT_COLUMNS, lambda data: data.sort_values(by=SORT_COLUMNS)),
+])
+
+CLEANING_PIPELINE = ROW_PIPELINE + MERGE_PIPELINE
+
+
+def clean_rows(data: pd.DataFrame, report: Optional[PipelineReport] = None) -> pd.DataFrame:
+    """
+    Applique les étapes de nettoyage ligne à ligne (1 à 5).
+
+    Chaque ligne est nettoyée indépendamment des autres : ces étapes peuvent
+    être appliquées bloc par bloc. Le dédoublonnage et le tri, qui portent
+    sur l'ensemble des lignes, restent à faire.
+
+    Args:
+        data: DataFrame brut (ou bloc de lignes brutes)
+        report: Rapport dans lequel cumuler les mesures des étapes
+
+    Returns:
+        DataFrame nettoyé, non dédoublonné et non trié (index d'origine conservé)
+    """
+    cleaned, run_report = ROW_PIPELINE.run(data, trace_memory=CLEAN_TRACE_MEMORY)
+    if report is not None:
+        report.merge(run_report)
+    return cleaned
+
+
+def print_cleaning_summary(
+    initial_rows: int,
+    final_rows: int,
+    countries: int,
+    years: int,
+    antigens: int,
+    coverage_mean: float
+) -> None:
+    """Affiche le résumé d'un nettoyage."""
+    retention_rate = (final_rows / initial_rows) * 100 if initial_rows else 0.0
+
+    print("\n" + "="*60)
+    print("📊 RÉSUMÉ DU NETTOYAGE")
+    print("="*60)
+    print(f"Enregistrements initiaux : {initial_rows}")
+    print(f"Enregistrements finaux   : {final_rows}")
+    print(f"Supprimés                : {initial_rows - final_rows}")
+    print(f"Taux de rétention        : {retention_rate:.1f}%")
+    print(f"\nPays uniques             : {countries}")
+    print(f"Années                   : {years}")
+    print(f"Antigènes                : {antigens}")
+    print(f"Couverture moyenne       : {coverage_mean:.2f}%")
+    print("="*60)
+
+
+def resolve_input_files(input_file: Union[Path, str]) -> List[Path]:
+    """
+    Liste les fichiers bruts désignés par un fichier, un dossier ou un motif glob.
+
+    Args:
+        input_file: Fichier CSV, dossier (tous ses fichiers *.csv) ou motif
+            glob (ex: "data/raw/wuenic-*.csv")
+
+    Returns:
+        Fichiers triés par nom : l'ordre des partitions est celui de leur
+        concaténation (premier doublon gardé, ordre à clé de tri égale)
+
+    Raises:
+        FileNotFoundError: Si aucun fichier ne correspond
+    """
+    pattern = str(input_file)
+    if any(char in pattern for char in '*?['):
+        files = [Path(name) for name in sorted(glob.glob(pattern)) if Path(name).is_file()]
+    elif Path(pattern).is_dir():
+        files = sorted(Path(pattern).glob('*.csv'))
+    else:
+        files = [Path(pattern)] if Path(pattern).exists() else []
+    if not files:
+        raise FileNotFoundError(f"Le fichier {input_file} n'existe pas")
+    return files
+
+
+def clean_partition(path: Path) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Lit et nettoie ligne à ligne une partition (exécuté dans un processus du pool).
+
+    Les colonnes texte sont lues en texte : une partition où une colonne est
+    entièrement vide ne doit pas la recevoir en nombres.
+
+    Args:
+        path: Fichier brut de la partition
+
+    Returns:
+        Tuple (lignes nettoyées non dédoublonnées, mesures de la partition
+        dont le rapport de ses étapes)
+    """
+    start = time.perf_counter()
+    data = pd.read_csv(path, dtype={column: str for column in TEXT_COLUMNS})
+    read_seconds = time.perf_counter() - start
+    report = PipelineReport()
+    report.record('lecture', 'io', 0, len(data), read_seconds)
+    cleaned = clean_rows(data, report)
+    return cleaned, {
+        'file': path.name,
+        'rows_in': len(data),
+        'rows_out': len(cleaned),
+        'read_seconds': read_seconds,
+        'seconds': time.perf_counter() - start,
+        'pid': os.getpid(),
+        'report': report,
+    }
+
+
+def clean_partitions(files: List[Path], workers: int = CLEAN_WORKERS) -> Tuple[pd.DataFrame, int, List[Dict[str, Any]]]:
+    """
+    Nettoie des partitions en parallèle et concatène le résultat dans l'ordre des fichiers.
+
+    Args:
+        files: Fichiers bruts (voir resolve_input_files)
+        workers: Nombre de processus (1 : dans le processus courant)
+
+    Returns:
+        Tuple (lignes nettoyées non dédoublonnées, nombre de lignes brutes,
+        mesures par partition)
+    """
+    workers = max(1, min(workers, len(files)))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(clean_partition, files))
+    else:
+        results = [clean_partition(path) for path in files]
+
+    timings = [timing for _, timing in results]
+    data = pd.concat([cleaned for cleaned, _ in results], ignore_index=True)
+    return data, sum(timing['rows_in'] for timing in timings), timings
+
+
+def print_partition_timings(timings: List[Dict[str, Any]], wall_seconds: float) -> None:
+    """Affiche les mesures de chaque partition et le gain du parallélisme."""
+    width = max(len(timing['file']) for timing in timings)
+    for timing in timings:
+        print(
+            f"  {timing['file']:<{width}}  {timing['rows_in']:>9} → {timing['rows_out']:>9} lignes  "
+            f"{timing['seconds']:.2f} s (lecture {timing['read_seconds']:.2f} s, pid {timing['pid']})"
+        )
+    total = sum(timing['seconds'] for timing in timings)
+    speedup = total / wall_seconds if wall_seconds else 0.0
+    print(f"✓ {len(timings)} partitions nettoyées en {wall_seconds:.2f} s ({total:.2f} s cumulées, x{speedup:.1f})")
 
 
 def clean_vaccination_data(
-    input_file: Optional[Path] = None,
-    output_file: Optional[Path] = None
-) -> pd.DataFrame:
+    input_file: Optional[Union[Path, str]] = None,
+    output_file: Optional[Path] = None,
+    workers: int = CLEAN_WORKERS,
+    return_report: bool = False
+) -> Union[pd.DataFrame, Tuple[pd.DataFrame, PipelineReport]]:
     """
     Nettoie les données de vaccination brutes.
     
-    Étapes de nettoyage :
+    Étapes de nettoyage (CLEANING_PIPELINE) :
     1. Suppression des lignes avec valeurs manquantes critiques
-    2. Conversion des types de données
-    3. Suppression des doublons
+    2. Conversion des types de données (lignes non convertibles supprimées)
+    3. Validation des années
     4. Normalisation des valeurs de couverture
-    5. Validation des années
-    6. Nettoyage des noms de pays
+    5. Nettoyage des textes
+    6. Suppression des doublons
+    7. Tri (NAME → YEAR → ANTIGEN)
+    
+    Un dossier ou un motif glob est nettoyé par partition : les étapes
+    ligne à ligne sont appliquées à chaque fichier dans un pool de
+    processus, puis le dédoublonnage et le tri portent sur le résultat
+    fusionné, écrit une seule fois.
     
     Args:
-        input_file: Chemin du fichier d'entrée (défaut: data/raw/rawdata.csv)
+        input_file: Fichier d'entrée, dossier ou motif glob de fichiers
+            (défaut: data/raw/rawdata.csv)
         output_file: Chemin du fichier de sortie (défaut: data/cleaned/cleaneddata.csv)
+        workers: Nombre de processus pour un nettoyage par partitions
+        return_report: Retourne aussi le rapport par étape
         
     Returns:
-        DataFrame contenant les données nettoyées
+        DataFrame contenant les données nettoyées, ou tuple (DataFrame,
+        rapport par étape) si return_report est vrai
         
     Raises:
         FileNotFoundError: Si le fichier d'entrée n'existe pas
@@ -45,178 +294,751 @@ def clean_vaccination_data(
     if output_file is None:
         output_file = CLEANED_DATA_DIR / "cleaneddata.csv"
     
-    if not input_file.exists():
-        raise FileNotFoundError(f"Le fichier {input_file} n'existe pas")
-    
-    print(f"📂 Chargement des données depuis {input_file}...")
-    data = pd.read_csv(input_file)
-    initial_rows = len(data)
-    print(f"✓ {initial_rows} enregistrements chargés")
-    print(f"\n📋 Colonnes détectées: {list(data.columns)}")
-    
-    # Supprime les lignes avec valeurs manquantes critiques
-    print("\n🧹 Étape 1: Suppression des valeurs manquantes critiques...")
-    critical_columns = ['GROUP', 'CODE', 'NAME', 'YEAR', 'ANTIGEN', 'COVERAGE']
-    data_clean = data.dropna(subset=critical_columns)
-    removed_missing = initial_rows - len(data_clean)
-    print(f"✓ {removed_missing} lignes supprimées")
-    
-    # Convertit les types de données
-    print("\n🔄 Étape 2: Conversion des types de données...")
-    data_clean['YEAR'] = pd.to_numeric(data_clean['YEAR'], errors='coerce')
-    data_clean['COVERAGE'] = pd.to_numeric(data_clean['COVERAGE'], errors='coerce')
-    data_clean = data_clean.dropna(subset=['YEAR', 'COVERAGE'])
-    data_clean['YEAR'] = data_clean['YEAR'].astype(int)
-    print(f"✓ Types convertis (YEAR: int, COVERAGE: float)")
-    
-    # Valide les années (1980-2025)
-    print("\n📅 Étape 3: Validation des années...")
-    current_year = 2025
-    min_year = 1980
-    data_clean = data_clean[
-        (data_clean['YEAR'] >= min_year) & 
-        (data_clean['YEAR'] <= current_year)
-    ]
-    year_range = f"{data_clean['YEAR'].min()} - {data_clean['YEAR'].max()}"
-    print(f"✓ Années valides: {year_range}")
-    
-    # Normalise la couverture (0-100%)
-    print("\n📊 Étape 4: Normalisation de la couverture...")
-    data_clean.loc[data_clean['COVERAGE'] < 0, 'COVERAGE'] = 0
-    data_clean.loc[data_clean['COVERAGE'] > 100, 'COVERAGE'] = 100
-    coverage_stats = f"{data_clean['COVERAGE'].min():.1f}% - {data_clean['COVERAGE'].max():.1f}%"
-    print(f"✓ Couverture normalisée: {coverage_stats}")
-    
-    # Nettoie les textes
-    print("\n🔤 Étape 5: Nettoyage des textes...")
-    text_columns = ['GROUP', 'CODE', 'NAME', 'ANTIGEN', 'COVERAGE_CATEGORY']
-    for col in text_columns:
-        if col in data_clean.columns:
-            data_clean[col] = data_clean[col].astype(str).str.strip()
-            data_clean[col] = data_clean[col].replace('', np.nan)
-    print(f"✓ {len(text_columns)} colonnes nettoyées")
-    
-    # Supprime les doublons
-    print("\n🔍 Étape 6: Suppression des doublons...")
-    before_dedup = len(data_clean)
-    duplicate_cols = ['CODE', 'NAME', 'YEAR', 'ANTIGEN', 'COVERAGE_CATEGORY']
-    data_clean = data_clean.drop_duplicates(subset=duplicate_cols, keep='first')
-    duplicates_removed = before_dedup - len(data_clean)
-    print(f"✓ {duplicates_removed} doublons supprimés")
+    files = resolve_input_files(input_file)
+    partitioned = len(files) > 1 or Path(input_file).is_dir()
+    report = PipelineReport()
     
-    # Trie les données
-    print("\n📑 Étape 7: Tri des données...")
-    data_clean = data_clean.sort_values(
-        by=['NAME', 'YEAR', 'ANTIGEN'],
-        ascending=[True, True, True]
-    )
-    print(f"✓ Données triées (NAME → YEAR → ANTIGEN)")
+    if partitioned:
+        # Étapes 1 à 5 par partition, en parallèle, puis 6 et 7 sur le résultat fusionné
+        print(f"📂 Nettoyage de {len(files)} partitions depuis {input_file} ({min(workers, len(files))} processus)...")
+        start = time.perf_counter()
+        data_clean, initial_rows, timings = clean_partitions(files, workers)
+        print_partition_timings(timings, time.perf_counter() - start)
+        for timing in timings:
+            report.merge(timing['report'])
+        data_clean, merge_report = MERGE_PIPELINE.run(data_clean, trace_memory=CLEAN_TRACE_MEMORY)
+        report.merge(merge_report)
+    else:
+        input_file = files[0]
+        print(f"📂 Chargement des données depuis {input_file}...")
+        start = time.perf_counter()
+        data = pd.read_csv(input_file)
+        report.record('lecture', 'io', 0, len(data), time.perf_counter() - start)
+        initial_rows = len(data)
+        print(f"✓ {initial_rows} enregistrements chargés")
+        print(f"\n📋 Colonnes détectées: {list(data.columns)}")
+        data_clean, run_report = CLEANING_PIPELINE.run(data, trace_memory=CLEAN_TRACE_MEMORY)
+        report.merge(run_report)
     
     data_clean = data_clean.reset_index(drop=True)
     
-    final_rows = len(data_clean)
-    retention_rate = (final_rows / initial_rows) * 100
-    
-    print("\n" + "="*60)
-    print("📊 RÉSUMÉ DU NETTOYAGE")
-    print("="*60)
-    print(f"Enregistrements initiaux : {initial_rows}")
-    print(f"Enregistrements finaux   : {final_rows}")
-    print(f"Supprimés                : {initial_rows - final_rows}")
-    print(f"Taux de rétention        : {retention_rate:.1f}%")
-    print(f"\nPays uniques             : {data_clean['NAME'].nunique()}")
-    print(f"Années                   : {data_clean['YEAR'].nunique()}")
-    print(f"Antigènes                : {data_clean['ANTIGEN'].nunique()}")
-    print(f"Couverture moyenne       : {data_clean['COVERAGE'].mean():.2f}%")
-    print("="*60)
-    
     # Sauvegarde les données nettoyées
     print(f"\n💾 Sauvegarde dans {output_file}...")
+    start = time.perf_counter()
     output_file.parent.mkdir(parents=True, exist_ok=True)
     data_clean.to_csv(output_file, index=False)
+    report.record('écriture', 'io', len(data_clean), len(data_clean), time.perf_counter() - start)
     print(f"✓ Données sauvegardées!")
     
+    print("\n⏱️  Étapes du nettoyage")
+    print(report.format())
+    print_cleaning_summary(
+        initial_rows,
+        len(data_clean),
+        data_clean['NAME'].nunique(),
+        data_clean['YEAR'].nunique(),
+        data_clean['ANTIGEN'].nunique(),
+        data_clean['COVERAGE'].mean()
+    )
+    
+    if return_report:
+        return data_clean, report
     return data_clean
 
 
-def validate_cleaned_data(data: pd.DataFrame) -> bool:
-    """Valide les données nettoyées."""
-    print("\n🔍 Validation des données...")
-    
-    issues = []
-    
-    # Vérifie les colonnes requises
-    required_columns = ['GROUP', 'CODE', 'NAME', 'YEAR', 'ANTIGEN', 'COVERAGE']
-    for col in required_columns:
-        if col not in data.columns:
-            issues.append(f"❌ Colonne manquante: {col}")
-    
-    # Vérifie les valeurs manquantes
-    for col in required_columns:
-        if col in data.columns:
-            missing = data[col].isna().sum()
-            if missing > 0:
-                issues.append(f"⚠️  {missing} valeurs manquantes dans {col}")
-    
-    # Vérifie les plages de valeurs
-    if 'COVERAGE' in data.columns:
-        if (data['COVERAGE'] < 0).any() or (data['COVERAGE'] > 100).any():
-            issues.append("❌ Couverture hors plage (0-100%)")
-    
-    if 'YEAR' in data.columns:
-        if (data['YEAR'] < 1980).any() or (data['YEAR'] > 2025).any():
-            issues.append("❌ Années invalides")
-    
-    # Affiche les résultats
+def infer_csv_dtypes(path: Path, chunk_size: int) -> Dict[str, Any]:
+    """
+    Détermine les types que pandas donnerait aux colonnes du fichier entier.
+
+    Lu par blocs, un fichier peut voir une colonne entière dans un bloc et
+    décimale dans un autre (valeurs manquantes) : les types sont unifiés sur
+    tout le fichier pour que chaque bloc soit lu, nettoyé et écrit comme le
+    serait le fichier complet.
+
+    Args:
+        path: Chemin du fichier CSV
+        chunk_size: Nombre de lignes par bloc
+
+    Returns:
+        Dictionnaire colonne → type, utilisable par pd.read_csv(dtype=...)
+    """
+    dtypes: Dict[str, Any] = {}
+    for chunk in pd.read_csv(path, chunksize=chunk_size):
+        for column, dtype in chunk.dtypes.items():
+            known = dtypes.get(column)
+            if known is None or known == dtype:
+                dtypes[column] = dtype
+            elif isinstance(known, np.dtype) and isinstance(dtype, np.dtype) and known.kind in 'iuf' and dtype.kind in 'iuf':
+                dtypes[column] = np.promote_types(known, dtype)
+            else:
+                dtypes[column] = str
+    return dtypes
+
+
+def _is_seen(hash_runs: List[np.ndarray], hashes: np.ndarray) -> np.ndarray:
+    """Indique, pour chaque empreinte, si elle figure dans l'une des séquences triées."""
+    seen = np.zeros(len(hashes), dtype=bool)
+    for run in hash_runs:
+        positions = np.minimum(np.searchsorted(run, hashes), len(run) - 1)
+        seen |= run[positions] == hashes
+    return seen
+
+
+def _add_hash_run(hash_runs: List[np.ndarray], hashes: np.ndarray) -> None:
+    """
+    Ajoute des empreintes triées aux séquences d'empreintes déjà vues.
+
+    Les séquences de tailles voisines sont fusionnées (chaque séquence est
+    au moins deux fois plus grande que la suivante) : il en reste au plus
+    log2(n), et chaque empreinte n'est recopiée que log2(n) fois au total,
+    au lieu d'un tri du tableau entier à chaque bloc.
+    """
+    hash_runs.append(hashes)
+    while len(hash_runs) > 1 and len(hash_runs[-2]) <= 2 * len(hash_runs[-1]):
+        last = hash_runs.pop()
+        # Tri stable (timsort) de deux séquences déjà triées : une simple fusion
+        hash_runs[-1] = np.sort(np.concatenate([hash_runs[-1], last]), kind='stable')
+
+
+def _merge_runs(runs: List[Path], handle, key_positions: List[int]) -> None:
+    """
+    Fusionne des séquences triées (CSV sans en-tête) dans un fichier ouvert.
+
+    La fusion est stable : à clé égale, les lignes de la première séquence
+    passent en premier, comme dans un tri stable du fichier entier.
+    """
+    name, year, antigen = key_positions
+
+    # Texte manquant écrit '' mais trié en dernier par sort_values (NaN en fin)
+    def sort_key(row: List[str]):
+        return row[name] == '', row[name], int(row[year]), row[antigen] == '', row[antigen]
+
+    with ExitStack() as stack:
+        readers = [
+            csv.reader(stack.enter_context(open(run, 'r', newline='', encoding='utf-8')))
+            for run in runs
+        ]
+        writer = csv.writer(handle, lineterminator='\n')
+        writer.writerows(heapq.merge(*readers, key=sort_key))
+
+
+def _reduce_runs(runs: List[Path], directory: Path, key_positions: List[int], fan_in: int) -> List[Path]:
+    """Fusionne les séquences par groupes consécutifs jusqu'à en avoir au plus fan_in."""
+    while len(runs) > fan_in:
+        merged = []
+        for start in range(0, len(runs), fan_in):
+            group = runs[start:start + fan_in]
+            if len(group) == 1:
+                merged.extend(group)
+                continue
+            target = directory / f"merge-{len(merged):05d}-{group[0].name}"
+            with open(target, 'w', newline='', encoding='utf-8') as handle:
+                _merge_runs(group, handle, key_positions)
+            for run in group:
+                run.unlink()
+            merged.append(target)
+        runs = merged
+    return runs
+
+
+def clean_vaccination_data_streaming(
+    input_file: Optional[Path] = None,
+    output_file: Optional[Path] = None,
+    chunk_size: int = CLEAN_CHUNK_SIZE
+) -> Dict[str, Any]:
+    """
+    Nettoie les données brutes bloc par bloc, en mémoire bornée.
+
+    Produit le même fichier, octet pour octet, que clean_vaccination_data :
+    - les étapes ligne à ligne (clean_rows) sont appliquées à chaque bloc ;
+    - les doublons sont détectés sur une empreinte 64 bits des colonnes
+      DUPLICATE_COLUMNS, gardée dans quelques séquences triées (8 octets
+      par ligne conservée), la première occurrence étant gardée ;
+    - chaque bloc trié est écrit dans une séquence temporaire, puis les
+      séquences sont fusionnées (tri externe stable) dans le fichier de sortie.
+
+    La mémoire utilisée dépend de chunk_size, pas de la taille du fichier
+    (hors tableau d'empreintes). Le fichier de sortie est remplacé
+    atomiquement une fois complet.
+
+    Args:
+        input_file: Chemin du fichier d'entrée (défaut: data/raw/rawdata.csv)
+        output_file: Chemin du fichier de sortie (défaut: data/cleaned/cleaneddata.csv)
+        chunk_size: Nombre de lignes lues par bloc
+
+    Returns:
+        Résumé du nettoyage {initial_rows, final_rows, duplicates_removed,
+        runs, report (rapport par étape, cumulé sur les blocs)}
+
+    Raises:
+        FileNotFoundError: Si le fichier d'entrée n'existe pas
+    """
+    if input_file is None:
+        input_file = RAW_DATA_DIR / "rawdata.csv"
+    if output_file is None:
+        output_file = CLEANED_DATA_DIR / "cleaneddata.csv"
+
+    if not input_file.exists():
+        raise FileNotFoundError(f"Le fichier {input_file} n'existe pas")
+
+    print(f"📂 Nettoyage en flux de {input_file} (blocs de {chunk_size} lignes)...")
+    report = PipelineReport()
+    start = time.perf_counter()
+    dtypes = infer_csv_dtypes(input_file, chunk_size)
+    report.record('types', 'io', 0, 0, time.perf_counter() - start)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+
+    hash_runs: List[np.ndarray] = []
+    initial_rows = 0
+    cleaned_rows = 0
+    final_rows = 0
+    coverage_sum = 0.0
+    countries: Set[str] = set()
+    years: Set[int] = set()
+    antigens: Set[str] = set()
+    columns: List[str] = list(dtypes)
+
+    with tempfile.TemporaryDirectory(prefix='clean-runs-', dir=output_file.parent) as tmp:
+        directory = Path(tmp)
+        runs: List[Path] = []
+        chunks = pd.read_csv(input_file, dtype=dtypes, chunksize=chunk_size)
+
+        while True:
+            start = time.perf_counter()
+            chunk = next(chunks, None)
+            if chunk is None:
+                break
+            report.record('lecture', 'io', 0, len(chunk), time.perf_counter() - start)
+            initial_rows += len(chunk)
+            chunk = clean_rows(chunk, report)
+            columns = list(chunk.columns)
+            cleaned_rows += len(chunk)
+
+            # Première occurrence dans le bloc et absente des blocs précédents
+            start = time.perf_counter()
+            hashes = pd.util.hash_pandas_object(chunk[DUPLICATE_COLUMNS], index=False).to_numpy()
+            keep = ~pd.Series(hashes).duplicated().to_numpy() & ~_is_seen(hash_runs, hashes)
+            deduplicated = chunk[keep]
+            if len(deduplicated):
+                _add_hash_run(hash_runs, np.sort(hashes[keep]))
+            report.record('doublons (empreintes)', 'frame', len(chunk), len(deduplicated), time.perf_counter() - start)
+            chunk = deduplicated
+            if chunk.empty:
+                continue
+
+            final_rows += len(chunk)
+            coverage_sum += float(chunk['COVERAGE'].sum())
+            countries.update(chunk['NAME'].unique())
+            years.update(chunk['YEAR'].unique())
+            antigens.update(chunk['ANTIGEN'].unique())
+
+            start = time.perf_counter()
+            run = directory / f"run-{len(runs):05d}.csv"
+            chunk.sort_values(by=SORT_COLUMNS).to_csv(run, index=False, header=False)
+            runs.append(run)
+            report.record('tri des blocs', 'frame', len(chunk), len(chunk), time.perf_counter() - start)
+
+        key_positions = [columns.index(column) for column in SORT_COLUMNS]
+        spilled = len(runs)
+        start = time.perf_counter()
+        runs = _reduce_runs(runs, directory, key_positions, CLEAN_MERGE_FAN_IN)
+
+        print(f"📑 Fusion de {len(runs)} séquence(s) triée(s)...")
+        fd, tmp_name = tempfile.mkstemp(prefix=output_file.name + ".", suffix=".tmp", dir=output_file.parent)
+        try:
+            with os.fdopen(fd, 'w', newline='', encoding='utf-8') as handle:
+                pd.DataFrame(columns=columns).to_csv(handle, index=False)
+                _merge_runs(runs, handle, key_positions)
+            os.replace(tmp_name, output_file)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        report.record('fusion des séquences', 'io', final_rows, final_rows, time.perf_counter() - start)
+
+    print("\n⏱️  Étapes du nettoyage")
+    print(report.format())
+    print_cleaning_summary(
+        initial_rows,
+        final_rows,
+        len(countries),
+        len(years),
+        len(antigens),
+        coverage_sum / final_rows if final_rows else 0.0
+    )
+    print(f"\n💾 Données sauvegardées dans {output_file}")
+
+    return {
+        'initial_rows': initial_rows,
+        'final_rows': final_rows,
+        'duplicates_removed': cleaned_rows - final_rows,
+        'runs': spilled,
+        'output_file': str(output_file),
+        'report': report.to_dict(),
+    }
+
+
+# Manifeste du nettoyage incrémental
+MANIFEST_FORMAT_VERSION: int = 1
+_MANIFEST_META_KEY: str = "__meta__"
+# Multiplicateur de Fibonacci : mélange le rang d'une ligne dans son groupe
+_RANK_MIX: np.uint64 = np.uint64(0x9E3779B97F4A7C15)
+
+
+def get_manifest_path(output_file: Path) -> Path:
+    """
+    Retourne le chemin du manifeste associé à un fichier nettoyé.
+
+    Args:
+        output_file: Chemin du fichier CSV nettoyé
+
+    Returns:
+        Chemin du manifeste (à côté du CSV nettoyé)
+    """
+    return output_file.with_name(output_file.name + CLEAN_MANIFEST_SUFFIX)
+
+
+def _cleaning_rules() -> Dict[str, Any]:
+    """Règles de nettoyage : un manifeste écrit avec d'autres règles est ignoré."""
+    return {
+        'critical': CRITICAL_COLUMNS,
+        'text': TEXT_COLUMNS,
+        'duplicate': DUPLICATE_COLUMNS,
+        'sort': SORT_COLUMNS,
+        'years': [MIN_YEAR, MAX_YEAR],
+    }
+
+
+def _hash_normalized(series: pd.Series) -> np.ndarray:
+    """
+    Empreinte 64 bits de chaque valeur d'une colonne clé, après normalisation.
+
+    La normalisation (voir strip_text, année tronquée) ne porte que sur les
+    valeurs distinctes ; les valeurs manquantes ont toutes l'empreinte 0.
+    """
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    values = pd.DataFrame({series.name: uniques})
+    if series.name == 'YEAR':
+        values['YEAR'] = np.trunc(pd.to_numeric(values['YEAR'], errors='coerce')).astype('float64')
+    else:
+        values = strip_text(values)
+    values = values[series.name]
+    present = values.notna().to_numpy()
+    # Dernière case : valeurs manquantes de la colonne (code -1)
+    hashes = np.zeros(len(values) + 1, dtype=np.uint64)
+    hashes[:-1][present] = pd.util.hash_array(values[present].to_numpy())
+    return hashes[codes]
+
+
+def compute_record_keys(data: pd.DataFrame) -> np.ndarray:
+    """
+    Calcule l'empreinte 64 bits de la clé de dédoublonnage de chaque ligne.
+
+    Les clés sont normalisées comme par le nettoyage (textes sans espaces,
+    année tronquée) : une ligne brute et la ligne nettoyée qui en est issue
+    ont la même clé.
+
+    Args:
+        data: DataFrame brut ou nettoyé
+
+    Returns:
+        Tableau uint64 d'une empreinte par ligne
+    """
+    keys = np.zeros(len(data), dtype=np.uint64)
+    for column in DUPLICATE_COLUMNS:
+        keys = pd.util.hash_array(keys ^ _hash_normalized(data[column]))
+    return keys
+
+
+def compute_group_fingerprints(data: pd.DataFrame, keys: np.ndarray):
+    """
+    Calcule l'empreinte du contenu de chaque groupe de lignes de même clé.
+
+    L'empreinte d'un groupe dépend du contenu de toutes ses lignes et de leur
+    ordre (le dédoublonnage garde la première).
+
+    Args:
+        data: DataFrame brut
+        keys: Clés des lignes (voir compute_record_keys)
+
+    Returns:
+        Tuple (clés des groupes triées, empreintes des groupes, ordre des lignes
+        regroupées par clé, rang de chaque ligne dans son groupe)
+    """
+    rows = pd.util.hash_pandas_object(data, index=False).to_numpy()
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    groups, starts = np.unique(sorted_keys, return_index=True)
+    ranks = np.empty(len(keys), dtype=np.int64)
+    ranks[order] = np.arange(len(keys)) - np.repeat(starts, np.diff(np.append(starts, len(keys))))
+    mixed = pd.util.hash_array(rows ^ (ranks.astype(np.uint64) * _RANK_MIX))
+    fingerprints = np.add.reduceat(mixed[order], starts) if len(starts) else np.empty(0, dtype=np.uint64)
+    return groups, fingerprints, order, ranks
+
+
+def read_manifest(output_file: Path) -> Optional[Dict[str, Any]]:
+    """
+    Lit le manifeste du dernier nettoyage incrémental.
+
+    Args:
+        output_file: Chemin du fichier CSV nettoyé
+
+    Returns:
+        Dictionnaire {meta, groups, fingerprints, winners}, ou None si le
+        manifeste est absent, illisible ou écrit avec d'autres règles
+    """
+    path = get_manifest_path(output_file)
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as archive:
+            manifest = {name: archive[name] for name in ('groups', 'fingerprints', 'winners')}
+            manifest['meta'] = json.loads(str(archive[_MANIFEST_META_KEY]))
+    except (OSError, ValueError, KeyError):
+        return None
+    meta = manifest['meta']
+    if meta.get('format_version') != MANIFEST_FORMAT_VERSION or meta.get('rules') != _cleaning_rules():
+        return None
+    return manifest
+
+
+def write_manifest(
+    output_file: Path,
+    input_file: Path,
+    groups: np.ndarray,
+    fingerprints: np.ndarray,
+    winners: np.ndarray,
+    dtypes: Dict[str, str]
+) -> Path:
+    """
+    Écrit le manifeste d'un nettoyage (écriture atomique).
+
+    Args:
+        output_file: Chemin du fichier CSV nettoyé (déjà écrit)
+        input_file: Chemin du fichier brut nettoyé
+        groups: Clés des groupes, triées
+        fingerprints: Empreinte du contenu brut de chaque groupe
+        winners: Rang dans son groupe de la ligne gardée (-1 : aucune)
+        dtypes: Types des colonnes nettoyées (dont dépend leur format CSV)
+
+    Returns:
+        Chemin du manifeste écrit
+    """
+    path = get_manifest_path(output_file)
+    meta = {
+        'format_version': MANIFEST_FORMAT_VERSION,
+        'rules': _cleaning_rules(),
+        'source': compute_file_fingerprint(input_file, with_hash=False),
+        'output': compute_file_fingerprint(output_file, with_hash=False),
+        'dtypes': dtypes,
+    }
+    fd, tmp_name = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            np.savez(
+                handle, groups=groups, fingerprints=fingerprints, winners=winners,
+                **{_MANIFEST_META_KEY: np.asarray(json.dumps(meta))}
+            )
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    return path
+
+
+def _write_csv_atomically(data: pd.DataFrame, output_file: Path) -> None:
+    """Écrit un CSV dans un fichier temporaire puis le renomme."""
+    fd, tmp_name = tempfile.mkstemp(prefix=output_file.name + ".", suffix=".tmp", dir=output_file.parent)
+    try:
+        with os.fdopen(fd, 'w', newline='', encoding='utf-8') as handle:
+            data.to_csv(handle, index=False)
+        os.replace(tmp_name, output_file)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def _splice_cleaned_lines(
+    output_file: Path,
+    fresh: pd.DataFrame,
+    kept_groups: np.ndarray,
+    groups: np.ndarray,
+    winners: np.ndarray,
+    sorted_keys: np.ndarray,
+    order: np.ndarray
+):
+    """
+    Fusionne les lignes inchangées du fichier nettoyé et les lignes renettoyées.
+
+    Les lignes inchangées sont reprises telles quelles (texte CSV), sans
+    être reformatées : seules les lignes renettoyées passent par to_csv.
+    L'ordre est celui du tri complet : (NAME, YEAR, ANTIGEN) puis position
+    dans le fichier brut de la ligne retenue.
+
+    Returns:
+        Tuple (colonnes de tri et COVERAGE des lignes fusionnées, corps du
+        CSV), ou None si le fichier nettoyé ne correspond pas au manifeste
+    """
+    key_columns = list(dict.fromkeys(DUPLICATE_COLUMNS + SORT_COLUMNS + ['COVERAGE']))
+    existing = pd.read_csv(output_file, usecols=key_columns, keep_default_na=False, na_values=[''])
+    with open(output_file, 'r', newline='', encoding='utf-8') as handle:
+        existing_lines = handle.read().split('\n')[1:-1]
+    fresh_lines = fresh.to_csv(index=False, header=False, lineterminator='\n').split('\n')[:-1]
+    if len(existing_lines) != len(existing) or len(fresh_lines) != len(fresh):
+        # Retours à la ligne dans des valeurs : découpage par ligne impossible
+        return None
+
+    existing_keys = compute_record_keys(existing)
+    kept_mask = np.isin(existing_keys, kept_groups)
+    if kept_mask.sum() != len(kept_groups):
+        return None
+    kept_keys = existing_keys[kept_mask]
+
+    # Position dans le fichier brut de la ligne retenue de chaque groupe
+    kept_positions = order[np.searchsorted(sorted_keys, kept_keys) + winners[np.searchsorted(groups, kept_keys)]]
+
+    merged = pd.concat([existing.loc[kept_mask, SORT_COLUMNS + ['COVERAGE']], fresh[SORT_COLUMNS + ['COVERAGE']]], ignore_index=True)
+    merged['_position'] = np.concatenate([kept_positions, fresh.index.to_numpy()])
+    merged = merged.sort_values(by=SORT_COLUMNS + ['_position'])
+
+    text = np.concatenate([np.asarray(existing_lines, dtype=object)[kept_mask], np.asarray(fresh_lines, dtype=object)])
+    body = '\n'.join(text[merged.index.to_numpy()])
+    return merged, body + '\n' if body else body
+
+
+def _write_text_atomically(text: str, output_file: Path) -> None:
+    """Écrit un texte dans un fichier temporaire puis le renomme."""
+    fd, tmp_name = tempfile.mkstemp(prefix=output_file.name + ".", suffix=".tmp", dir=output_file.parent)
+    try:
+        with os.fdopen(fd, 'w', newline='', encoding='utf-8') as handle:
+            handle.write(text)
+        os.replace(tmp_name, output_file)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def clean_vaccination_data_incremental(
+    input_file: Optional[Path] = None,
+    output_file: Optional[Path] = None
+) -> Dict[str, Any]:
+    """
+    Nettoie uniquement les enregistrements bruts nouveaux ou modifiés.
+
+    Les lignes brutes sont regroupées par clé de dédoublonnage normalisée
+    (CODE, NAME, YEAR, ANTIGEN, COVERAGE_CATEGORY) ; chaque groupe donne au
+    plus une ligne nettoyée. Le manifeste garde l'empreinte du contenu de
+    chaque groupe et le rang de la ligne retenue. Au passage suivant :
+    - si le fichier brut et le fichier nettoyé n'ont pas bougé (taille et
+      date de modification), rien n'est relu ;
+    - sinon seuls les groupes nouveaux ou modifiés sont nettoyés, les lignes
+      des groupes supprimés sont retirées, et le résultat est fusionné avec
+      les lignes inchangées du fichier nettoyé existant, dans l'ordre du tri
+      (à clé égale, ordre des lignes du fichier brut).
+
+    Le fichier produit est identique à celui de clean_vaccination_data. Sans
+    manifeste valide (premier passage, règles modifiées, fichier nettoyé
+    modifié à la main), tous les groupes sont nettoyés.
+
+    Args:
+        input_file: Chemin du fichier d'entrée (défaut: data/raw/rawdata.csv)
+        output_file: Chemin du fichier de sortie (défaut: data/cleaned/cleaneddata.csv)
+
+    Returns:
+        Résumé {mode ('inchangé', 'incrémental' ou 'complet'), groups,
+        changed_groups, removed_groups, cleaned_rows, final_rows, seconds,
+        report (étapes des lignes renettoyées, si des lignes l'ont été)}
+
+    Raises:
+        FileNotFoundError: Si le fichier d'entrée n'existe pas
+    """
+    start = time.perf_counter()
+    if input_file is None:
+        input_file = RAW_DATA_DIR / "rawdata.csv"
+    if output_file is None:
+        output_file = CLEANED_DATA_DIR / "cleaneddata.csv"
+
+    if not input_file.exists():
+        raise FileNotFoundError(f"Le fichier {input_file} n'existe pas")
+
+    manifest = read_manifest(output_file)
+    if manifest is not None and (
+        not output_file.exists()
+        or manifest['meta']['output'] != compute_file_fingerprint(output_file, with_hash=False)
+    ):
+        manifest = None
+
+    summary: Dict[str, Any] = {'mode': 'inchangé', 'changed_groups': 0, 'removed_groups': 0, 'cleaned_rows': 0}
+    if manifest is not None and manifest['meta']['source'] == compute_file_fingerprint(input_file, with_hash=False):
+        summary.update(groups=len(manifest['groups']), final_rows=int((manifest['winners'] >= 0).sum()))
+        summary['seconds'] = time.perf_counter() - start
+        print(f"✓ {input_file} inchangé depuis le dernier nettoyage ({summary['seconds'] * 1000:.0f} ms)")
+        return summary
+
+    print(f"📂 Chargement des données depuis {input_file}...")
+    raw = pd.read_csv(input_file)
+    keys = compute_record_keys(raw)
+    groups, fingerprints, order, ranks = compute_group_fingerprints(raw, keys)
+
+    # Un changement de type (ex: entiers devenus décimaux) change le format
+    # de toutes les lignes : le fichier nettoyé existant n'est plus réutilisable
+    dtypes = {str(column): str(dtype) for column, dtype in clean_rows(raw.iloc[:0]).dtypes.items()}
+    if manifest is not None and manifest['meta'].get('dtypes') != dtypes:
+        manifest = None
+
+    # Groupes inchangés depuis le manifeste
+    unchanged = np.zeros(len(groups), dtype=bool)
+    winners = np.full(len(groups), -1, dtype=np.int64)
+    removed = 0
+    if manifest is not None:
+        previous = manifest['groups']
+        if len(previous):
+            positions = np.minimum(np.searchsorted(previous, groups), len(previous) - 1)
+            unchanged = (previous[positions] == groups) & (manifest['fingerprints'][positions] == fingerprints)
+            winners[unchanged] = manifest['winners'][positions[unchanged]]
+        removed = int(len(previous) - np.isin(previous, groups, assume_unique=True).sum())
+
+    changed_groups = groups[~unchanged]
+    summary.update(
+        mode='incrémental' if manifest is not None else 'complet',
+        groups=len(groups),
+        changed_groups=len(changed_groups),
+        removed_groups=removed,
+    )
+    if manifest is not None and not len(changed_groups) and not removed:
+        # Fichier brut touché mais contenu identique : seul le manifeste est mis à jour
+        write_manifest(output_file, input_file, groups, fingerprints, winners, dtypes)
+        summary.update(mode='inchangé', final_rows=int((winners >= 0).sum()))
+        summary['seconds'] = time.perf_counter() - start
+        print(f"✓ Contenu de {input_file} inchangé ({summary['seconds'] * 1000:.0f} ms)")
+        return summary
+
+    # Nettoyage des seuls groupes nouveaux ou modifiés
+    dirty = np.isin(keys, changed_groups, assume_unique=False)
+    report = PipelineReport()
+    fresh = clean_rows(raw[dirty], report)
+    fresh = fresh.drop_duplicates(subset=DUPLICATE_COLUMNS, keep='first')
+    fresh_positions = fresh.index.to_numpy()
+    winners[np.searchsorted(groups, keys[fresh_positions])] = ranks[fresh_positions]
+    summary['cleaned_rows'] = int(dirty.sum())
+    print(f"🧹 {summary['cleaned_rows']} lignes nettoyées ({len(changed_groups)} groupes nouveaux ou modifiés, {removed} supprimés)")
+
+    # Lignes inchangées du fichier nettoyé existant
+    kept_groups = groups[unchanged & (winners >= 0)]
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    if len(kept_groups):
+        spliced = _splice_cleaned_lines(output_file, fresh, kept_groups, groups, winners, keys[order], order)
+        if spliced is None:
+            # Fichier nettoyé désynchronisé du manifeste : nettoyage complet
+            print("⚠️  Fichier nettoyé désynchronisé du manifeste, nettoyage complet")
+            get_manifest_path(output_file).unlink()
+            return clean_vaccination_data_incremental(input_file, output_file)
+        merged, body = spliced
+        _write_text_atomically(pd.DataFrame(columns=fresh.columns).to_csv(index=False) + body, output_file)
+    else:
+        merged = fresh.assign(_position=fresh_positions)
+        merged = merged.sort_values(by=SORT_COLUMNS + ['_position']).drop(columns='_position')
+        _write_csv_atomically(merged, output_file)
+    write_manifest(output_file, input_file, groups, fingerprints, winners, dtypes)
+
+    print_cleaning_summary(
+        len(raw),
+        len(merged),
+        merged['NAME'].nunique(),
+        merged['YEAR'].nunique(),
+        merged['ANTIGEN'].nunique(),
+        merged['COVERAGE'].mean()
+    )
+    summary['final_rows'] = len(merged)
+    summary['seconds'] = time.perf_counter() - start
+    summary['report'] = report.to_dict()
+    print("\n⏱️  Étapes du nettoyage")
+    print(report.format())
+    print(f"\n💾 Données sauvegardées dans {output_file} ({summary['seconds']:.2f} s)")
+    return summary
+
+
+def print_validation_report(report: Dict[str, Any]) -> bool:
+    """
+    Affiche le résultat d'un rapport de validation.
+
+    Args:
+        report: Rapport de validation (voir src.utils.validation)
+
+    Returns:
+        True si toutes les vérifications sont passées
+    """
+    issues = format_issues(report)
     if issues:
         print("\n⚠️  Problèmes détectés:")
         for issue in issues:
             print(f"  {issue}")
         return False
-    else:
-        print("✅ Validation réussie")
-        return True
+    print("✅ Validation réussie")
+    return True
+
+
+def validate_cleaned_data(data: pd.DataFrame) -> bool:
+    """Valide les données nettoyées."""
+    print("\n🔍 Validation des données...")
+    return print_validation_report(validate_frame(data))
 
 
 def get_data_quality_report(data: pd.DataFrame) -> dict:
     """Génère un rapport de qualité des données."""
-    missing_counts = data.isna().sum()
-    completeness = (1 - (missing_counts / len(data))) * 100
-    
-    report = {
-        'total_records': len(data),
-        'countries': data['NAME'].nunique() if 'NAME' in data.columns else 0,
-        'years': data['YEAR'].nunique() if 'YEAR' in data.columns else 0,
-        'antigens': data['ANTIGEN'].nunique() if 'ANTIGEN' in data.columns else 0,
-        'coverage_mean': data['COVERAGE'].mean() if 'COVERAGE' in data.columns else 0,
-        'coverage_median': data['COVERAGE'].median() if 'COVERAGE' in data.columns else 0,
-        'coverage_std': data['COVERAGE'].std() if 'COVERAGE' in data.columns else 0,
-        'missing_values': missing_counts.to_dict(),
-        'data_completeness': completeness.to_dict()
-    }
-    
-    return report
+    return validate_frame(data)['quality']
 
 
 if __name__ == "__main__":
     """Script principal de nettoyage des données."""
+    parser = argparse.ArgumentParser(description="Nettoyage des données de vaccination")
+    parser.add_argument('--stream', action='store_true',
+                        help="Nettoyage en flux, en mémoire bornée (gros fichiers)")
+    parser.add_argument('--chunk-size', type=int, default=CLEAN_CHUNK_SIZE,
+                        help=f"Lignes par bloc en mode --stream (défaut: {CLEAN_CHUNK_SIZE})")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Ne nettoie que les enregistrements nouveaux ou modifiés depuis le dernier passage")
+    parser.add_argument('--input', default=None,
+                        help="Fichier brut, dossier ou motif glob de fichiers (défaut: data/raw/rawdata.csv)")
+    parser.add_argument('--workers', type=int, default=CLEAN_WORKERS,
+                        help=f"Processus pour un dossier ou un motif de fichiers (défaut: {CLEAN_WORKERS})")
+    args = parser.parse_args()
+    input_file = None
+    if args.input is not None and (args.stream or args.incremental):
+        # Un dossier ou un motif ne désignant qu'un fichier est accepté
+        input_files = resolve_input_files(args.input)
+        if len(input_files) > 1:
+            parser.error("--stream et --incremental prennent un seul fichier brut")
+        input_file = input_files[0]
+
     print("🏥 NETTOYAGE DES DONNÉES DE VACCINATION")
     print("="*60)
     
+    output_file = CLEANED_DATA_DIR / "cleaneddata.csv"
     try:
-        # Nettoie les données
-        cleaned_data = clean_vaccination_data()
-        
-        # Valide les données
-        is_valid = validate_cleaned_data(cleaned_data)
-        
-        # Génère le rapport de qualité
-        report = get_data_quality_report(cleaned_data)
-        
+        if args.stream:
+            # Le fichier nettoyé n'est jamais chargé en entier : validation par blocs
+            clean_vaccination_data_streaming(input_file, output_file, chunk_size=args.chunk_size)
+            validation = validate_file(output_file, chunk_size=args.chunk_size)
+        elif args.incremental:
+            clean_vaccination_data_incremental(input_file, output_file)
+            validation = validate_file(output_file)
+        else:
+            # Nettoie les données
+            cleaned_data = clean_vaccination_data(args.input, output_file, workers=args.workers)
+            validation = validate_file(output_file, data=cleaned_data)
+
+        # Valide les données (une passe, rapport gardé à côté du fichier)
+        print("\n🔍 Validation des données...")
+        is_valid = print_validation_report(validation)
+
         print("\n📈 RAPPORT DE QUALITÉ")
         print("="*60)
-        print(f"Complétude moyenne: {np.mean(list(report['data_completeness'].values())):.1f}%")
-        
+        print(f"Complétude moyenne: {np.mean(list(validation['quality']['data_completeness'].values())):.1f}%")
+
         if is_valid:
             print("\n✅ Nettoyage terminé avec succès!")
         else:
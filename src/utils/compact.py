@@ -0,0 +1,135 @@
+"""
+Représentation compacte en mémoire des données de vaccination.
+
+Les colonnes texte (pays, antigènes, catégories...) répètent les mêmes chaînes
+des milliers de fois : elles sont converties en Categorical partageant une
+seule table de codes. Les colonnes numériques sont réduites au plus petit type
+adapté (int16 pour YEAR, float32 pour COVERAGE).
+"""
+
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+TEXT_COLUMNS: List[str] = [
+    'GROUP',
+    'CODE',
+    'NAME',
+    'ANTIGEN',
+    'ANTIGEN_DESCRIPTION',
+    'COVERAGE_CATEGORY',
+    'COVERAGE_CATEGORY_DESCRIPTION',
+]
+
+# Types cibles imposés pour les colonnes numériques principales
+NUMERIC_DOWNCASTS: Dict[str, str] = {
+    'YEAR': 'int16',
+    'COVERAGE': 'float32',
+}
+
+# Colonnes réduites en float32 uniquement si la conversion est sans perte
+LOSSLESS_FLOAT_COLUMNS: List[str] = ['TARGET_NUMBER', 'DOSES']
+
+
+def build_code_table(data: pd.DataFrame, columns: List[str]) -> pd.CategoricalDtype:
+    """
+    Construit la table de codes partagée par toutes les colonnes texte.
+
+    Args:
+        data: DataFrame contenant les données
+        columns: Colonnes texte à encoder
+
+    Returns:
+        CategoricalDtype dont les catégories sont l'union triée des valeurs
+    """
+    values = set()
+    for column in columns:
+        values.update(data[column].dropna().unique().tolist())
+    return pd.CategoricalDtype(categories=sorted(values))
+
+
+def get_code_table(data: pd.DataFrame) -> pd.Index:
+    """
+    Retourne la table de codes partagée d'un DataFrame compact.
+
+    Args:
+        data: DataFrame compact (voir compact_vaccination_data)
+
+    Returns:
+        Index des chaînes (position = code), vide si le DataFrame n'est pas compact
+    """
+    for column in TEXT_COLUMNS:
+        if column in data.columns and isinstance(data[column].dtype, pd.CategoricalDtype):
+            return data[column].cat.categories
+    return pd.Index([], dtype=object)
+
+
+def _downcast_numeric(series: pd.Series, target: str) -> pd.Series:
+    """Réduit une colonne numérique si ses valeurs tiennent dans le type cible."""
+    if target.startswith('int'):
+        if series.isna().any():
+            return series
+        info = np.iinfo(target)
+        if series.min() < info.min or series.max() > info.max:
+            return series
+    return series.astype(target)
+
+
+def _downcast_float_lossless(series: pd.Series) -> pd.Series:
+    """Réduit une colonne flottante en float32 seulement si aucune valeur n'est altérée."""
+    values = series.to_numpy(dtype=np.float64)
+    reduced = values.astype(np.float32)
+    if np.array_equal(reduced.astype(np.float64), values, equal_nan=True):
+        return pd.Series(reduced, index=series.index, name=series.name)
+    return series
+
+
+def compact_vaccination_data(data: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    """
+    Convertit les données de vaccination en représentation compacte.
+
+    Les colonnes texte deviennent des Categorical partageant la même table de
+    codes, YEAR passe en int16, COVERAGE en float32, et TARGET_NUMBER/DOSES en
+    float32 lorsque c'est sans perte.
+
+    Args:
+        data: DataFrame de vaccination (tel que chargé depuis le CSV)
+
+    Returns:
+        Tuple (DataFrame compact, rapport mémoire avec les octets économisés)
+    """
+    before = data.memory_usage(deep=True)
+    compact = data.copy()
+
+    text_columns = [col for col in TEXT_COLUMNS if col in compact.columns]
+    code_table = build_code_table(compact, text_columns)
+    for column in text_columns:
+        compact[column] = compact[column].astype(code_table)
+
+    for column, target in NUMERIC_DOWNCASTS.items():
+        if column in compact.columns and pd.api.types.is_numeric_dtype(compact[column]):
+            compact[column] = _downcast_numeric(compact[column], target)
+
+    for column in LOSSLESS_FLOAT_COLUMNS:
+        if column in compact.columns and pd.api.types.is_float_dtype(compact[column]):
+            compact[column] = _downcast_float_lossless(compact[column])
+
+    after = compact.memory_usage(deep=True)
+    report = {
+        'bytes_before': int(before.sum()),
+        'bytes_after': int(after.sum()),
+        'bytes_saved': int(before.sum() - after.sum()),
+        'code_table_size': len(code_table.categories),
+        'columns': {
+            str(column): {
+                'dtype': str(compact[column].dtype),
+                'bytes_before': int(before[column]),
+                'bytes_after': int(after[column]),
+            }
+            for column in compact.columns
+        },
+    }
+
+    return compact, report
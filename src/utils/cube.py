@@ -0,0 +1,240 @@
+"""
+Cube OLAP pré-agrégé de la couverture vaccinale.
+
+Le cube est construit une seule fois au chargement : somme, nombre de valeurs,
+minimum, maximum (et nombre de lignes) de COVERAGE sur
+YEAR × NAME × ANTIGEN × COVERAGE_CATEGORY, ainsi que les agrégats de tous les
+sous-ensembles de ces dimensions (rollups). Une requête « moyenne par X avec
+les filtres F » est alors une simple lecture dans la table du rollup X ∪ F,
+dont la taille dépend du nombre de valeurs distinctes et non du nombre de
+lignes brutes.
+"""
+
+from itertools import combinations
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+CUBE_DIMENSIONS: List[str] = ['YEAR', 'NAME', 'ANTIGEN', 'COVERAGE_CATEGORY']
+CUBE_VALUE_COLUMN: str = 'COVERAGE'
+
+# Règle de combinaison de chaque mesure lors d'un rollup
+_MEASURE_ROLLUP: Dict[str, str] = {
+    'sum': 'sum',
+    'count': 'sum',
+    'min': 'min',
+    'max': 'max',
+    'size': 'sum',
+}
+
+_FILTER_DIMENSIONS: Dict[str, str] = {
+    'year': 'YEAR',
+    'country': 'NAME',
+    'antigen': 'ANTIGEN',
+    'coverage_category': 'COVERAGE_CATEGORY',
+}
+
+
+class CoverageCube:
+    """
+    Cube d'agrégats de COVERAGE avec tous ses rollups.
+
+    Attributes:
+        dimensions: Dimensions du cube, dans l'ordre canonique
+        value_column: Colonne agrégée
+        rollups: Pour chaque sous-ensemble de dimensions, la table des mesures
+            (sum, count, min, max, size) indexée par ces dimensions
+    """
+
+    def __init__(
+        self,
+        dimensions: List[str],
+        value_column: str,
+        rollups: Dict[FrozenSet[str], pd.DataFrame]
+    ) -> None:
+        self.dimensions = dimensions
+        self.value_column = value_column
+        self.rollups = rollups
+
+    @property
+    def n_cells(self) -> int:
+        """Nombre de cellules de la table la plus fine."""
+        return len(self.rollups[frozenset(self.dimensions)])
+
+    def where(
+        self,
+        year: Optional[int] = None,
+        country: Optional[str] = None,
+        antigen: Optional[str] = None,
+        coverage_category: Optional[str] = None
+    ) -> "CubeView":
+        """
+        Restreint le cube aux filtres globaux du dashboard.
+
+        Mêmes conventions que get_filtered_data : None (ou "Toutes" pour la
+        catégorie) signifie « pas de filtre ».
+
+        Args:
+            year: Année à filtrer (optionnel)
+            country: Pays à filtrer (optionnel)
+            antigen: Antigène à filtrer (optionnel)
+            coverage_category: Catégorie de couverture à filtrer (optionnel)
+
+        Returns:
+            Vue filtrée du cube
+        """
+        values = {
+            'year': year,
+            'country': country,
+            'antigen': antigen,
+            'coverage_category': None if coverage_category == "Toutes" else coverage_category,
+        }
+        filters = {
+            _FILTER_DIMENSIONS[name]: value
+            for name, value in values.items()
+            if value is not None and _FILTER_DIMENSIONS[name] in self.dimensions
+        }
+        return CubeView(self, filters)
+
+
+class CubeView:
+    """
+    Vue d'un cube restreinte à un jeu de filtres d'égalité.
+
+    Attributes:
+        cube: Cube sous-jacent
+        filters: Dictionnaire dimension → valeur filtrée
+    """
+
+    def __init__(self, cube: CoverageCube, filters: Dict[str, Any]) -> None:
+        self.cube = cube
+        self.filters = filters
+
+    @property
+    def is_empty(self) -> bool:
+        """True si aucune ligne brute ne correspond aux filtres."""
+        return int(self.rollup([])['size'].sum()) == 0
+
+    def supports(self, columns: Iterable[str], value_column: str) -> bool:
+        """
+        Indique si la vue peut répondre à un agrégat sur ces colonnes.
+
+        Args:
+            columns: Colonnes de regroupement demandées
+            value_column: Colonne agrégée demandée
+
+        Returns:
+            True si toutes les colonnes sont des dimensions du cube
+        """
+        return value_column == self.cube.value_column and all(
+            column in self.cube.dimensions for column in columns
+        )
+
+    def rollup(self, by: List[str]) -> pd.DataFrame:
+        """
+        Agrège les mesures par les dimensions `by`, filtres appliqués.
+
+        Équivalent à `filtered.groupby(by)[value_column].agg(...)` sur les
+        lignes brutes filtrées, mais lu directement dans le cube.
+
+        Args:
+            by: Dimensions de regroupement (ordre du résultat)
+
+        Returns:
+            DataFrame indexé par `by` avec les colonnes
+            sum, count, min, max, size et mean (trié comme un groupby)
+        """
+        dimensions = self.cube.dimensions
+        concrete = set(by) | set(self.filters)
+        table = self.cube.rollups[frozenset(concrete)]
+        levels = [dim for dim in dimensions if dim in concrete]
+        result = _select(table, levels, self.filters, keep=by)
+
+        if by:
+            if len(by) > 1 and list(result.index.names) != list(by):
+                result = result.reorder_levels(by).sort_index()
+            result = result[~_index_has_na(result.index)]
+        else:
+            result = result.reset_index(drop=True)
+
+        result = result.copy()
+        with np.errstate(invalid='ignore', divide='ignore'):
+            result['mean'] = result['sum'] / result['count'].where(result['count'] > 0)
+        return result
+
+
+def _select(
+    table: pd.DataFrame,
+    levels: List[str],
+    filters: Dict[str, Any],
+    keep: List[str]
+) -> pd.DataFrame:
+    """Sélectionne les lignes d'une table de rollup et retire les niveaux filtrés hors `keep`."""
+    filter_levels = [level for level in levels if level in filters]
+    if not filter_levels:
+        return table
+
+    if table.index.nlevels == 1:
+        selected = table[np.asarray(table.index == filters[levels[0]])]
+    else:
+        selectors = [[filters[level]] if level in filters else slice(None) for level in levels]
+        try:
+            positions = table.index.get_locs(selectors)
+        except (KeyError, TypeError):
+            positions = np.empty(0, dtype=np.intp)
+        selected = table.iloc[positions]
+
+    dropped = [level for level in filter_levels if level not in keep]
+    if len(dropped) == len(levels):
+        return selected.reset_index(drop=True)
+    return selected.droplevel(dropped) if dropped else selected
+
+
+def _index_has_na(index: pd.Index) -> np.ndarray:
+    """Masque des entrées d'index contenant une valeur manquante."""
+    if isinstance(index, pd.MultiIndex):
+        return np.any([codes == -1 for codes in index.codes], axis=0) \
+            if len(index) else np.zeros(0, dtype=bool)
+    return np.asarray(index.isna())
+
+
+def build_coverage_cube(
+    data: pd.DataFrame,
+    dimensions: Optional[List[str]] = None,
+    value_column: str = CUBE_VALUE_COLUMN
+) -> CoverageCube:
+    """
+    Construit le cube d'agrégats et tous ses rollups.
+
+    La table la plus fine est calculée une fois sur les lignes brutes ; chaque
+    rollup est ensuite dérivé de cette table (et non des lignes brutes).
+
+    Args:
+        data: DataFrame contenant les données
+        dimensions: Dimensions du cube (défaut: CUBE_DIMENSIONS présentes dans data)
+        value_column: Colonne numérique agrégée
+
+    Returns:
+        Cube prêt à être interrogé via where(...).rollup(...)
+    """
+    if dimensions is None:
+        dimensions = [dim for dim in CUBE_DIMENSIONS if dim in data.columns]
+
+    base = data.groupby(dimensions, observed=True, dropna=False, sort=True)[value_column].agg(
+        ['sum', 'count', 'min', 'max', 'size']
+    )
+
+    rollups: Dict[FrozenSet[str], pd.DataFrame] = {frozenset(dimensions): base}
+    for size in range(len(dimensions) - 1, -1, -1):
+        for subset in combinations(dimensions, size):
+            if subset:
+                table = base.groupby(
+                    level=list(subset), observed=True, dropna=False, sort=True
+                ).agg(_MEASURE_ROLLUP)
+            else:
+                table = base.agg(_MEASURE_ROLLUP).to_frame().T
+            rollups[frozenset(subset)] = table
+
+    return CoverageCube(dimensions=list(dimensions), value_column=value_column, rollups=rollups)
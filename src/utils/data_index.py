@@ -0,0 +1,109 @@
+"""
+Index inversé des colonnes de filtre pour get_filtered_data.
+
+Pour chaque valeur de YEAR, NAME, ANTIGEN et COVERAGE_CATEGORY, l'index stocke
+le tableau trié des positions de lignes correspondantes. Il est construit une
+seule fois au chargement : un filtre devient alors une intersection de
+tableaux précalculés suivie d'un unique `take`, sans copie complète ni
+parcours des colonnes.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+
+INDEXED_COLUMNS: List[str] = ['YEAR', 'NAME', 'ANTIGEN', 'COVERAGE_CATEGORY']
+
+_EMPTY_POSITIONS: np.ndarray = np.empty(0, dtype=np.intp)
+
+
+class DataIndex:
+    """
+    Index inversé (valeur → positions triées) sur les colonnes de filtre.
+
+    Attributes:
+        n_rows: Nombre de lignes du DataFrame indexé
+        postings: Pour chaque colonne, dictionnaire valeur → positions triées
+    """
+
+    def __init__(self, n_rows: int, postings: Dict[str, Dict[Any, np.ndarray]]) -> None:
+        self.n_rows = n_rows
+        self.postings = postings
+
+    def lookup(self, column: str, value: Any) -> np.ndarray:
+        """
+        Retourne les positions des lignes où `column == value`.
+
+        Args:
+            column: Colonne indexée
+            value: Valeur recherchée
+
+        Returns:
+            Tableau trié des positions (vide si la valeur est absente)
+        """
+        return self.postings[column].get(value, _EMPTY_POSITIONS)
+
+    def select(self, conditions: Dict[str, Any]) -> Optional[np.ndarray]:
+        """
+        Calcule les positions satisfaisant toutes les égalités demandées.
+
+        Les listes de positions sont intersectées de la plus courte à la plus
+        longue, ce qui borne le coût par la sélectivité du filtre le plus fin.
+
+        Args:
+            conditions: Dictionnaire colonne → valeur (colonnes indexées uniquement)
+
+        Returns:
+            Positions triées, ou None si aucune condition n'est active
+        """
+        if not conditions:
+            return None
+
+        candidates = sorted(
+            (self.lookup(column, value) for column, value in conditions.items()),
+            key=len
+        )
+        positions = candidates[0]
+        for other in candidates[1:]:
+            if len(positions) == 0:
+                break
+            positions = np.intersect1d(positions, other, assume_unique=True)
+
+        return positions
+
+
+def _build_postings(series: pd.Series) -> Dict[Any, np.ndarray]:
+    """Construit le dictionnaire valeur → positions triées d'une colonne."""
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    order = np.argsort(codes, kind='stable').astype(np.intp, copy=False)
+
+    # Les valeurs manquantes (code -1) sont en tête après le tri : on les saute
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    bounds = np.concatenate(([0], np.cumsum(counts))) + (len(codes) - counts.sum())
+
+    return {
+        value: order[bounds[code]:bounds[code + 1]]
+        for code, value in enumerate(uniques.tolist())
+    }
+
+
+def build_data_index(data: pd.DataFrame, columns: Optional[List[str]] = None) -> DataIndex:
+    """
+    Construit l'index inversé des colonnes de filtre.
+
+    Args:
+        data: DataFrame contenant les données
+        columns: Colonnes à indexer (défaut: INDEXED_COLUMNS présentes dans data)
+
+    Returns:
+        Index prêt à être passé à get_filtered_data
+    """
+    if columns is None:
+        columns = [col for col in INDEXED_COLUMNS if col in data.columns]
+
+    return DataIndex(
+        n_rows=len(data),
+        postings={column: _build_postings(data[column]) for column in columns}
+    )
@@ -0,0 +1,309 @@
+"""
+Registre du jeu de données servi, rechargé à chaud quand le fichier change.
+
+Le registre détient la version courante du jeu de données : le DataFrame et
+les structures qui en dérivent (figures de la page d'accueil, layout...),
+enregistrées par `derive`. Un thread surveille le fichier source ; dès qu'il
+change (et a fini d'être écrit), la nouvelle version est chargée, indexée et
+préparée en tâche de fond, puis substituée à l'ancienne en une seule
+affectation. Un callback lit `registry.current()` une fois au début : s'il
+était en cours pendant la substitution, il se termine sur l'ancienne version.
+
+Le thread de surveillance est démarré à la première lecture dans chaque
+processus, ce qui couvre les workers créés par fork après le préchargement.
+
+En démarrage rapide, le registre est créé vide et la première version est
+chargée en tâche de fond (load_in_background) : `current()` retourne None
+jusqu'à ce qu'elle soit prête.
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from src.utils.figure_cache import compute_dataset_version
+
+
+class DatasetVersion:
+    """
+    Version immuable du jeu de données servi et de ses structures dérivées.
+
+    Attributes:
+        data: DataFrame complet
+        version: Empreinte du jeu de données (voir compute_dataset_version)
+        loaded_at: Horodatage du chargement (secondes epoch)
+        derived: Structures dérivées, par nom
+    """
+
+    def __init__(self, data: pd.DataFrame, derived: Optional[Dict[str, Any]] = None) -> None:
+        self.data = data
+        self.version = compute_dataset_version(data)
+        self.loaded_at = time.time()
+        self.derived: Dict[str, Any] = derived or {}
+
+    def get(self, name: str) -> Any:
+        """Retourne une structure dérivée enregistrée par DataRegistry.derive."""
+        return self.derived[name]
+
+
+class DataRegistry:
+    """
+    Jeu de données courant, avec rechargement à chaud depuis le fichier source.
+
+    Attributes:
+        source_path: Fichier surveillé (None : pas de surveillance)
+        loader: Fonction de chargement d'une nouvelle version
+        poll_interval: Délai entre deux vérifications du fichier (secondes)
+        yield_interval: Pause entre deux étapes d'un chargement en tâche de
+            fond (secondes), pour laisser le GIL aux requêtes en cours
+        background_nice: Incrément de priorité (nice) des threads de
+            chargement et de surveillance (Linux ; 0 : inchangée)
+    """
+
+    def __init__(
+        self,
+        data: Optional[pd.DataFrame],
+        source_path: Optional[Path] = None,
+        loader: Optional[Callable[[], pd.DataFrame]] = None,
+        poll_interval: float = 5.0,
+        yield_interval: float = 0.0,
+        background_nice: int = 0
+    ) -> None:
+        self.source_path = Path(source_path) if source_path is not None else None
+        self.loader = loader
+        self.poll_interval = poll_interval
+        self.yield_interval = yield_interval
+        self.background_nice = background_nice
+        self._created = time.perf_counter()
+        self._current = DatasetVersion(data) if data is not None else None
+        self._builders: List[Tuple[str, Callable[[DatasetVersion], Any]]] = []
+        self._before_swap: List[Callable[[DatasetVersion], None]] = []
+        self._after_swap: List[Callable[[DatasetVersion, DatasetVersion], None]] = []
+        self._when_ready: List[Callable[[DatasetVersion], None]] = []
+        self._reload_lock = threading.Lock()
+        self._watch_lock = threading.Lock()
+        self._watch_pid: Optional[int] = None
+        self._stats: Dict[str, Any] = {
+            'ready_seconds': 0.0 if data is not None else None,
+            'reloads': 0,
+            'failures': 0,
+            'last_reload_seconds': None,
+            'last_error': None,
+        }
+        self._source_stat = self._stat_source()
+
+    @property
+    def ready(self) -> bool:
+        """Indique si une version du jeu de données est servie."""
+        return self._current is not None
+
+    def current(self) -> Optional[DatasetVersion]:
+        """
+        Retourne la version servie (et démarre la surveillance dans ce processus).
+
+        Returns:
+            Version courante du jeu de données (None tant que le chargement
+            initial en tâche de fond n'est pas terminé)
+        """
+        if self._watch_pid != os.getpid():
+            self._start_watching()
+        return self._current
+
+    def derive(self, name: str, build: Callable[[DatasetVersion], Any]) -> Any:
+        """
+        Enregistre une structure dérivée des données, reconstruite à chaque version.
+
+        Elle est construite immédiatement pour la version courante (s'il y en
+        a une), puis en tâche de fond pour chaque nouvelle version, avant la
+        substitution. Les structures sont construites dans l'ordre
+        d'enregistrement : une structure peut utiliser celles enregistrées
+        avant elle.
+
+        Args:
+            name: Nom de la structure (DatasetVersion.get)
+            build: Fonction version → structure
+
+        Returns:
+            Structure construite pour la version courante, ou None si aucune
+            version n'est encore chargée
+        """
+        self._builders.append((name, build))
+        if self._current is None:
+            return None
+        self._current.derived[name] = build(self._current)
+        return self._current.derived[name]
+
+    def when_ready(self, hook: Callable[[DatasetVersion], None]) -> None:
+        """
+        Enregistre une action exécutée une fois la première version servie.
+
+        L'action est exécutée immédiatement si les données sont déjà chargées.
+
+        Args:
+            hook: Fonction appelée avec la première version
+        """
+        if self._current is not None:
+            hook(self._current)
+        else:
+            self._when_ready.append(hook)
+
+    def before_swap(self, hook: Callable[[DatasetVersion], None]) -> None:
+        """Enregistre une préparation exécutée en tâche de fond sur la nouvelle version, avant substitution."""
+        self._before_swap.append(hook)
+
+    def after_swap(self, hook: Callable[[DatasetVersion, DatasetVersion], None]) -> None:
+        """Enregistre une action exécutée après substitution (nouvelle version, ancienne version)."""
+        self._after_swap.append(hook)
+
+    def load_in_background(self) -> threading.Thread:
+        """
+        Charge la première version du jeu de données en tâche de fond.
+
+        Returns:
+            Thread démarré (daemon)
+        """
+        def load() -> None:
+            self._lower_priority()
+            self.reload()
+
+        thread = threading.Thread(target=load, name='data-registry-load', daemon=True)
+        thread.start()
+        return thread
+
+    def reload(self) -> bool:
+        """
+        Charge, prépare puis substitue une nouvelle version du jeu de données.
+
+        En cas d'erreur de chargement, l'ancienne version reste servie. La
+        première version (démarrage rapide) est servie sans attendre les
+        préparations de before_swap.
+
+        Returns:
+            True si une nouvelle version est servie
+        """
+        if self.loader is None:
+            return False
+        with self._reload_lock:
+            start = time.perf_counter()
+            previous = self._current
+            try:
+                data = self.loader()
+                candidate = DatasetVersion(data)
+                if previous is not None and candidate.version == previous.version:
+                    return False
+                for name, build in self._builders:
+                    self.pause()
+                    candidate.derived[name] = build(candidate)
+                if previous is not None:
+                    for hook in self._before_swap:
+                        self.pause()
+                        hook(candidate)
+            except Exception as error:
+                self._stats['failures'] += 1
+                self._stats['last_error'] = str(error)
+                kept = f"version {previous.version} conservée" if previous is not None else "aucune donnée servie"
+                print(f"⚠️  Chargement des données abandonné, {kept}: {error}")
+                return False
+
+            self._current = candidate
+            seconds = time.perf_counter() - start
+            if previous is None:
+                self._stats['ready_seconds'] = time.perf_counter() - self._created
+                hooks, self._when_ready = self._when_ready, []
+                for hook in hooks:
+                    hook(candidate)
+                print(f"✓ Données prêtes ({len(data)} enregistrements, version {candidate.version}) en {seconds:.1f} s")
+                return True
+
+            for hook in self._after_swap:
+                hook(candidate, previous)
+            self._stats['reloads'] += 1
+            self._stats['last_reload_seconds'] = seconds
+            print(f"🔄 Données rechargées ({len(data)} enregistrements, version {candidate.version}) en {seconds:.1f} s")
+            return True
+
+    def _lower_priority(self) -> None:
+        """
+        Abaisse la priorité du thread courant (chargement en tâche de fond).
+
+        Sous Linux, la priorité (nice) s'applique par thread : sur un
+        processeur chargé, les threads qui servent les requêtes passent
+        d'abord. Sans effet ailleurs.
+        """
+        if self.background_nice <= 0 or not hasattr(os, 'setpriority'):
+            return
+        try:
+            thread_id = threading.get_native_id()
+            os.setpriority(os.PRIO_PROCESS, thread_id, os.getpriority(os.PRIO_PROCESS, thread_id) + self.background_nice)
+        except OSError:
+            pass
+
+    def pause(self) -> None:
+        """
+        Cède le GIL entre deux étapes d'un chargement en tâche de fond.
+
+        Les requêtes servies pendant le chargement attendent le GIL derrière
+        lui ; une courte pause entre les étapes leur laisse la main.
+        """
+        if self.yield_interval > 0:
+            time.sleep(self.yield_interval)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retourne l'état du registre.
+
+        Returns:
+            Dictionnaire {ready, version, n_rows, loaded_at, ready_seconds, reloads, ...}
+        """
+        current = self._current
+        return {
+            'ready': current is not None,
+            'version': current.version if current is not None else None,
+            'n_rows': len(current.data) if current is not None else 0,
+            'loaded_at': current.loaded_at if current is not None else None,
+            'watching': str(self.source_path) if self.source_path is not None else None,
+            **self._stats,
+        }
+
+    def _stat_source(self) -> Optional[Tuple[int, int]]:
+        """Taille et date de modification du fichier surveillé (None s'il est absent)."""
+        if self.source_path is None:
+            return None
+        try:
+            stat = self.source_path.stat()
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+    def _start_watching(self) -> None:
+        """Démarre le thread de surveillance du fichier source dans ce processus."""
+        with self._watch_lock:
+            if self._watch_pid == os.getpid():
+                return
+            self._watch_pid = os.getpid()
+        if self.source_path is None or self.loader is None or self.poll_interval <= 0:
+            return
+        thread = threading.Thread(target=self._watch, name='data-registry-watch', daemon=True)
+        thread.start()
+
+    def _watch(self) -> None:
+        """Recharge les données quand le fichier source a changé puis s'est stabilisé."""
+        self._lower_priority()
+        pending: Optional[Tuple[int, int]] = None
+        while True:
+            time.sleep(self.poll_interval)
+            stat = self._stat_source()
+            if stat is None or stat == self._source_stat:
+                pending = None
+                continue
+            # Fichier en cours d'écriture : attendre deux relevés identiques
+            if stat != pending:
+                pending = stat
+                continue
+            self._source_stat = stat
+            pending = None
+            self.reload()
@@ -0,0 +1,267 @@
+"""
+Cache de figures sur disque partagé entre processus.
+
+Les figures (JSON Plotly) sont stockées dans un fichier SQLite commun à tous
+les workers du serveur : une figure construite par un worker est réutilisée
+par les autres. Un cache LRU en mémoire placé devant évite les lectures
+disque répétées. Les clés combinent l'identifiant du callback, les valeurs
+des filtres, la version du jeu de données et celle des réglages de rendu
+(sérialiseur, template, palette...) : un nouveau jeu de données ou un
+changement de configuration ne relit jamais les figures construites avant.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Union
+
+import pandas as pd
+from plotly.utils import PlotlyJSONEncoder
+
+from src.utils.cache import LRUCache
+
+
+def compute_dataset_version(data: pd.DataFrame) -> str:
+    """
+    Calcule une empreinte du contenu d'un DataFrame.
+
+    Args:
+        data: DataFrame contenant les données
+
+    Returns:
+        Empreinte hexadécimale courte (16 caractères)
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps(list(map(str, data.columns))).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+
+def compute_render_version(settings: Dict[str, Any]) -> str:
+    """
+    Calcule une empreinte des réglages qui changent le rendu des figures.
+
+    Args:
+        settings: Réglages de rendu (sérialiseur, template, palette...), sérialisables en JSON
+
+    Returns:
+        Empreinte hexadécimale courte (8 caractères)
+    """
+    payload = json.dumps(settings, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:8]
+
+
+def make_figure_key(callback_id: str, filters: tuple, dataset_version: str, render_version: str = '') -> str:
+    """
+    Construit la clé d'une figure en cache.
+
+    Args:
+        callback_id: Identifiant du graphique (ex: 'exploration_1:histogram')
+        filters: Clé normalisée des filtres (voir make_filter_key)
+        dataset_version: Version du jeu de données (compute_dataset_version)
+        render_version: Version des réglages de rendu (compute_render_version)
+
+    Returns:
+        Clé textuelle stable entre processus
+    """
+    return json.dumps([dataset_version, render_version, callback_id, list(filters)], separators=(',', ':'))
+
+
+class FigureCache:
+    """
+    Cache de figures SQLite partagé entre processus, avec LRU en mémoire.
+
+    Attributes:
+        path: Chemin du fichier SQLite
+        max_bytes: Taille maximale des figures stockées (octets compressés)
+        max_age: Âge maximal d'une entrée en secondes
+        disk_hits: Lectures servies depuis le disque (processus courant)
+        disk_misses: Lectures disque infructueuses (processus courant)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        max_bytes: int = 256 * 1024 * 1024,
+        max_age: float = 7 * 24 * 3600,
+        memory_size: int = 128
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.disk_hits = 0
+        self.disk_misses = 0
+        self.memory = LRUCache(maxsize=memory_size)
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS figures ("
+                "key TEXT PRIMARY KEY, payload BLOB NOT NULL, size INTEGER NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS figures_accessed ON figures(accessed)")
+
+    def _connection(self) -> sqlite3.Connection:
+        """Connexion SQLite propre au thread (et au processus) courant."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None or getattr(self._local, 'pid', None) != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            # WAL : lectures concurrentes des workers pendant une écriture
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def _count(self, hit: bool) -> None:
+        with self._stats_lock:
+            if hit:
+                self.disk_hits += 1
+            else:
+                self.disk_misses += 1
+
+    def read(self, key: str) -> Optional[Any]:
+        """
+        Lit une figure sur disque (sans passer par le LRU en mémoire).
+
+        Args:
+            key: Clé de la figure
+
+        Returns:
+            Figure sous forme de dictionnaire JSON, ou None si absente ou expirée
+        """
+        now = time.time()
+        connection = self._connection()
+        row = connection.execute(
+            "SELECT payload FROM figures WHERE key = ? AND created >= ?",
+            (key, now - self.max_age)
+        ).fetchone()
+        if row is None:
+            self._count(hit=False)
+            return None
+        connection.execute("UPDATE figures SET accessed = ? WHERE key = ?", (now, key))
+        self._count(hit=True)
+        return json.loads(zlib.decompress(row[0]))
+
+    def write(self, key: str, figure: Any) -> int:
+        """
+        Écrit une figure sur disque puis applique l'éviction.
+
+        Args:
+            key: Clé de la figure
+            figure: Figure Plotly (ou structure JSON contenant des figures)
+
+        Returns:
+            Taille stockée en octets
+        """
+        payload = zlib.compress(json.dumps(figure, cls=PlotlyJSONEncoder).encode('utf-8'), 6)
+        now = time.time()
+        connection = self._connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO figures (key, payload, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+            (key, payload, len(payload), now, now)
+        )
+        self.evict()
+        return len(payload)
+
+    def evict(self) -> int:
+        """
+        Supprime les entrées expirées, puis les moins récemment lues
+        jusqu'à repasser sous max_bytes.
+
+        Returns:
+            Nombre d'entrées supprimées
+        """
+        connection = self._connection()
+        removed = connection.execute(
+            "DELETE FROM figures WHERE created < ?", (time.time() - self.max_age,)
+        ).rowcount
+
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM figures").fetchone()[0]
+        if total > self.max_bytes:
+            excess = total - self.max_bytes
+            freed = 0
+            victims = []
+            for key, size in connection.execute("SELECT key, size FROM figures ORDER BY accessed"):
+                victims.append((key,))
+                freed += size
+                if freed >= excess:
+                    break
+            connection.executemany("DELETE FROM figures WHERE key = ?", victims)
+            removed += len(victims)
+        return removed
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Retourne la figure en mémoire, sinon sur disque, sinon la calcule et la stocke.
+
+        Args:
+            key: Clé de la figure (voir make_figure_key)
+            compute: Fonction sans argument construisant la figure
+
+        Returns:
+            Figure (objet Plotly si calculée, dictionnaire JSON si relue)
+        """
+        def load() -> Any:
+            figure = self.read(key)
+            if figure is None:
+                figure = compute()
+                self.write(key, figure)
+            return figure
+
+        return self.memory.get_or_compute(key, load)
+
+    def forget_version(self, dataset_version: str) -> int:
+        """
+        Retire du LRU en mémoire les figures d'une version du jeu de données.
+
+        Les entrées sur disque restent lisibles par les autres processus qui
+        servent encore cette version ; l'éviction par âge les supprimera.
+
+        Args:
+            dataset_version: Version remplacée
+
+        Returns:
+            Nombre d'entrées retirées
+        """
+        return self.memory.discard(lambda key: json.loads(key)[0] == dataset_version)
+
+    def clear(self) -> None:
+        """Vide le cache en mémoire et sur disque."""
+        self.memory.clear()
+        self._connection().execute("DELETE FROM figures")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retourne les statistiques du cache.
+
+        Returns:
+            Dictionnaire {memory, disk} ; disk contient hits, misses, hit_rate,
+            entries, bytes, max_bytes et max_age (pas le chemin du fichier :
+            ces statistiques sont servies sur /_cache/stats)
+        """
+        entries, total = self._connection().execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM figures"
+        ).fetchone()
+        with self._stats_lock:
+            lookups = self.disk_hits + self.disk_misses
+            disk = {
+                'hits': self.disk_hits,
+                'misses': self.disk_misses,
+                'hit_rate': self.disk_hits / lookups if lookups else 0.0,
+            }
+        disk.update({
+            'entries': entries,
+            'bytes': total,
+            'max_bytes': self.max_bytes,
+            'max_age': self.max_age,
+        })
+        return {'memory': self.memory.stats(), 'disk': disk}
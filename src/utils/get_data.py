@@ -7,31 +7,79 @@ import pandas as pd
 from pathlib import Path
 from typing import Optional
 
+from config import SNAPSHOT_ENABLED, COMPACT_DATA, MMAP_DATA
+from src.utils.compact import compact_vaccination_data
+from src.utils.data_index import DataIndex
+from src.utils.mmap_data import get_mmap_path, read_csv_with_mmap
+from src.utils.snapshot import read_csv_with_snapshot
 
-def get_vaccination_data(use_cleaned: bool = True) -> pd.DataFrame:
+
+def get_data_path(use_cleaned: bool = True) -> Path:
+    """
+    Retourne le chemin du fichier CSV de données.
+    
+    Args:
+        use_cleaned: Si True, cleaneddata.csv, sinon rawdata.csv
+        
+    Returns:
+        Chemin du fichier CSV
+    """
+    base_path = Path(__file__).parent.parent.parent / "data"
+    if use_cleaned:
+        return base_path / "cleaned" / "cleaneddata.csv"
+    return base_path / "raw" / "rawdata.csv"
+
+
+def get_vaccination_data(
+    use_cleaned: bool = True,
+    use_snapshot: bool = SNAPSHOT_ENABLED,
+    compact: bool = COMPACT_DATA,
+    mmap: bool = MMAP_DATA
+) -> pd.DataFrame:
     """
     Récupère les données de vaccination depuis le fichier CSV.
     
     Args:
         use_cleaned: Si True, charge cleaneddata.csv, sinon rawdata.csv
+        use_snapshot: Si True, passe par le snapshot binaire du CSV
+            (créé au premier chargement, reconstruit si le CSV change)
+        compact: Si True, retourne la représentation compacte
+            (colonnes texte en Categorical, YEAR en int16, COVERAGE en float32)
+        mmap: Si True, retourne la représentation compacte adossée à un
+            fichier projeté en mémoire (colonnes en lecture seule, pages
+            partagées entre processus)
         
     Returns:
         DataFrame avec les données de vaccination
     """
-    base_path = Path(__file__).parent.parent.parent / "data"
-    
-    if use_cleaned:
-        file_path = base_path / "cleaned" / "cleaneddata.csv"
-    else:
-        file_path = base_path / "raw" / "rawdata.csv"
+    file_path = get_data_path(use_cleaned)
     
     if not file_path.exists():
         raise FileNotFoundError(f"Fichier non trouvé: {file_path}")
     
+    if mmap:
+        data = read_csv_with_mmap(file_path)
+        print(
+            f"✓ Données projetées en mémoire depuis {get_mmap_path(file_path)} "
+            f"({len(data)} enregistrements, {data.memory_usage(deep=True).sum() / 1e6:.2f} Mo)"
+        )
+        return data
+    
     print(f"✓ Données chargées depuis {file_path} ", end="")
-    data = pd.read_csv(file_path)
+    if use_snapshot:
+        data = read_csv_with_snapshot(file_path)
+    else:
+        data = pd.read_csv(file_path)
     print(f"({len(data)} enregistrements)")
     
+    if compact:
+        data, report = compact_vaccination_data(data)
+        print(
+            f"✓ Mode compact: {report['bytes_before'] / 1e6:.2f} Mo → "
+            f"{report['bytes_after'] / 1e6:.2f} Mo "
+            f"({report['bytes_saved'] / 1e6:.2f} Mo économisés)"
+        )
+    
     return data
 
 
@@ -104,7 +152,8 @@ def get_filtered_data(
     year: Optional[int] = None,
     country: Optional[str] = None,
     antigen: Optional[str] = None,
-    coverage_category: Optional[str] = None
+    coverage_category: Optional[str] = None,
+    index: Optional[DataIndex] = None
 ) -> pd.DataFrame:
     """
     Filtre les données selon les critères spécifiés.
@@ -115,10 +164,31 @@ def get_filtered_data(
         country: Pays à filtrer (optionnel)
         antigen: Antigène à filtrer (optionnel)
         coverage_category: Catégorie de couverture à filtrer (optionnel)
+        index: Index inversé construit sur `data` (optionnel, voir build_data_index).
+            Le filtre se fait alors par intersection de positions, sans copie ;
+            sans filtre actif, `data` est retourné tel quel (lecture seule).
         
     Returns:
         DataFrame filtré
     """
+    if index is not None:
+        if index.n_rows != len(data):
+            raise ValueError("L'index ne correspond pas au DataFrame fourni")
+        
+        conditions = {}
+        if year is not None and "YEAR" in index.postings:
+            conditions["YEAR"] = year
+        if country is not None and "NAME" in index.postings:
+            conditions["NAME"] = country
+        if antigen is not None and "ANTIGEN" in index.postings:
+            conditions["ANTIGEN"] = antigen
+        if coverage_category is not None and "COVERAGE_CATEGORY" in index.postings:
+            if coverage_category != "Toutes":
+                conditions["COVERAGE_CATEGORY"] = coverage_category
+        
+        positions = index.select(conditions)
+        return data if positions is None else data.take(positions)
+    
     filtered = data.copy()
     
     if year is not None and "YEAR" in filtered.columns:
@@ -0,0 +1,181 @@
+"""
+Noyau d'agrégation par groupes sur codes entiers (NumPy).
+
+Sur les petits sous-ensembles filtrés du dashboard (quelques milliers de
+lignes), le coût fixe de `DataFrame.groupby` domine. Ce module factorise les
+clés en codes entiers, les combine en un code unique par base mixte, puis
+agrège avec `np.bincount` / `np.add.at`. Le résultat correspond à
+`data.groupby(keys, observed=True)[value].agg(...)` : mêmes groupes, même
+ordre, mêmes types. Les sommes flottantes peuvent différer au dernier bit,
+pandas utilisant une sommation compensée (Kahan).
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+SUPPORTED_AGGREGATIONS: Tuple[str, ...] = ('mean', 'sum', 'count', 'size')
+
+# Au-delà de ce nombre de combinaisons possibles, les groupes sont
+# renumérotés par np.unique plutôt que par un bincount dense
+_DENSE_LIMIT: int = 1 << 22
+
+
+def _factorize_key(series: pd.Series) -> Tuple[np.ndarray, pd.Index]:
+    """
+    Convertit une clé en codes entiers triés (-1 = manquant).
+
+    Les Categorical réutilisent leurs codes et les entiers à plage réduite
+    sont décalés par leur minimum : aucune table de hachage n'est construite.
+    Le niveau retourné peut contenir des valeurs non observées.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy().astype(np.int64)
+        n_categories = len(series.cat.categories)
+        level = pd.CategoricalIndex(
+            pd.Categorical.from_codes(np.arange(n_categories), dtype=series.dtype),
+            name=series.name
+        )
+        return codes, level
+
+    values = series.to_numpy()
+    if values.dtype.kind in 'iu' and len(values):
+        low, high = int(values.min()), int(values.max())
+        if high - low <= 4 * len(values) + 1024:
+            codes = values.astype(np.int64) - low
+            level = pd.Index(np.arange(low, high + 1).astype(values.dtype), name=series.name)
+            return codes, level
+
+    # Factorisation sur le tableau NumPy brut : évite les vérifications
+    # coûteuses des ExtensionArray (ex: StringArray) sur chaque appel
+    codes, uniques = pd.factorize(np.asarray(series), sort=True, use_na_sentinel=True)
+    level = pd.Index(uniques, name=series.name)
+    if level.dtype != series.dtype:
+        level = level.astype(series.dtype)
+    return codes.astype(np.int64, copy=False), level
+
+
+def _factorize_keys(data: pd.DataFrame, keys: List[str]) -> Tuple[np.ndarray, List[pd.Index], List[int]]:
+    """Combine les codes de chaque clé en un code unique par base mixte (-1 si une clé manque)."""
+    codes_list = []
+    levels = []
+    for key in keys:
+        codes, level = _factorize_key(data[key])
+        codes_list.append(codes)
+        levels.append(level)
+
+    sizes = [len(level) for level in levels]
+    combined = np.zeros(len(data), dtype=np.int64)
+    valid = np.ones(len(data), dtype=bool)
+    for codes, size in zip(codes_list, sizes):
+        combined = combined * size + codes
+        valid &= codes >= 0
+    combined[~valid] = -1
+    return combined, levels, sizes
+
+
+def _build_index(group_codes: np.ndarray, levels: List[pd.Index], sizes: List[int]) -> pd.Index:
+    """Décode les codes combinés (base mixte) en index de groupes."""
+    level_codes = []
+    remainder = group_codes
+    for size in reversed(sizes):
+        remainder, codes = np.divmod(remainder, max(size, 1))
+        level_codes.append(codes)
+    level_codes.reverse()
+
+    if len(levels) == 1:
+        return levels[0].take(level_codes[0])
+    return pd.MultiIndex(
+        levels=levels,
+        codes=level_codes,
+        names=[level.name for level in levels],
+        verify_integrity=False
+    )
+
+
+def group_aggregate(
+    data: pd.DataFrame,
+    keys: Sequence[str],
+    value_column: Optional[str] = None,
+    aggregations: Sequence[str] = ('mean',)
+) -> pd.DataFrame:
+    """
+    Agrège une colonne numérique par groupes de clés.
+
+    Args:
+        data: DataFrame contenant les données
+        keys: Colonnes de regroupement (une ou plusieurs)
+        value_column: Colonne numérique agrégée (inutile pour 'size' seul)
+        aggregations: Agrégations parmi 'mean', 'sum', 'count' et 'size'
+
+    Returns:
+        DataFrame indexé par les groupes observés (triés), une colonne par agrégation
+
+    Raises:
+        ValueError: Si une agrégation n'est pas supportée
+    """
+    keys = list(keys)
+    unknown = [agg for agg in aggregations if agg not in SUPPORTED_AGGREGATIONS]
+    if unknown:
+        raise ValueError(f"Agrégations non supportées: {unknown}")
+
+    combined, levels, sizes = _factorize_keys(data, keys)
+    valid = combined >= 0
+    combined = combined[valid]
+
+    # Renumérotation des groupes observés en identifiants denses et triés
+    n_combinations = int(np.prod(sizes, dtype=object)) if sizes else 0
+    if n_combinations <= _DENSE_LIMIT:
+        sizes_dense = np.bincount(combined, minlength=n_combinations)
+        group_codes = np.flatnonzero(sizes_dense)
+        remap = np.cumsum(sizes_dense > 0) - 1
+        group_ids = remap[combined]
+        group_sizes = sizes_dense[group_codes]
+    else:
+        group_codes, group_ids, group_sizes = np.unique(
+            combined, return_inverse=True, return_counts=True
+        )
+    n_groups = len(group_codes)
+
+    result = {}
+    if value_column is not None and any(agg != 'size' for agg in aggregations):
+        values = data[value_column].to_numpy()
+        if not valid.all():
+            values = values[valid]
+        value_dtype = values.dtype
+        present = ~np.isnan(values) if value_dtype.kind == 'f' else ~pd.isna(values)
+        present_ids = group_ids[present]
+        present_values = values[present]
+
+        counts = np.bincount(present_ids, minlength=n_groups)
+        if np.issubdtype(value_dtype, np.integer) or np.issubdtype(value_dtype, np.bool_):
+            # Somme entière exacte (pas de passage par des poids flottants)
+            sums = np.zeros(n_groups, dtype=np.int64)
+            np.add.at(sums, present_ids, present_values.astype(np.int64))
+            # Comme pandas : retour au type d'origine si les sommes y tiennent
+            sum_dtype = np.dtype(np.int64)
+            if np.issubdtype(value_dtype, np.integer):
+                info = np.iinfo(value_dtype)
+                if not len(sums) or (sums.min() >= info.min and sums.max() <= info.max):
+                    sum_dtype = value_dtype
+            mean_dtype = np.dtype(np.float64)
+        else:
+            sums = np.bincount(present_ids, weights=present_values, minlength=n_groups)
+            sum_dtype = mean_dtype = value_dtype
+
+        for agg in aggregations:
+            if agg == 'sum':
+                result[agg] = sums.astype(sum_dtype)
+            elif agg == 'mean':
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    result[agg] = (sums / np.where(counts > 0, counts, np.nan)).astype(mean_dtype)
+            elif agg == 'count':
+                result[agg] = counts.astype(np.int64)
+
+    if 'size' in aggregations:
+        result['size'] = group_sizes.astype(np.int64)
+
+    index = _build_index(group_codes, levels, sizes)
+    return pd.DataFrame({agg: result[agg] for agg in aggregations}, index=index)
@@ -0,0 +1,243 @@
+"""
+Jeu de données en colonnes projetées en mémoire (mmap), partagé entre processus.
+
+Les colonnes numériques et les codes des colonnes catégorielles sont écrits
+bout à bout dans un fichier binaire à côté du CSV. Chaque processus ouvre ce
+fichier en lecture seule et construit son DataFrame sur des vues NumPy sans
+copie : les pages viennent du cache du système de fichiers, partagées par
+tous les workers quel que soit leur nombre, et le décompte de références de
+Python ne les touche jamais (aucun objet Python n'y est stocké).
+
+Format du fichier :
+    - 8 octets magiques, puis longueur de l'en-tête (uint64 little-endian)
+    - en-tête JSON : clé du CSV source, colonnes (type, décalage, longueur),
+      tables de catégories
+    - tampons des colonnes, alignés sur 64 octets
+
+Le fichier est indexé par la clé du CSV source comme le snapshot : il est
+reconstruit dès que le CSV change. Un remplacement est atomique, et les
+processus qui ont projeté l'ancien fichier continuent de lire l'ancien inode.
+"""
+
+import json
+import os
+import struct
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from config import MMAP_SUFFIX
+from src.utils.compact import compact_vaccination_data
+from src.utils.snapshot import compute_file_fingerprint, is_source_unchanged, read_csv_with_snapshot
+
+
+MMAP_FORMAT_VERSION: int = 1
+_MAGIC: bytes = b"VCMMAP01"
+_HEADER_LENGTH = struct.Struct("<Q")
+_ALIGNMENT: int = 64
+
+
+def get_mmap_path(source_path: Path) -> Path:
+    """
+    Retourne le chemin du fichier de colonnes associé à un fichier source.
+
+    Args:
+        source_path: Chemin du fichier CSV source
+
+    Returns:
+        Chemin du fichier de colonnes (à côté du CSV)
+    """
+    return source_path.with_name(source_path.name + MMAP_SUFFIX)
+
+
+def _padding(offset: int) -> int:
+    """Octets à ajouter pour aligner un décalage."""
+    return -offset % _ALIGNMENT
+
+
+def write_column_file(path: Path, data: pd.DataFrame, meta: Dict[str, Any]) -> Path:
+    """
+    Écrit les colonnes d'un DataFrame dans un fichier projetable en mémoire.
+
+    Les colonnes numériques sont écrites telles quelles, les colonnes
+    catégorielles sous forme de codes (les colonnes partageant le même
+    CategoricalDtype partagent une table de catégories). Les autres colonnes
+    sont d'abord converties en Categorical.
+
+    Args:
+        path: Chemin du fichier à écrire
+        data: DataFrame à écrire
+        meta: Métadonnées libres enregistrées dans l'en-tête (ex: clé du CSV)
+
+    Returns:
+        Chemin du fichier écrit
+    """
+    arrays: List[np.ndarray] = []
+    columns = []
+    dtypes: List[pd.CategoricalDtype] = []
+
+    for column in data.columns:
+        series = data[column]
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biufcmM":
+            array = series.to_numpy()
+            columns.append({"name": str(column), "kind": "values"})
+        else:
+            if not isinstance(series.dtype, pd.CategoricalDtype):
+                series = series.astype("category")
+            if series.dtype not in dtypes:
+                dtypes.append(series.dtype)
+            array = series.array.codes
+            columns.append({"name": str(column), "kind": "codes", "categories": dtypes.index(series.dtype)})
+        arrays.append(np.ascontiguousarray(array))
+
+    # Décalages relatifs au début de la zone de données
+    offset = 0
+    for column, array in zip(columns, arrays):
+        offset += _padding(offset)
+        column.update({"dtype": array.dtype.str, "offset": offset, "length": len(array)})
+        offset += array.nbytes
+
+    header = json.dumps({
+        "format_version": MMAP_FORMAT_VERSION,
+        "meta": meta,
+        "n_rows": len(data),
+        "columns": columns,
+        "categories": [
+            {"values": [str(value) for value in dtype.categories], "ordered": bool(dtype.ordered)}
+            for dtype in dtypes
+        ],
+    }).encode("utf-8")
+
+    fd, tmp_name = tempfile.mkstemp(prefix=path.name + ".", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(_MAGIC + _HEADER_LENGTH.pack(len(header)) + header)
+            start = len(_MAGIC) + _HEADER_LENGTH.size + len(header)
+            handle.write(b"\0" * _padding(start))
+            written = 0
+            for column, array in zip(columns, arrays):
+                handle.write(b"\0" * (column["offset"] - written))
+                array.tofile(handle)
+                written = column["offset"] + array.nbytes
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+    return path
+
+
+def read_column_header(path: Path) -> Optional[Tuple[Dict[str, Any], int]]:
+    """
+    Lit l'en-tête d'un fichier de colonnes.
+
+    Args:
+        path: Chemin du fichier de colonnes
+
+    Returns:
+        Tuple (en-tête, position du début des données), ou None si le fichier
+        est absent, illisible ou d'une autre version
+    """
+    try:
+        with open(path, "rb") as handle:
+            prefix = handle.read(len(_MAGIC) + _HEADER_LENGTH.size)
+            if len(prefix) != len(_MAGIC) + _HEADER_LENGTH.size or not prefix.startswith(_MAGIC):
+                return None
+            (length,) = _HEADER_LENGTH.unpack(prefix[len(_MAGIC):])
+            header = json.loads(handle.read(length).decode("utf-8"))
+    except (OSError, ValueError):
+        return None
+    if header.get("format_version") != MMAP_FORMAT_VERSION:
+        return None
+    start = len(_MAGIC) + _HEADER_LENGTH.size + length
+    return header, start + _padding(start)
+
+
+def open_column_file(path: Path) -> Optional[pd.DataFrame]:
+    """
+    Ouvre un fichier de colonnes en DataFrame adossé au mmap, sans copie.
+
+    Les tableaux sont en lecture seule : toute modification du DataFrame
+    passe par une copie (copy-on-write de pandas).
+
+    Args:
+        path: Chemin du fichier de colonnes
+
+    Returns:
+        DataFrame dont les colonnes sont des vues sur le fichier, ou None si
+        le fichier est absent ou illisible
+    """
+    parsed = read_column_header(path)
+    if parsed is None:
+        return None
+    header, data_start = parsed
+
+    buffer = np.memmap(path, dtype=np.uint8, mode="r")
+    dtypes = [
+        pd.CategoricalDtype(pd.Index(entry["values"]), ordered=entry["ordered"])
+        for entry in header["categories"]
+    ]
+
+    columns: Dict[str, Any] = {}
+    for column in header["columns"]:
+        array = np.frombuffer(
+            buffer, dtype=np.dtype(column["dtype"]), count=column["length"],
+            offset=data_start + column["offset"]
+        )
+        if column["kind"] == "codes":
+            array = pd.Categorical.from_codes(array, dtype=dtypes[column["categories"]])
+        columns[column["name"]] = array
+
+    return pd.DataFrame(columns, copy=False)
+
+
+def load_mmap_data(source_path: Path) -> Optional[pd.DataFrame]:
+    """
+    Ouvre le fichier de colonnes d'un fichier source s'il est à jour.
+
+    Args:
+        source_path: Chemin du fichier CSV source
+
+    Returns:
+        DataFrame adossé au mmap, ou None si le fichier est absent ou périmé
+    """
+    mmap_path = get_mmap_path(source_path)
+    parsed = read_column_header(mmap_path)
+    if parsed is None or not is_source_unchanged(parsed[0]["meta"].get("source", {}), source_path):
+        return None
+    return open_column_file(mmap_path)
+
+
+def read_csv_with_mmap(source_path: Path) -> pd.DataFrame:
+    """
+    Lit un CSV en représentation compacte, adossée à un fichier projeté en mémoire.
+
+    Si le fichier de colonnes est à jour il est ouvert directement ; sinon le
+    CSV est lu (via son snapshot), compacté, écrit dans le fichier de
+    colonnes puis rouvert depuis celui-ci.
+
+    Args:
+        source_path: Chemin du fichier CSV source
+
+    Returns:
+        DataFrame compact (voir compact_vaccination_data) dont les colonnes
+        sont des vues en lecture seule sur le fichier
+    """
+    data = load_mmap_data(source_path)
+    if data is not None:
+        return data
+
+    fingerprint = compute_file_fingerprint(source_path)
+    compact, _ = compact_vaccination_data(read_csv_with_snapshot(source_path))
+    mmap_path = get_mmap_path(source_path)
+    try:
+        write_column_file(mmap_path, compact, {"source": fingerprint})
+    except OSError as error:
+        print(f"\n⚠️  Fichier de colonnes non écrit: {error}")
+        return compact
+
+    return open_column_file(mmap_path)
@@ -0,0 +1,322 @@
+"""
+Pipeline déclaratif d'étapes de traitement d'un DataFrame, avec rapport par étape.
+
+Trois sortes d'étapes, qui déclarent les colonnes qu'elles lisent et écrivent :
+- RowFilter : calcule un masque de lignes à garder, sans modifier les données ;
+- ColumnTransform : calcule de nouvelles valeurs pour les colonnes déclarées
+  en écriture, ligne à ligne, affectées en place dans le DataFrame du
+  pipeline (pas de copie du reste du tableau ni d'affectation chaînée) ;
+- FrameStage : opération sur l'ensemble des lignes (dédoublonnage, tri).
+
+Les filtres consécutifs sont fusionnés : leurs masques sont combinés puis
+appliqués en une seule sélection. Un filtre est aussi remonté avant les
+transformations qui n'écrivent aucune des colonnes qu'il lit, pour rejoindre
+le groupe de filtres précédent et épargner ces transformations aux lignes
+rejetées. Dans un groupe fusionné, chaque masque est évalué sur toutes les
+lignes du groupe : un filtre ne doit pas supposer que les autres ont été
+appliqués avant lui.
+
+Chaque exécution produit un PipelineReport : lignes en entrée et en sortie,
+durée et pic de mémoire (tracemalloc) de chaque étape.
+"""
+
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+class Stage:
+    """
+    Étape d'un pipeline.
+
+    Attributes:
+        name: Nom de l'étape (rapport)
+        reads: Colonnes lues
+        writes: Colonnes écrites
+    """
+
+    kind: str = 'frame'
+
+    def __init__(self, name: str, reads: Sequence[str] = (), writes: Sequence[str] = ()) -> None:
+        self.name = name
+        self.reads = tuple(reads)
+        self.writes = tuple(writes)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.name!r}, reads={list(self.reads)}, writes={list(self.writes)})"
+
+
+class RowFilter(Stage):
+    """Filtre de lignes : `keep(data)` retourne le masque booléen des lignes gardées."""
+
+    kind = 'filter'
+
+    def __init__(self, name: str, reads: Sequence[str], keep: Callable[[pd.DataFrame], Any]) -> None:
+        super().__init__(name, reads)
+        self.keep = keep
+
+    def mask(self, data: pd.DataFrame) -> np.ndarray:
+        """Calcule le masque des lignes gardées."""
+        return np.asarray(self.keep(data), dtype=bool)
+
+
+class ColumnTransform(Stage):
+    """
+    Transformation de colonnes ligne à ligne.
+
+    `compute(data)` retourne un dictionnaire colonne → nouvelles valeurs ;
+    seules les colonnes déclarées dans `writes` peuvent y figurer (une
+    colonne absente du DataFrame peut être omise).
+    """
+
+    kind = 'transform'
+
+    def __init__(
+        self,
+        name: str,
+        reads: Sequence[str],
+        writes: Sequence[str],
+        compute: Callable[[pd.DataFrame], Dict[str, Any]]
+    ) -> None:
+        super().__init__(name, reads, writes)
+        self.compute = compute
+
+    def apply(self, data: pd.DataFrame) -> None:
+        """Affecte en place les colonnes calculées dans le DataFrame du pipeline."""
+        values = self.compute(data)
+        undeclared = set(values) - set(self.writes)
+        if undeclared:
+            raise ValueError(f"Étape {self.name}: colonnes écrites non déclarées {sorted(undeclared)}")
+        for column, column_values in values.items():
+            data[column] = column_values
+
+
+class FrameStage(Stage):
+    """Opération sur l'ensemble des lignes : `apply(data)` retourne le nouveau DataFrame."""
+
+    def __init__(self, name: str, reads: Sequence[str], apply: Callable[[pd.DataFrame], pd.DataFrame]) -> None:
+        super().__init__(name, reads)
+        self.apply = apply
+
+
+class PipelineReport:
+    """
+    Rapport d'exécution d'un pipeline, une entrée par étape exécutée.
+
+    Chaque entrée est un dictionnaire {stage, kind, stages, rows_in, rows_out,
+    seconds, peak_bytes} ; `stages` liste les étapes fusionnées (filtres) et
+    `peak_bytes` est None si la mémoire n'est pas mesurée. Les rapports de
+    plusieurs exécutions (blocs, partitions) s'additionnent avec `merge`.
+    """
+
+    def __init__(self) -> None:
+        self.stages: List[Dict[str, Any]] = []
+
+    def record(
+        self,
+        stage: str,
+        kind: str,
+        rows_in: int,
+        rows_out: int,
+        seconds: float,
+        peak_bytes: Optional[int] = None,
+        stages: Optional[List[str]] = None
+    ) -> None:
+        """
+        Ajoute (ou cumule) les mesures d'une étape.
+
+        Une étape déjà présente voit ses lignes et sa durée additionnées et
+        son pic de mémoire remplacé par le maximum.
+        """
+        for entry in self.stages:
+            if entry['stage'] == stage:
+                entry['rows_in'] += rows_in
+                entry['rows_out'] += rows_out
+                entry['seconds'] += seconds
+                if peak_bytes is not None:
+                    entry['peak_bytes'] = max(entry['peak_bytes'] or 0, peak_bytes)
+                return
+        self.stages.append({
+            'stage': stage,
+            'kind': kind,
+            'stages': stages or [stage],
+            'rows_in': rows_in,
+            'rows_out': rows_out,
+            'seconds': seconds,
+            'peak_bytes': peak_bytes,
+        })
+
+    def merge(self, other: 'PipelineReport') -> 'PipelineReport':
+        """Cumule les mesures d'un autre rapport (ex: bloc ou partition suivante)."""
+        for entry in other.stages:
+            self.record(**entry)
+        return self
+
+    @property
+    def seconds(self) -> float:
+        """Durée totale des étapes."""
+        return sum(entry['seconds'] for entry in self.stages)
+
+    def slowest(self) -> Optional[Dict[str, Any]]:
+        """Retourne l'étape la plus lente (None si le rapport est vide)."""
+        return max(self.stages, key=lambda entry: entry['seconds'], default=None)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Retourne le rapport sous forme sérialisable (JSON)."""
+        return {'seconds': self.seconds, 'stages': [dict(entry) for entry in self.stages]}
+
+    def format(self) -> str:
+        """Met le rapport en forme de tableau."""
+        lines = [
+            f"  {'Étape':<28} | {'Type':>9} | {'Entrée':>9} | {'Sortie':>9} | {'Durée (ms)':>10} | {'Pic (Mo)':>8}",
+            "  " + "-" * 88,
+        ]
+        for entry in self.stages:
+            peak = f"{entry['peak_bytes'] / 1024 ** 2:>8.1f}" if entry['peak_bytes'] is not None else f"{'-':>8}"
+            lines.append(
+                f"  {entry['stage']:<28} | {entry['kind']:>9} | {entry['rows_in']:>9} | "
+                f"{entry['rows_out']:>9} | {entry['seconds'] * 1000:>10.1f} | {peak}"
+            )
+        return "\n".join(lines)
+
+
+class _MemoryProbe:
+    """Pic de mémoire allouée pendant une étape (tracemalloc)."""
+
+    def __init__(self, enabled: bool) -> None:
+        self.enabled = enabled
+        self._started = False
+
+    def __enter__(self) -> '_MemoryProbe':
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started = True
+        return self
+
+    def __exit__(self, *_) -> None:
+        if self._started:
+            tracemalloc.stop()
+
+    def reset(self) -> int:
+        """Remet le pic à zéro et retourne la mémoire allouée courante."""
+        if not self.enabled:
+            return 0
+        tracemalloc.reset_peak()
+        return tracemalloc.get_traced_memory()[0]
+
+    def peak(self, baseline: int) -> Optional[int]:
+        """Pic de mémoire allouée depuis `reset`, au-delà de la mémoire déjà allouée."""
+        if not self.enabled:
+            return None
+        return max(0, tracemalloc.get_traced_memory()[1] - baseline)
+
+
+class Pipeline:
+    """
+    Suite d'étapes exécutée avec fusion des filtres et mesure de chaque étape.
+
+    Attributes:
+        stages: Étapes dans l'ordre déclaré
+    """
+
+    def __init__(self, stages: Sequence[Stage]) -> None:
+        self.stages = list(stages)
+        self._plan = self._build_plan()
+
+    def __add__(self, other: 'Pipeline') -> 'Pipeline':
+        return Pipeline(self.stages + other.stages)
+
+    def _build_plan(self) -> List[List[Stage]]:
+        """
+        Regroupe les étapes en étapes d'exécution.
+
+        Un filtre est remonté avant les transformations précédentes qui
+        n'écrivent aucune des colonnes qu'il lit ; s'il rejoint alors un
+        filtre, leurs masques sont fusionnés.
+        """
+        plan: List[List[Stage]] = []
+        for stage in self.stages:
+            if stage.kind != 'filter':
+                plan.append([stage])
+                continue
+            position = len(plan)
+            while (
+                position > 0
+                and plan[position - 1][0].kind == 'transform'
+                and not set(plan[position - 1][0].writes) & set(stage.reads)
+            ):
+                position -= 1
+            if position > 0 and plan[position - 1][0].kind == 'filter':
+                plan[position - 1].append(stage)
+            else:
+                plan.insert(position, [stage])
+        return plan
+
+    def describe(self) -> List[Dict[str, Any]]:
+        """
+        Retourne le plan d'exécution.
+
+        Returns:
+            Liste de {stages, kind, reads, writes}, une entrée par étape
+            d'exécution (les filtres fusionnés partagent une entrée)
+        """
+        return [
+            {
+                'stages': [stage.name for stage in group],
+                'kind': group[0].kind,
+                'reads': sorted({column for stage in group for column in stage.reads}),
+                'writes': sorted({column for stage in group for column in stage.writes}),
+            }
+            for group in self._plan
+        ]
+
+    def run(self, data: pd.DataFrame, trace_memory: bool = True) -> Tuple[pd.DataFrame, PipelineReport]:
+        """
+        Exécute le pipeline sur un DataFrame.
+
+        Le DataFrame reçu n'est pas modifié : le pipeline travaille sur une
+        copie superficielle (les colonnes ne sont copiées qu'à l'écriture).
+
+        Args:
+            data: DataFrame d'entrée
+            trace_memory: Mesure le pic de mémoire de chaque étape (tracemalloc)
+
+        Returns:
+            Tuple (DataFrame traité, rapport d'exécution)
+        """
+        report = PipelineReport()
+        data = data.copy(deep=False)
+
+        with _MemoryProbe(trace_memory) as probe:
+            for group in self._plan:
+                rows_in = len(data)
+                baseline = probe.reset()
+                start = time.perf_counter()
+
+                kind = group[0].kind
+                if kind == 'filter':
+                    # Copie : le masque d'une Series peut être en lecture seule (copie sur écriture)
+                    mask = group[0].mask(data).copy()
+                    for stage in group[1:]:
+                        mask &= stage.mask(data)
+                    if not mask.all():
+                        data = data.iloc[np.flatnonzero(mask)]
+                elif kind == 'transform':
+                    group[0].apply(data)
+                else:
+                    data = group[0].apply(data)
+
+                report.record(
+                    ' + '.join(stage.name for stage in group),
+                    kind,
+                    rows_in,
+                    len(data),
+                    time.perf_counter() - start,
+                    probe.peak(baseline),
+                    [stage.name for stage in group],
+                )
+
+        return data, report
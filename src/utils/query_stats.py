@@ -0,0 +1,156 @@
+"""
+Compteurs de fréquence des combinaisons de filtres.
+
+Chaque changement des filtres globaux incrémente le compteur de sa clé
+normalisée. Les incréments sont accumulés en mémoire puis fusionnés
+périodiquement dans un fichier JSON local par un thread de fond (jamais sur
+le thread de la requête), sous verrou de fichier pour que plusieurs workers
+puissent y écrire. Les combinaisons les plus demandées
+servent à préchauffer le cache de figures après un (re)chargement.
+"""
+
+import json
+import os
+import tempfile
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows : pas de verrou inter-processus
+    fcntl = None
+
+
+QUERY_STATS_FORMAT_VERSION: int = 1
+
+
+class QueryCounter:
+    """
+    Compteur persistant des combinaisons de filtres reçues.
+
+    Attributes:
+        path: Fichier JSON des compteurs
+        flush_every: Nombre d'incréments en attente réveillant le thread d'écriture
+        flush_interval: Délai maximal (secondes) avant écriture des incréments
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        flush_every: int = 50,
+        flush_interval: float = 30.0
+    ) -> None:
+        self.path = Path(path)
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._pending: Counter = Counter()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._flusher_pid: Optional[int] = None
+
+    def record(self, filters: tuple) -> None:
+        """
+        Compte une occurrence d'une combinaison de filtres.
+
+        L'écriture du fichier est confiée au thread de fond (démarré au
+        premier appel dans chaque processus, ce qui couvre les workers forkés).
+
+        Args:
+            filters: Clé normalisée (year, country, antigen, coverage_category)
+        """
+        if self._flusher_pid != os.getpid():
+            self._start_flusher()
+        with self._lock:
+            self._pending[tuple(filters)] += 1
+            due = sum(self._pending.values()) >= self.flush_every
+        if due:
+            self._wakeup.set()
+
+    def flush(self) -> None:
+        """Fusionne les incréments en attente dans le fichier JSON."""
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+        if not pending:
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path.with_suffix(self.path.suffix + '.lock'), 'w') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            counts = self._read_file()
+            counts.update(pending)
+            self._write_file(counts)
+
+    def _start_flusher(self) -> None:
+        """Démarre le thread d'écriture des compteurs dans ce processus."""
+        with self._lock:
+            if self._flusher_pid == os.getpid():
+                return
+            self._flusher_pid = os.getpid()
+            # Évènement recréé : celui hérité d'un fork peut être dans un état quelconque
+            self._wakeup = threading.Event()
+        thread = threading.Thread(target=self._flush_loop, name='query-stats-flush', daemon=True)
+        thread.start()
+
+    def _flush_loop(self) -> None:
+        """Écrit les incréments en attente à chaque réveil, ou après flush_interval."""
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except OSError as error:
+                print(f"⚠️  Compteurs de filtres non écrits: {error}")
+
+    def counts(self) -> Dict[tuple, int]:
+        """
+        Retourne les compteurs persistés et en attente.
+
+        Returns:
+            Dictionnaire clé de filtres → nombre d'occurrences
+        """
+        counts = self._read_file()
+        with self._lock:
+            counts.update(self._pending)
+        return dict(counts)
+
+    def top(self, k: int) -> List[Tuple[tuple, int]]:
+        """
+        Retourne les k combinaisons les plus fréquentes.
+
+        Args:
+            k: Nombre de combinaisons
+
+        Returns:
+            Liste de (clé de filtres, nombre d'occurrences), par fréquence décroissante
+        """
+        return Counter(self.counts()).most_common(k)
+
+    def _read_file(self) -> Counter:
+        """Lit le fichier de compteurs (vide s'il est absent ou illisible)."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                payload = json.load(file)
+        except (OSError, ValueError):
+            return Counter()
+        if payload.get('version') != QUERY_STATS_FORMAT_VERSION:
+            return Counter()
+        return Counter({tuple(key): count for key, count in payload.get('counts', [])})
+
+    def _write_file(self, counts: Counter) -> None:
+        """Écrit le fichier de compteurs de façon atomique."""
+        payload = {
+            'version': QUERY_STATS_FORMAT_VERSION,
+            'counts': [[list(key), count] for key, count in counts.most_common()],
+        }
+        fd, temp_path = tempfile.mkstemp(dir=self.path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as file:
+                json.dump(payload, file, separators=(',', ':'))
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
@@ -0,0 +1,166 @@
+"""
+Sérialisation compacte des figures renvoyées par les callbacks.
+
+Dash encode les figures avec le moteur JSON de Plotly (orjson s'il est
+installé). Les tableaux NumPy y sont déjà transmis en tableaux typés base64 ;
+l'essentiel des octets restants vient du template (plotly_white), recopié
+dans chaque figure avec les valeurs par défaut de tous les types de traces.
+Le mode compact retire du template ce qui ne concerne aucune trace de la
+figure et convertit les listes numériques restantes en tableaux typés
+(format `{dtype, bdata}` lu nativement par Plotly.js). Le rendu est identique.
+"""
+
+import base64
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import numpy as np
+import plotly.graph_objects as go
+from plotly.io.json import to_json_plotly
+
+try:
+    import orjson  # noqa: F401
+    JSON_ENGINE = 'orjson'
+except ImportError:
+    JSON_ENGINE = 'json'
+
+
+# Sous-graphiques du template et types de traces qui les utilisent
+_SUBPLOT_TRACE_TYPES: Dict[str, set] = {
+    'polar': {'scatterpolar', 'scatterpolargl', 'barpolar'},
+    'ternary': {'scatterternary'},
+    'scene': {'scatter3d', 'surface', 'mesh3d', 'cone', 'streamtube', 'volume', 'isosurface'},
+    'geo': {'scattergeo', 'choropleth'},
+}
+
+# En dessous de cette longueur, une liste reste en JSON (le base64 n'y gagne rien)
+_TYPED_ARRAY_MIN_LENGTH: int = 8
+
+# Plus petits types entiers exacts, dans l'ordre d'essai
+_INTEGER_DTYPES = ('int8', 'uint8', 'int16', 'uint16', 'int32', 'uint32')
+
+
+def _typed_array(values: list) -> Optional[Dict[str, str]]:
+    """Encode une liste de nombres en tableau typé, ou None si elle n'est pas numérique."""
+    if not all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values):
+        return None
+    array = np.asarray(values)
+    if array.dtype.kind == 'i':
+        low, high = array.min(), array.max()
+        for dtype in _INTEGER_DTYPES:
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                array = array.astype(dtype)
+                break
+        else:
+            array = array.astype(np.float64)
+    else:
+        array = array.astype(np.float64)
+    return {'dtype': array.dtype.str.lstrip('<>|='), 'bdata': base64.b64encode(array.tobytes()).decode('ascii')}
+
+
+def _encode_lists(node: Any) -> Any:
+    """Remplace récursivement les longues listes numériques d'une trace par des tableaux typés."""
+    if isinstance(node, dict):
+        return {key: _encode_lists(value) for key, value in node.items()}
+    if isinstance(node, (list, tuple)) and len(node) >= _TYPED_ARRAY_MIN_LENGTH:
+        encoded = _typed_array(list(node))
+        if encoded is not None:
+            return encoded
+    return node
+
+
+def compact_figure(figure: Any) -> Any:
+    """
+    Réduit la taille d'une figure sans en changer le rendu.
+
+    Args:
+        figure: go.Figure, dictionnaire de figure, ou dictionnaire de figures
+            (variantes des graphiques d'exploration)
+
+    Returns:
+        Dictionnaire de figure (ou de figures) compact
+    """
+    if isinstance(figure, go.Figure):
+        figure = figure.to_plotly_json()
+    if not isinstance(figure, dict):
+        return figure
+    if 'data' not in figure and 'layout' not in figure:
+        # Variantes : {type de graphique: figure}
+        return {key: compact_figure(value) for key, value in figure.items()}
+
+    traces = [_encode_lists(trace) for trace in figure.get('data', [])]
+    trace_types = {trace.get('type', 'scatter') for trace in traces}
+
+    layout = dict(figure.get('layout', {}))
+    template = layout.get('template')
+    if isinstance(template, go.layout.Template):
+        template = template.to_plotly_json()
+    if isinstance(template, dict):
+        template_data = {
+            trace_type: defaults
+            for trace_type, defaults in template.get('data', {}).items()
+            if trace_type in trace_types
+        }
+        template_layout = {
+            key: value
+            for key, value in template.get('layout', {}).items()
+            if key not in _SUBPLOT_TRACE_TYPES or trace_types & _SUBPLOT_TRACE_TYPES[key]
+        }
+        layout['template'] = {'data': template_data, 'layout': template_layout}
+
+    return {**figure, 'data': traces, 'layout': layout}
+
+
+class SerializationStats:
+    """
+    Octets et temps d'encodage JSON des réponses, par callback.
+
+    Attributes:
+        engine: Moteur JSON utilisé ('orjson' ou 'json')
+    """
+
+    def __init__(self) -> None:
+        self.engine = JSON_ENGINE
+        self._totals: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def measure(self, name: str, output: Any) -> Dict[str, float]:
+        """
+        Encode une sortie comme le fait Dash et enregistre taille et durée.
+
+        Args:
+            name: Identifiant du callback ou de la figure
+            output: Valeur renvoyée par le callback
+
+        Returns:
+            Dictionnaire {bytes, encode_ms} de cette mesure
+        """
+        start = time.perf_counter()
+        size = len(to_json_plotly(output, engine=self.engine))
+        encode_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            totals = self._totals.setdefault(name, {'count': 0, 'bytes': 0, 'encode_ms': 0.0})
+            totals['count'] += 1
+            totals['bytes'] += size
+            totals['encode_ms'] += encode_ms
+        return {'bytes': size, 'encode_ms': encode_ms}
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Retourne les moyennes par callback.
+
+        Returns:
+            Dictionnaire {engine, callbacks: {nom: {count, avg_bytes, avg_encode_ms}}}
+        """
+        with self._lock:
+            callbacks = {
+                name: {
+                    'count': int(totals['count']),
+                    'avg_bytes': totals['bytes'] / totals['count'],
+                    'avg_encode_ms': totals['encode_ms'] / totals['count'],
+                }
+                for name, totals in self._totals.items()
+            }
+        return {'engine': self.engine, 'callbacks': callbacks}
@@ -0,0 +1,262 @@
+"""
+Cache binaire colonnaire (snapshot) des fichiers CSV de données.
+
+Au premier chargement, le CSV est parsé puis écrit à côté de lui sous forme
+d'archive NumPy (.npz) typée : colonnes numériques telles quelles, colonnes
+texte encodées en codes entiers + table de valeurs. Les chargements suivants
+relisent directement ces tableaux, sans aucun parsing texte.
+
+Le snapshot est indexé par le chemin, la taille, la date de modification et
+l'empreinte SHA-256 du CSV source : il est reconstruit automatiquement dès que
+le CSV change.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from config import SNAPSHOT_SUFFIX, SNAPSHOT_VERIFY_HASH
+
+
+SNAPSHOT_FORMAT_VERSION: int = 1
+_META_KEY: str = "__meta__"
+
+
+def get_snapshot_path(source_path: Path) -> Path:
+    """
+    Retourne le chemin du snapshot associé à un fichier source.
+
+    Args:
+        source_path: Chemin du fichier CSV source
+
+    Returns:
+        Chemin du fichier snapshot (à côté du CSV)
+    """
+    return source_path.with_name(source_path.name + SNAPSHOT_SUFFIX)
+
+
+def compute_file_hash(path: Path, chunk_size: int = 1 << 20) -> str:
+    """
+    Calcule l'empreinte SHA-256 du contenu d'un fichier.
+
+    Args:
+        path: Chemin du fichier
+        chunk_size: Taille des blocs lus (en octets)
+
+    Returns:
+        Empreinte hexadécimale du contenu
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def compute_file_fingerprint(path: Path, with_hash: bool = True) -> Dict[str, Any]:
+    """
+    Calcule la clé d'identification d'un fichier source.
+
+    Args:
+        path: Chemin du fichier
+        with_hash: Si True, inclut l'empreinte SHA-256 du contenu
+
+    Returns:
+        Dictionnaire {path, size, mtime_ns, sha256}
+    """
+    stat = path.stat()
+    return {
+        "path": str(path.resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": compute_file_hash(path) if with_hash else None,
+    }
+
+
+def _is_plain_array_dtype(dtype: Any) -> bool:
+    """Indique si une colonne peut être stockée telle quelle dans le .npz."""
+    return (
+        pd.api.types.is_numeric_dtype(dtype)
+        or pd.api.types.is_bool_dtype(dtype)
+        or pd.api.types.is_datetime64_dtype(dtype)
+    ) and isinstance(dtype, np.dtype)
+
+
+def write_snapshot(source_path: Path, data: pd.DataFrame, fingerprint: Dict[str, Any]) -> Path:
+    """
+    Écrit le snapshot binaire d'un DataFrame issu d'un fichier source.
+
+    L'écriture passe par un fichier temporaire puis un renommage atomique,
+    pour qu'un lecteur concurrent ne voie jamais un snapshot partiel.
+
+    Args:
+        source_path: Chemin du fichier CSV source
+        data: DataFrame parsé depuis le fichier source
+        fingerprint: Clé du fichier source (voir compute_file_fingerprint)
+
+    Returns:
+        Chemin du snapshot écrit
+    """
+    snapshot_path = get_snapshot_path(source_path)
+    arrays: Dict[str, np.ndarray] = {}
+    columns = []
+
+    for position, column in enumerate(data.columns):
+        series = data[column]
+        if _is_plain_array_dtype(series.dtype):
+            arrays[f"{position}:values"] = series.to_numpy()
+            kind = "values"
+        else:
+            codes, uniques = pd.factorize(series, use_na_sentinel=True)
+            arrays[f"{position}:codes"] = codes.astype(np.int32, copy=False)
+            arrays[f"{position}:categories"] = np.asarray(
+                [str(value) for value in uniques], dtype=str
+            )
+            kind = "codes"
+        columns.append({"name": str(column), "kind": kind, "dtype": str(series.dtype)})
+
+    meta = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "source": fingerprint,
+        "n_rows": len(data),
+        "columns": columns,
+    }
+    arrays[_META_KEY] = np.asarray(json.dumps(meta))
+
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=snapshot_path.name + ".", suffix=".tmp", dir=snapshot_path.parent
+    )
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            np.savez(handle, **arrays)  # type: ignore[arg-type]
+        os.replace(tmp_name, snapshot_path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+    return snapshot_path
+
+
+def read_snapshot_meta(source_path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Lit uniquement les métadonnées d'un snapshot.
+
+    Args:
+        source_path: Chemin du fichier CSV source
+
+    Returns:
+        Métadonnées du snapshot, ou None s'il est absent ou illisible
+    """
+    snapshot_path = get_snapshot_path(source_path)
+    if not snapshot_path.exists():
+        return None
+    try:
+        with np.load(snapshot_path, allow_pickle=False) as archive:
+            return json.loads(str(archive[_META_KEY]))
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def is_snapshot_valid(meta: Optional[Dict[str, Any]], source_path: Path) -> bool:
+    """
+    Vérifie qu'un snapshot correspond toujours au fichier source.
+
+    Le chemin, la taille et la date de modification sont comparés d'abord
+    (rejet sans lecture du fichier), puis l'empreinte du contenu si
+    SNAPSHOT_VERIFY_HASH est activé.
+
+    Args:
+        meta: Métadonnées du snapshot (voir read_snapshot_meta)
+        source_path: Chemin du fichier CSV source
+
+    Returns:
+        True si le snapshot peut être utilisé à la place du CSV
+    """
+    if meta is None or meta.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+        return False
+    return is_source_unchanged(meta.get("source", {}), source_path)
+
+
+def is_source_unchanged(stored: Dict[str, Any], source_path: Path) -> bool:
+    """
+    Compare la clé enregistrée d'un fichier source à son état actuel.
+
+    Args:
+        stored: Clé enregistrée (voir compute_file_fingerprint)
+        source_path: Chemin du fichier CSV source
+
+    Returns:
+        True si le fichier n'a pas changé depuis l'enregistrement de la clé
+    """
+    current = compute_file_fingerprint(source_path, with_hash=False)
+    for key in ("path", "size", "mtime_ns"):
+        if stored.get(key) != current[key]:
+            return False
+
+    if SNAPSHOT_VERIFY_HASH:
+        return stored.get("sha256") == compute_file_hash(source_path)
+    return True
+
+
+def load_snapshot(source_path: Path) -> Optional[pd.DataFrame]:
+    """
+    Charge le snapshot d'un fichier source s'il est à jour.
+
+    Args:
+        source_path: Chemin du fichier CSV source
+
+    Returns:
+        DataFrame reconstruit, ou None si le snapshot est absent ou périmé
+    """
+    meta = read_snapshot_meta(source_path)
+    if not is_snapshot_valid(meta, source_path):
+        return None
+    assert meta is not None
+
+    columns: Dict[str, Any] = {}
+    with np.load(get_snapshot_path(source_path), allow_pickle=False) as archive:
+        for position, column in enumerate(meta["columns"]):
+            if column["kind"] == "values":
+                columns[column["name"]] = archive[f"{position}:values"]
+                continue
+            values = pd.Categorical.from_codes(
+                archive[f"{position}:codes"],
+                categories=archive[f"{position}:categories"].astype(object)
+            )
+            columns[column["name"]] = pd.Series(values, name=column["name"]).astype(column["dtype"])
+
+    return pd.DataFrame(columns)
+
+
+def read_csv_with_snapshot(source_path: Path) -> pd.DataFrame:
+    """
+    Lit un CSV en passant par son snapshot binaire.
+
+    Si le snapshot est à jour il est chargé directement ; sinon le CSV est
+    parsé puis le snapshot est (re)construit pour les démarrages suivants.
+
+    Args:
+        source_path: Chemin du fichier CSV source
+
+    Returns:
+        DataFrame identique à pd.read_csv(source_path)
+    """
+    data = load_snapshot(source_path)
+    if data is not None:
+        return data
+
+    fingerprint = compute_file_fingerprint(source_path)
+    data = pd.read_csv(source_path)
+    try:
+        write_snapshot(source_path, data, fingerprint)
+    except OSError as error:
+        print(f"\n⚠️  Snapshot non écrit: {error}")
+
+    return data
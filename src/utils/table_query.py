@@ -0,0 +1,175 @@
+"""
+Requêtes du tableau de données côté serveur (pagination, tri, filtre).
+
+Le DataTable fonctionne en mode 'custom' : le navigateur n'envoie que la
+page demandée, le tri (sort_by) et le filtre saisi (filter_query, syntaxe
+Dash : `{COLONNE} opérateur valeur && ...`). Le serveur calcule une fois la
+liste ordonnée des positions correspondantes, puis chaque page n'est qu'une
+tranche de cette liste.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# Opérateurs symboliques du filtre Dash → opérateurs nommés
+_SYMBOL_OPERATORS: Dict[str, str] = {
+    '=': 'eq', '!=': 'ne', '<': 'lt', '<=': 'le', '>': 'gt', '>=': 'ge',
+}
+_NAMED_OPERATORS = ('eq', 'ne', 'lt', 'le', 'gt', 'ge', 'contains', 'datestartswith')
+
+_TERM_PATTERN = re.compile(
+    r"""\{(?P<column>[^}]+)\}\s*
+        (?P<operator>[si]?(?:!=|<=|>=|=|<|>)|[si]?(?:eq|ne|lt|le|gt|ge|contains|datestartswith)\b)\s*
+        (?P<value>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|`(?:[^`\\]|\\.)*`|\S+)?""",
+    re.VERBOSE
+)
+
+
+def parse_filter_query(filter_query: Optional[str]) -> List[Tuple[str, str, bool, Optional[str]]]:
+    """
+    Découpe une requête de filtre DataTable en termes.
+
+    Les termes mal formés sont ignorés, comme le fait le DataTable côté client.
+
+    Args:
+        filter_query: Requête du DataTable (ex: "{YEAR} >= 2020 && {NAME} icontains fr")
+
+    Returns:
+        Liste de (colonne, opérateur nommé, sensible à la casse, valeur brute)
+    """
+    terms = []
+    if not filter_query:
+        return terms
+    for part in filter_query.split(' && '):
+        match = _TERM_PATTERN.match(part.strip())
+        if match is None:
+            continue
+        operator = match.group('operator')
+        case_sensitive = not operator.startswith('i')
+        if operator[0] in 'si' and operator[1:] in _NAMED_OPERATORS + tuple(_SYMBOL_OPERATORS):
+            operator = operator[1:]
+        operator = _SYMBOL_OPERATORS.get(operator, operator)
+
+        value = match.group('value')
+        if value is not None and len(value) >= 2 and value[0] == value[-1] and value[0] in '"\'`':
+            value = re.sub(r'\\(.)', r'\1', value[1:-1])
+        terms.append((match.group('column'), operator, case_sensitive, value))
+    return terms
+
+
+def _string_predicate(values: pd.Series, operator: str, case_sensitive: bool, value: str) -> np.ndarray:
+    """Évalue un terme sur des valeurs textuelles."""
+    text = values.astype(str)
+    if not case_sensitive:
+        text = text.str.lower()
+        value = value.lower()
+    if operator == 'contains':
+        return text.str.contains(value, regex=False).to_numpy(dtype=bool)
+    if operator == 'datestartswith':
+        return text.str.startswith(value).to_numpy(dtype=bool)
+    comparisons = {
+        'eq': text.__eq__, 'ne': text.__ne__, 'lt': text.__lt__,
+        'le': text.__le__, 'gt': text.__gt__, 'ge': text.__ge__,
+    }
+    return comparisons[operator](value).to_numpy(dtype=bool)
+
+
+def _term_mask(series: pd.Series, operator: str, case_sensitive: bool, value: Optional[str]) -> Optional[np.ndarray]:
+    """Masque booléen d'un terme, ou None si le terme n'est pas applicable."""
+    if value is None:
+        return None
+
+    if pd.api.types.is_numeric_dtype(series) and operator not in ('contains', 'datestartswith'):
+        number = pd.to_numeric(value, errors='coerce')
+        if pd.isna(number):
+            return None
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        comparisons = {
+            'eq': np.equal, 'ne': np.not_equal, 'lt': np.less,
+            'le': np.less_equal, 'gt': np.greater, 'ge': np.greater_equal,
+        }
+        return comparisons[operator](values, float(number))
+
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Évaluation sur les catégories puis propagation par les codes
+        categories = pd.Series(series.cat.categories.astype(str))
+        category_mask = _string_predicate(categories, operator, case_sensitive, value)
+        codes = series.cat.codes.to_numpy()
+        return np.where(codes >= 0, category_mask[codes], False)
+
+    mask = _string_predicate(series, operator, case_sensitive, value)
+    return mask & series.notna().to_numpy()
+
+
+def select_table_rows(
+    data: pd.DataFrame,
+    filter_query: Optional[str] = None,
+    sort_by: Optional[List[Dict[str, str]]] = None
+) -> np.ndarray:
+    """
+    Calcule les positions des lignes à afficher, dans l'ordre d'affichage.
+
+    Args:
+        data: DataFrame affiché (déjà restreint par les filtres globaux)
+        filter_query: Requête de filtre du DataTable
+        sort_by: Tri du DataTable ([{'column_id': ..., 'direction': 'asc'|'desc'}])
+
+    Returns:
+        Positions (iloc) des lignes retenues, triées
+    """
+    mask = np.ones(len(data), dtype=bool)
+    for column, operator, case_sensitive, value in parse_filter_query(filter_query):
+        if column not in data.columns:
+            continue
+        term = _term_mask(data[column], operator, case_sensitive, value)
+        if term is not None:
+            mask &= term
+    positions = np.flatnonzero(mask)
+
+    sort_by = [sort for sort in (sort_by or []) if sort.get('column_id') in data.columns]
+    if sort_by and len(positions):
+        columns = [sort['column_id'] for sort in sort_by]
+        keys = data[columns].iloc[positions].reset_index(drop=True)
+        order = keys.sort_values(
+            columns,
+            ascending=[sort.get('direction', 'asc') == 'asc' for sort in sort_by],
+            kind='stable',
+            na_position='last'
+        ).index.to_numpy()
+        positions = positions[order]
+    return positions
+
+
+def get_table_page(
+    data: pd.DataFrame,
+    positions: np.ndarray,
+    page_current: int,
+    page_size: int
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Extrait une page du tableau et ses infobulles.
+
+    Args:
+        data: DataFrame affiché
+        positions: Positions ordonnées (select_table_rows)
+        page_current: Numéro de page (à partir de 0)
+        page_size: Nombre de lignes par page
+
+    Returns:
+        Tuple (lignes de la page, infobulles de ces lignes uniquement)
+    """
+    start = max(page_current or 0, 0) * page_size
+    page = data.iloc[positions[start:start + page_size]]
+    # Valeurs manquantes → null JSON
+    records = page.astype(object).where(page.notna(), None).to_dict('records')
+    tooltips = [
+        {
+            column: {'value': str(value), 'type': 'markdown'}
+            for column, value in row.items()
+        } for row in records
+    ]
+    return records, tooltips
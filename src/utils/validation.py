@@ -0,0 +1,373 @@
+"""
+Validation des données nettoyées et rapport de qualité, en une seule passe.
+
+Un ValidationAccumulator reçoit le jeu de données en un ou plusieurs blocs ;
+sur chaque bloc, toutes les vérifications et mesures sont calculées
+ensemble, à partir d'un seul masque des valeurs manquantes :
+- colonnes requises présentes ;
+- valeurs manquantes par colonne ;
+- couverture dans 0-100 % et années dans 1980-2025 ;
+- nombre de pays, d'années et d'antigènes distincts ;
+- moyenne et écart-type de la couverture (Welford, blocs combinés par la
+  formule de Chan) et médiane (effectifs par valeur distincte).
+
+La mémoire ne dépend que du nombre de valeurs distinctes, pas du nombre de
+lignes : un fichier plus gros que la mémoire est validé bloc par bloc
+(validate_file).
+
+Le rapport est un dictionnaire sérialisable en JSON : pour chaque
+vérification, le nombre de lignes en défaut et leurs positions (0 = première
+ligne de données, au plus VALIDATION_MAX_ROW_IDS). Le rapport d'un fichier
+est mis en cache à côté de lui (ex: cleaneddata.csv.validation.json), indexé
+par son empreinte : tant que le fichier ne change pas, il est relu tel quel.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from config import CLEAN_CHUNK_SIZE, VALIDATION_MAX_ROW_IDS, VALIDATION_REPORT_SUFFIX
+from src.utils.snapshot import compute_file_fingerprint, is_source_unchanged
+
+
+VALIDATION_FORMAT_VERSION: int = 1
+
+# Colonnes requises et plages attendues après nettoyage (voir clean_data.py)
+REQUIRED_COLUMNS: List[str] = ['GROUP', 'CODE', 'NAME', 'YEAR', 'ANTIGEN', 'COVERAGE']
+RANGE_CHECKS: Dict[str, tuple] = {
+    'COVERAGE': (0, 100),
+    'YEAR': (1980, 2025),
+}
+
+# Indicateurs du rapport de qualité → colonne dont on compte les valeurs distinctes
+DISTINCT_COLUMNS: Dict[str, str] = {
+    'countries': 'NAME',
+    'years': 'YEAR',
+    'antigens': 'ANTIGEN',
+}
+
+
+def _validation_rules() -> Dict[str, Any]:
+    """Règles de validation (un rapport en cache n'est valable que pour elles)."""
+    return {
+        'required_columns': REQUIRED_COLUMNS,
+        'ranges': {column: list(bounds) for column, bounds in RANGE_CHECKS.items()},
+    }
+
+
+class ValidationAccumulator:
+    """
+    Vérifications et mesures de qualité cumulées bloc par bloc.
+
+    Attributes:
+        columns: Colonnes du jeu de données (celles du premier bloc)
+        rows: Nombre de lignes reçues
+        max_row_ids: Positions de lignes gardées au plus par vérification
+    """
+
+    def __init__(self, columns: Sequence[str], max_row_ids: int = VALIDATION_MAX_ROW_IDS) -> None:
+        self.columns = list(columns)
+        self.rows = 0
+        self.max_row_ids = max_row_ids
+        self._missing = np.zeros(len(self.columns), dtype=np.int64)
+        self._checks: List[Dict[str, Any]] = []
+        for column in REQUIRED_COLUMNS:
+            self._checks.append(self._new_check('colonne_requise', column, count=0 if column in self.columns else None))
+        for column in REQUIRED_COLUMNS:
+            if column in self.columns:
+                self._checks.append(self._new_check('valeurs_manquantes', column))
+        for column, (low, high) in RANGE_CHECKS.items():
+            if column in self.columns:
+                self._checks.append({**self._new_check('plage', column), 'min': low, 'max': high})
+        self._distinct = {key: set() for key, column in DISTINCT_COLUMNS.items() if column in self.columns}
+        # Couverture : effectif, moyenne et somme des carrés des écarts (Welford)
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._values = np.empty(0, dtype=np.float64)
+        self._value_counts = np.empty(0, dtype=np.int64)
+
+    @staticmethod
+    def _new_check(check: str, column: str, count: Optional[int] = 0) -> Dict[str, Any]:
+        return {'check': check, 'column': column, 'count': count, 'row_ids': []}
+
+    def _flag(self, check: Dict[str, Any], mask: np.ndarray) -> None:
+        """Cumule les lignes en défaut d'un bloc pour une vérification."""
+        count = int(np.count_nonzero(mask))
+        if not count:
+            return
+        check['count'] += count
+        room = self.max_row_ids - len(check['row_ids'])
+        if room > 0:
+            check['row_ids'].extend((np.flatnonzero(mask)[:room] + self.rows).tolist())
+
+    def _add_coverage(self, values: np.ndarray) -> None:
+        """Ajoute les couvertures d'un bloc aux statistiques cumulées."""
+        count = len(values)
+        if not count:
+            return
+        mean = float(values.mean())
+        m2 = float(np.square(values - mean).sum())
+        total = self._count + count
+        delta = mean - self._mean
+        self._mean += delta * count / total
+        self._m2 += m2 + delta * delta * self._count * count / total
+        self._count = total
+
+        uniques, counts = np.unique(values, return_counts=True)
+        merged, inverse = np.unique(np.concatenate([self._values, uniques]), return_inverse=True)
+        self._value_counts = np.bincount(
+            inverse, weights=np.concatenate([self._value_counts, counts]), minlength=len(merged)
+        ).astype(np.int64)
+        self._values = merged
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """
+        Valide un bloc de lignes (les blocs sont reçus dans l'ordre du fichier).
+
+        Args:
+            chunk: Bloc de lignes, avec les colonnes du premier bloc
+        """
+        missing = chunk[self.columns].isna().to_numpy()
+        self._missing += missing.sum(axis=0)
+        present = {column: ~missing[:, position] for position, column in enumerate(self.columns)}
+        numeric = {
+            column: pd.to_numeric(chunk[column], errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+            for column in RANGE_CHECKS
+            if column in present
+        }
+
+        for check in self._checks:
+            column = check['column']
+            if check['check'] == 'valeurs_manquantes':
+                self._flag(check, ~present[column])
+            elif check['check'] == 'plage':
+                # Une valeur non numérique est hors plage ; une valeur manquante ne l'est pas
+                with np.errstate(invalid='ignore'):
+                    inside = (numeric[column] >= check['min']) & (numeric[column] <= check['max'])
+                self._flag(check, present[column] & ~inside)
+
+        for key, values in self._distinct.items():
+            column = DISTINCT_COLUMNS[key]
+            if column in numeric:
+                column_values = numeric[column][~np.isnan(numeric[column])]
+            else:
+                column_values = chunk[column].to_numpy()[present[column]]
+            values.update(pd.unique(column_values).tolist())
+
+        if 'COVERAGE' in numeric:
+            coverage = numeric['COVERAGE']
+            self._add_coverage(coverage[~np.isnan(coverage)])
+
+        self.rows += len(chunk)
+
+    def _median(self) -> float:
+        """Médiane de la couverture, à partir des effectifs par valeur."""
+        if not self._count:
+            return float('nan')
+        cumulative = np.cumsum(self._value_counts)
+        upper = self._values[np.searchsorted(cumulative, self._count // 2, side='right')]
+        if self._count % 2:
+            return float(upper)
+        lower = self._values[np.searchsorted(cumulative, self._count // 2 - 1, side='right')]
+        return float((lower + upper) / 2)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Construit le rapport de validation et de qualité.
+
+        Returns:
+            Dictionnaire {format_version, rules, valid, rows, missing_columns,
+            checks, quality} ; chaque vérification est {check, column, count,
+            row_ids, truncated, passed} (count vaut None pour une colonne
+            requise absente)
+        """
+        checks = []
+        for check in self._checks:
+            passed = check['count'] == 0
+            checks.append({
+                **check,
+                'row_ids': list(check['row_ids']),
+                'truncated': bool(check['count'] and check['count'] > len(check['row_ids'])),
+                'passed': passed,
+            })
+
+        has_coverage = 'COVERAGE' in self.columns
+        missing_values = {column: int(count) for column, count in zip(self.columns, self._missing)}
+        quality = {
+            'total_records': self.rows,
+            **{key: len(self._distinct[key]) if key in self._distinct else 0 for key in DISTINCT_COLUMNS},
+            'coverage_mean': (self._mean if self._count else float('nan')) if has_coverage else 0,
+            'coverage_median': self._median() if has_coverage else 0,
+            'coverage_std': (
+                float(np.sqrt(self._m2 / (self._count - 1))) if self._count > 1 else float('nan')
+            ) if has_coverage else 0,
+            'missing_values': missing_values,
+            'data_completeness': {
+                column: (1 - count / self.rows) * 100 if self.rows else float('nan')
+                for column, count in missing_values.items()
+            },
+        }
+
+        return {
+            'format_version': VALIDATION_FORMAT_VERSION,
+            'rules': _validation_rules(),
+            'valid': all(check['passed'] for check in checks),
+            'rows': self.rows,
+            'missing_columns': [column for column in REQUIRED_COLUMNS if column not in self.columns],
+            'checks': checks,
+            'quality': quality,
+        }
+
+
+def validate_frame(data: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Valide un DataFrame nettoyé en une passe.
+
+    Args:
+        data: Données nettoyées
+
+    Returns:
+        Rapport de validation (voir ValidationAccumulator.report)
+    """
+    accumulator = ValidationAccumulator(data.columns)
+    accumulator.update(data)
+    return accumulator.report()
+
+
+def get_validation_report_path(path: Path) -> Path:
+    """Retourne le chemin du rapport de validation en cache d'un fichier nettoyé."""
+    return path.with_name(path.name + VALIDATION_REPORT_SUFFIX)
+
+
+def read_cached_report(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Lit le rapport de validation en cache d'un fichier, s'il est à jour.
+
+    Args:
+        path: Fichier nettoyé
+
+    Returns:
+        Rapport, ou None s'il est absent, illisible ou périmé (fichier ou
+        règles modifiés)
+    """
+    try:
+        with open(get_validation_report_path(path), 'r', encoding='utf-8') as handle:
+            cached = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    report = cached.get('report', {})
+    if report.get('format_version') != VALIDATION_FORMAT_VERSION or report.get('rules') != _validation_rules():
+        return None
+    if not is_source_unchanged(cached.get('source', {}), path):
+        return None
+    return report
+
+
+def write_cached_report(path: Path, report: Dict[str, Any], fingerprint: Dict[str, Any]) -> Path:
+    """
+    Écrit le rapport de validation d'un fichier à côté de lui (écriture atomique).
+
+    Args:
+        path: Fichier nettoyé
+        report: Rapport de validation
+        fingerprint: Clé du fichier validé (voir compute_file_fingerprint)
+
+    Returns:
+        Chemin du rapport écrit
+    """
+    report_path = get_validation_report_path(path)
+    fd, tmp_name = tempfile.mkstemp(prefix=report_path.name + ".", suffix=".tmp", dir=report_path.parent)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as handle:
+            json.dump({'source': fingerprint, 'report': report}, handle, ensure_ascii=False)
+        os.replace(tmp_name, report_path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    return report_path
+
+
+def validate_file(
+    path: Path,
+    chunk_size: int = CLEAN_CHUNK_SIZE,
+    data: Optional[pd.DataFrame] = None,
+    use_cache: bool = True
+) -> Dict[str, Any]:
+    """
+    Valide un fichier nettoyé, bloc par bloc, en passant par le rapport en cache.
+
+    Args:
+        path: Fichier nettoyé
+        chunk_size: Lignes lues par bloc
+        data: Contenu du fichier déjà en mémoire (validé sans relire le fichier)
+        use_cache: Relit le rapport en cache s'il est à jour, et l'écrit sinon
+
+    Returns:
+        Rapport de validation (voir ValidationAccumulator.report)
+    """
+    path = Path(path)
+    if use_cache:
+        cached = read_cached_report(path)
+        if cached is not None:
+            return cached
+
+    # Empreinte prise avant la lecture : un fichier modifié pendant la
+    # validation invalide le rapport au passage suivant
+    fingerprint = compute_file_fingerprint(path)
+    if data is not None:
+        report = validate_frame(data)
+    else:
+        accumulator: Optional[ValidationAccumulator] = None
+        for chunk in pd.read_csv(path, chunksize=chunk_size):
+            if accumulator is None:
+                accumulator = ValidationAccumulator(chunk.columns)
+            accumulator.update(chunk)
+        if accumulator is None:
+            accumulator = ValidationAccumulator(pd.read_csv(path, nrows=0).columns)
+        report = accumulator.report()
+
+    if use_cache:
+        try:
+            write_cached_report(path, report, fingerprint)
+        except OSError as error:
+            print(f"\n⚠️  Rapport de validation non écrit: {error}")
+    return report
+
+
+def format_issues(report: Dict[str, Any], max_row_ids: int = 5) -> List[str]:
+    """
+    Met en forme les vérifications échouées d'un rapport.
+
+    Args:
+        report: Rapport de validation
+        max_row_ids: Positions de lignes citées au plus par vérification
+
+    Returns:
+        Une ligne par vérification échouée
+    """
+    issues = []
+    for check in report['checks']:
+        if check['passed']:
+            continue
+        if check['check'] == 'colonne_requise':
+            issues.append(f"❌ Colonne manquante: {check['column']}")
+            continue
+        if check['check'] == 'valeurs_manquantes':
+            issue = f"⚠️  {check['count']} valeurs manquantes dans {check['column']}"
+        elif check['column'] == 'COVERAGE':
+            issue = f"❌ Couverture hors plage ({check['min']}-{check['max']}%) : {check['count']} lignes"
+        elif check['column'] == 'YEAR':
+            issue = f"❌ Années invalides : {check['count']} lignes"
+        else:
+            issue = f"❌ {check['column']} hors plage ({check['min']}-{check['max']}) : {check['count']} lignes"
+        rows = ", ".join(str(row) for row in check['row_ids'][:max_row_ids])
+        more = "..." if check['count'] > max_row_ids else ""
+        issues.append(f"{issue} (lignes {rows}{more})")
+    return issues
@@ -0,0 +1,202 @@
+"""
+Préchauffage du cache de figures.
+
+Énumère les combinaisons de filtres proposées par la sidebar (chaque filtre
+vaut une valeur disponible ou 'all') et construit à l'avance toutes les
+figures de la page d'accueil dans le cache de figures partagé, sur un pool
+de processus. Les combinaisons sont lues dans les rollups du cube : seules
+les combinaisons non vides sont énumérées, les plus générales (le plus de
+filtres à 'all') et les plus volumineuses d'abord.
+
+Au démarrage du serveur, les combinaisons les plus demandées (compteurs de
+query_stats) sont aussi préchauffées en tâche de fond.
+"""
+
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
+
+import pandas as pd
+
+from config import CLIENTSIDE_GRAPH_SWITCH
+from src.utils.cache import make_filter_key
+from src.utils.cube import build_coverage_cube
+from src.utils.query_stats import QueryCounter
+
+# Ordre des filtres dans la clé normalisée (voir make_filter_key)
+_FILTER_COLUMNS: List[str] = ['YEAR', 'NAME', 'ANTIGEN', 'COVERAGE_CATEGORY']
+
+# Objet HomeFigures propre à chaque processus du pool
+_worker_figures = None
+
+
+def enumerate_filter_states(data: pd.DataFrame, budget: Optional[int] = None) -> List[tuple]:
+    """
+    Énumère les combinaisons de filtres non vides, par priorité décroissante.
+
+    Args:
+        data: DataFrame complet
+        budget: Nombre maximal de combinaisons retournées (None = toutes)
+
+    Returns:
+        Liste de clés normalisées (year, country, antigen, coverage_category)
+    """
+    cube = build_coverage_cube(data, dimensions=_FILTER_COLUMNS)
+    ranked = []
+    for subset, table in cube.rollups.items():
+        active = [column for column in _FILTER_COLUMNS if column in subset]
+        if not active:
+            ranked.append((0, -int(table['size'].sum()), (None, None, None, None)))
+            continue
+        sizes = table['size'].to_numpy()
+        frame = table.index.to_frame(index=False)
+        for position, row in enumerate(frame.itertuples(index=False)):
+            if sizes[position] == 0 or any(pd.isna(value) for value in row):
+                continue
+            values = dict(zip(active, row))
+            state = make_filter_key(
+                year=values.get('YEAR'),
+                country=values.get('NAME'),
+                antigen=values.get('ANTIGEN'),
+                coverage_category=values.get('COVERAGE_CATEGORY')
+            )
+            ranked.append((len(active), -int(sizes[position]), state))
+
+    ranked.sort(key=lambda item: (item[0], item[1]))
+    states = [state for _, _, state in ranked]
+    return states if budget is None else states[:budget]
+
+
+def _init_worker(compact: bool) -> None:
+    """Charge les données et prépare les figures dans un processus du pool."""
+    global _worker_figures
+    # Import local : src.pages.home importe ce module (import circulaire)
+    from src.pages.home import HomeFigures, create_figure_cache
+    from src.utils.get_data import get_vaccination_data
+
+    data = get_vaccination_data(use_cleaned=True, compact=compact)
+    _worker_figures = HomeFigures(data, figure_cache=create_figure_cache())
+
+
+def warm_figures(figures: Any, states: List[tuple], pause: Callable[[], None] = lambda: None) -> int:
+    """
+    Construit (ou relit) toutes les figures servies pour ces combinaisons de filtres.
+
+    Args:
+        figures: Objet HomeFigures
+        states: Clés normalisées des filtres
+        pause: Appelée entre deux figures (ex: DataRegistry.pause, pendant
+            que le serveur répond)
+
+    Returns:
+        Nombre de figures prêtes dans le cache
+    """
+    from src.pages.home import EXPLORATION_1_TYPES, EXPLORATION_2_TYPES
+
+    if CLIENTSIDE_GRAPH_SWITCH:
+        targets = [(name, None) for name in figures.FIGURES]
+    else:
+        targets = [('country_details', None), ('timed_count', None)]
+        targets += [('exploration_1', graph_type) for graph_type in EXPLORATION_1_TYPES]
+        targets += [('exploration_2', graph_type) for graph_type in EXPLORATION_2_TYPES]
+
+    for state in states:
+        for name, graph_type in targets:
+            figures.get(name, state, graph_type)
+            pause()
+    return len(states) * len(targets)
+
+
+def prewarm_in_background(figures: Any, counter: QueryCounter, top_k: int) -> threading.Thread:
+    """
+    Préchauffe en tâche de fond les k combinaisons de filtres les plus demandées.
+
+    Appelé après un chargement des données : les combinaisons chaudes sont
+    recalculées pour la nouvelle version du jeu de données avant que le
+    trafic ne les redemande.
+
+    Args:
+        figures: Objet HomeFigures du jeu de données courant
+        counter: Compteurs de fréquence des filtres
+        top_k: Nombre de combinaisons à préchauffer
+
+    Returns:
+        Thread démarré (daemon)
+    """
+    def run() -> None:
+        start = time.perf_counter()
+        states = [state for state, _ in counter.top(top_k)]
+        if not states:
+            return
+        try:
+            n_figures = warm_figures(figures, states)
+        except Exception as error:
+            print(f"⚠️  Préchauffage interrompu: {error}")
+            return
+        print(f"🔥 {n_figures} figures préchauffées ({len(states)} combinaisons) en {time.perf_counter() - start:.1f} s")
+
+    thread = threading.Thread(target=run, name='figure-prewarm', daemon=True)
+    thread.start()
+    return thread
+
+
+def _warm_states(states: List[tuple]) -> int:
+    """Préchauffe quelques combinaisons de filtres dans un processus du pool."""
+    return warm_figures(_worker_figures, states)
+
+
+def run_warmup(
+    data: pd.DataFrame,
+    workers: int,
+    budget: Optional[int] = None,
+    compact: bool = False,
+    chunk_size: int = 8
+) -> Dict[str, Any]:
+    """
+    Préchauffe le cache de figures pour les combinaisons de filtres prioritaires.
+
+    Args:
+        data: DataFrame complet (sert à énumérer les combinaisons)
+        workers: Nombre de processus
+        budget: Nombre maximal de combinaisons (None = toutes)
+        compact: Chargement compact dans les workers (doit correspondre au serveur)
+        chunk_size: Combinaisons traitées par tâche
+
+    Returns:
+        Rapport {states, figures, seconds, figures_per_second, cache, cache_path}
+    """
+    from src.pages.home import create_figure_cache
+
+    cache = create_figure_cache()
+    if cache is None:
+        raise RuntimeError("Le cache de figures est désactivé (FIGURE_CACHE_ENABLED)")
+
+    states = enumerate_filter_states(data, budget=budget)
+    chunks = [states[i:i + chunk_size] for i in range(0, len(states), chunk_size)]
+    print(f"🔥 Préchauffage de {len(states)} combinaisons de filtres sur {workers} processus...")
+
+    start = time.perf_counter()
+    last_report = start
+    n_figures = 0
+    done = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(compact,)) as executor:
+        futures = {executor.submit(_warm_states, chunk): len(chunk) for chunk in chunks}
+        for future in as_completed(futures):
+            n_figures += future.result()
+            done += futures[future]
+            now = time.perf_counter()
+            # Une ligne de progression par seconde au plus
+            if now - last_report >= 1 or done == len(states):
+                last_report = now
+                print(f"  [{done}/{len(states)}] {n_figures} figures, {n_figures / (now - start):.1f} figures/s", flush=True)
+
+    seconds = time.perf_counter() - start
+    return {
+        'states': len(states),
+        'figures': n_figures,
+        'seconds': seconds,
+        'figures_per_second': n_figures / seconds if seconds else 0.0,
+        'cache': cache.stats()['disk'],
+        'cache_path': str(cache.path),
+    }